@@ -0,0 +1,301 @@
+"""Throughput benchmarks for the aiocsv_utils read, write and convert hot paths.
+
+Synthetic CSV files are generated locally for every shape and size, then
+each case runs in a fresh process so its peak RSS is measured in isolation.
+Every case reports rows/sec, MB/sec, peak RSS and how long the event loop
+was blocked (longest stall and total stall time above the probe interval).
+
+Usage
+-----
+    python benchmarks/bench.py --rows 10000 100000 --output results.json
+    python benchmarks/bench.py --baseline results.json --fail-on-regression
+
+Cases can be selected with --cases and shapes with --shapes, see --help.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import csv
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import string
+import sys
+import tempfile
+import time
+
+from aiocsv_utils import convert, parallel, read, scan, write
+
+SHAPES = {
+    'narrow_numeric': 'Five int and float columns.',
+    'wide_string': 'Fifty short string columns.',
+    'quoted_multiline': 'Quoted text fields with embedded quotes, commas and newlines.'
+}
+
+PROBE_INTERVAL = 0.001
+"""Seconds between event-loop lag probes."""
+
+
+def generate_csv(path: str, shape: str, rows: int, seed=0) -> list[str]:
+    """Write a synthetic CSV file and return its headers."""
+    rng = random.Random(seed)
+    if shape == 'narrow_numeric':
+        headers = ['id', 'count', 'price', 'ratio', 'flag']
+
+        def make_row(i):
+            return [i, rng.randint(-1000, 1000), round(rng.uniform(0, 1000), 2), rng.random(), rng.choice(('True', 'False'))]
+    elif shape == 'wide_string':
+        headers = [f'col{i}' for i in range(50)]
+
+        def make_row(i):
+            return [''.join(rng.choices(string.ascii_letters, k=8)) for _ in headers]
+    elif shape == 'quoted_multiline':
+        headers = ['id', 'title', 'body']
+
+        def make_row(i):
+            words = [''.join(rng.choices(string.ascii_lowercase, k=5)) for _ in range(12)]
+            return [i, ' '.join(words[:3]), 'He said, "' + ' '.join(words[3:7]) + '"\n' + ' '.join(words[7:])]
+    else:
+        raise ValueError(f'Unknown shape: {shape!r}')
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(make_row(i) for i in range(rows))
+    return headers
+
+
+class Stopwatch:
+    """Times a benchmark case and how long it blocks the event loop.
+
+    Cases call start() once their setup is done, so only the measured work
+    is timed. The event loop is probed every interval seconds and any lag
+    past the interval counts as blocking time.
+    """
+
+    def __init__(self, interval=PROBE_INTERVAL) -> None:
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.max_block = 0.0
+        self.total_block = 0.0
+        self._task = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self.max_block = 0.0
+        self.total_block = 0.0
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - start - self.interval
+            if lag > 0:
+                self.max_block = max(self.max_block, lag)
+                self.total_block += lag
+
+    def __enter__(self) -> 'Stopwatch':
+        self._task = asyncio.ensure_future(self._probe())
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self.started
+        self._task.cancel()
+
+
+async def _drain(generator) -> int:
+    count = 0
+    async for item in generator:
+        count += len(item) if isinstance(item, list) else 1
+    return count
+
+
+async def _drain_columns(generator) -> int:
+    count = 0
+    async for chunk in generator:
+        count += len(next(iter(chunk.values()), ()))
+    return count
+
+
+def _read_records(path, headers, watch):
+    return _drain(read.csv_to_records(path))
+
+
+def _read_records_schema(path, headers, watch):
+    return _drain(read.csv_to_records(path, schema='infer'))
+
+
+def _read_chunks(path, headers, watch):
+    return _drain(read.csv_to_records_chunks(path, 1000))
+
+
+def _read_columns(path, headers, watch):
+    return _drain_columns(read.csv_to_column_chunks(path, 1000))
+
+
+def _read_parallel(path, headers, watch):
+    return _drain(parallel.csv_to_records_chunks_parallel(path, 1000))
+
+
+def _row_count(path, headers, watch):
+    return scan.csv_row_count(path)
+
+
+async def _records(path, headers, raw=False):
+    schema = {header: str for header in headers} if raw else None
+    return [row async for row in read.csv_to_records(path, schema=schema)]
+
+
+async def _write_rows(path, headers, watch):
+    records = await _records(path, headers)
+    target = path + '.out'
+    await write.create_csv(target, headers)
+    watch.start()
+    await write.write_csv_rows(target, records, headers)
+    return len(records)
+
+
+async def _write_chunks(path, headers, watch):
+    records = await _records(path, headers)
+    target = path + '.out'
+    await write.create_csv(target, headers)
+    chunks = [records[i:i + 1000] for i in range(0, len(records), 1000)]
+    watch.start()
+    await write.write_csv_chunks(target, chunks, headers)
+    return len(records)
+
+
+async def _write_appender(path, headers, watch):
+    records = await _records(path, headers)
+    watch.start()
+    async with write.CsvAppender(path + '.out', headers, mode='w') as appender:
+        for record in records:
+            await appender.write_row(record)
+    return len(records)
+
+
+async def _convert(path, headers, watch):
+    rows = await _records(path, headers, raw=True)
+    values = [value for row in rows for value in row.values()]
+    convert_str = convert.convert_str
+    watch.start()
+    for value in values:
+        convert_str(value)
+    return len(rows)
+
+
+CASES = {
+    'read.csv_to_records': _read_records,
+    'read.csv_to_records[schema]': _read_records_schema,
+    'read.csv_to_records_chunks': _read_chunks,
+    'read.csv_to_column_chunks': _read_columns,
+    'parallel.csv_to_records_chunks_parallel': _read_parallel,
+    'scan.csv_row_count': _row_count,
+    'write.write_csv_rows': _write_rows,
+    'write.write_csv_chunks': _write_chunks,
+    'write.CsvAppender': _write_appender,
+    'convert.convert_str': _convert
+}
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(case: str, path: str, headers: list[str]) -> dict:
+    """Run one benchmark case in the current process and return its metrics."""
+    async def main():
+        with Stopwatch() as watch:
+            processed = await CASES[case](path, headers, watch)
+        return processed, watch
+
+    processed, watch = asyncio.run(main())
+    size = os.path.getsize(path)
+    return {
+        'rows': processed,
+        'seconds': watch.elapsed,
+        'rows_per_sec': processed / watch.elapsed if watch.elapsed else None,
+        'mb_per_sec': size / watch.elapsed / 1e6 if watch.elapsed else None,
+        'peak_rss_mb': _peak_rss_bytes() / 1e6,
+        'loop_max_block_ms': watch.max_block * 1e3,
+        'loop_total_block_ms': watch.total_block * 1e3
+    }
+
+
+def run(shapes, sizes, cases, repeat=1, workdir=None) -> dict:
+    """Run every case against every shape and size, each in a fresh process."""
+    results = {}
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for shape in shapes:
+            for rows in sizes:
+                path = os.path.join(tmp, f'{shape}_{rows}.csv')
+                headers = generate_csv(path, shape, rows)
+                for case in cases:
+                    best = None
+                    for _ in range(repeat):
+                        with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+                            metrics = pool.submit(run_case, case, path, headers).result()
+                        if best is None or metrics['seconds'] < best['seconds']:
+                            best = metrics
+                    key = f'{case}|{shape}|{rows}'
+                    results[key] = dict(best, case=case, shape=shape, size=rows, bytes=os.path.getsize(path))
+                    print(f"{key:70} {best['rows_per_sec']:>12,.0f} rows/s {best['mb_per_sec']:>8.1f} MB/s "
+                          f"{best['peak_rss_mb']:>8.1f} MB rss {best['loop_max_block_ms']:>8.1f} ms block")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return the cases whose rows/sec dropped by more than threshold versus baseline."""
+    regressions = []
+    for key, metrics in results.items():
+        base = baseline.get('results', {}).get(key)
+        if not base or not base.get('rows_per_sec') or not metrics.get('rows_per_sec'):
+            continue
+        ratio = metrics['rows_per_sec'] / base['rows_per_sec']
+        print(f'{key:70} {ratio:6.2f}x baseline')
+        if ratio < 1 - threshold:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help='Row counts of the generated files.')
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES), default=list(SHAPES))
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per case, the fastest is kept.')
+    parser.add_argument('--output', default='bench_results.json', help='Where to save the results as JSON.')
+    parser.add_argument('--baseline', help='Results JSON from an earlier run to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Relative rows/sec drop that counts as a regression.')
+    parser.add_argument('--fail-on-regression', action='store_true')
+    parser.add_argument('--workdir', help='Directory for the generated CSV files.')
+    args = parser.parse_args(argv)
+
+    results = run(args.shapes, args.rows, args.cases, args.repeat, args.workdir)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print('Regressions: ' + ', '.join(regressions))
+            if args.fail_on_regression:
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
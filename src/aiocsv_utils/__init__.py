@@ -1,3 +1,3 @@
 __version__ = '0.0.1'
 
-from aiocsv_utils import read, write, convert
\ No newline at end of file
+from aiocsv_utils import read, write, convert, scan, parallel, index, compression, instrument, mapped, multi, cache, dialect, follow, sort, aggregate, join, export, rows, safe_write, partition, profiling
\ No newline at end of file
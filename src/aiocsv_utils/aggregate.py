@@ -0,0 +1,373 @@
+import asyncio as _asyncio
+import concurrent.futures as _futures
+import csv as _csv
+import functools as _functools
+import io as _io
+import typing as _typing
+
+from .compression import detect_compression as _detect_compression
+from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import Column as _Column
+from .convert import compile_schema as _compile_schema
+from .parallel import RANGE_SIZE
+from .parallel import mp_context as _mp_context
+from .parallel import read_range as _read_range
+from .read import csv_headers as _csv_headers
+from .read import csv_schema as _csv_schema
+from .read import csv_to_column_chunks as _csv_to_column_chunks
+from .read import column_chunk as _column_chunk
+from .read import column_index as _column_index
+from .scan import split_ranges as _split_ranges
+from .sort import value_key as _value_key
+from .write import create_csv as _create_csv
+from .write import write_csv_chunks as _write_csv_chunks
+
+try:
+    import numpy as _numpy
+except ImportError:  # pragma: no cover - optional dependency
+    _numpy = None
+
+AGGREGATES = ('count', 'sum', 'min', 'max', 'mean', 'nunique')
+"""Supported aggregate functions."""
+
+Aggs = dict[str, tuple[str, str]]
+"""Mapping of output column to (input column, function). Use '*' to count rows."""
+
+_Groups = dict[tuple, list[_typing.Any]]
+
+
+def _initial(function: str) -> _typing.Any:
+    if function in ('count', 'sum'):
+        return 0
+    if function == 'mean':
+        return (0, 0)
+    if function == 'nunique':
+        return set()
+    return None
+
+
+def _combine(function: str, state: _typing.Any, partial: _typing.Any) -> _typing.Any:
+    if function in ('count', 'sum'):
+        return state + partial
+    if function == 'mean':
+        return state[0] + partial[0], state[1] + partial[1]
+    if function == 'nunique':
+        state |= partial
+        return state
+    if partial is None:
+        return state
+    if state is None:
+        return partial
+    # Numbers order before text, as in sort_csv, so mixed columns still compare.
+    if function == 'min':
+        return min(state, partial, key=_value_key)
+    return max(state, partial, key=_value_key)
+
+
+def _finish(function: str, state: _typing.Any) -> _typing.Any:
+    if function == 'mean':
+        return state[0] / state[1] if state[1] else None
+    if function == 'nunique':
+        return len(state)
+    return state
+
+
+def _missing(value: _typing.Any) -> bool:
+    return value is None or value == ''
+
+
+def _may_overflow(values: _typing.Any) -> bool:
+    """Whether an integer sum of values could wrap around in their dtype."""
+    if not len(values):
+        return False
+    largest = max(-int(values.min()), int(values.max()))
+    return largest * len(values) > int(_numpy.iinfo(values.dtype).max)
+
+
+def _numpy_partials(function: str, values: _typing.Any, codes: _typing.Any, size: int) -> list[_typing.Any]:
+    """Per-group partial states of a numeric NumPy column."""
+    if function == 'count':
+        return _numpy.bincount(codes, minlength=size).tolist()
+    if function == 'nunique':
+        sets: list[set] = [set() for _ in range(size)]
+        for code, value in zip(codes.tolist(), values.tolist()):
+            sets[code].add(value)
+        return sets
+    if function in ('sum', 'mean'):
+        if values.dtype.kind == 'f':
+            sums = _numpy.bincount(codes, weights=values, minlength=size)
+        elif _may_overflow(values):
+            return _python_partials(function, values.tolist(), codes.tolist(), size)
+        else:
+            sums = _numpy.zeros(size, dtype=values.dtype)
+            _numpy.add.at(sums, codes, values)
+        if function == 'sum':
+            return sums.tolist()
+        return list(zip(sums.tolist(), _numpy.bincount(codes, minlength=size).tolist()))
+    limits = _numpy.finfo(values.dtype) if values.dtype.kind == 'f' else _numpy.iinfo(values.dtype)
+    if function == 'min':
+        out = _numpy.full(size, limits.max, dtype=values.dtype)
+        _numpy.minimum.at(out, codes, values)
+    else:
+        out = _numpy.full(size, limits.min, dtype=values.dtype)
+        _numpy.maximum.at(out, codes, values)
+    return out.tolist()
+
+
+def _python_partials(function: str, values: _typing.Iterable[_typing.Any], codes: list[int], size: int) -> list[_typing.Any]:
+    """Per-group partial states of any column, skipping missing values."""
+    partials = [_initial(function) for _ in range(size)]
+    for code, value in zip(codes, values):
+        if _missing(value):
+            continue
+        if function == 'count':
+            partials[code] += 1
+        elif function == 'sum':
+            partials[code] += value
+        elif function == 'mean':
+            total, count = partials[code]
+            partials[code] = (total + value, count + 1)
+        elif function == 'nunique':
+            partials[code].add(value)
+        else:
+            partials[code] = _combine(function, partials[code], value)
+    return partials
+
+
+def _accumulate(
+    groups: _Groups,
+    chunk: dict[str, _Column],
+    by: list[str],
+    plan: list[tuple[str | None, str]]
+) -> None:
+    """Fold a chunk of columns into the running per-group states."""
+    rows = len(next(iter(chunk.values()), ()))
+    if not rows:
+        return
+    index: dict[tuple, int] = {}
+    if by:
+        keys = zip(*(_as_list(chunk[column]) for column in by))
+        codes = [index.setdefault(key, len(index)) for key in keys]
+    else:
+        index[()] = 0
+        codes = [0] * rows
+    size = len(index)
+    numpy_codes = None
+    partials = []
+    for column, function in plan:
+        if column is None:
+            partials.append(_row_counts(codes, size))
+            continue
+        values = chunk[column]
+        if _numpy is not None and isinstance(values, _numpy.ndarray):
+            if numpy_codes is None:
+                numpy_codes = _numpy.asarray(codes, dtype=_numpy.intp)
+            partials.append(_numpy_partials(function, values, numpy_codes, size))
+        else:
+            try:
+                partials.append(_python_partials(function, values, codes, size))
+            except TypeError:
+                raise ValueError(f'Column {column!r} has values that are not numbers for {function}.') from None
+    for key, code in index.items():
+        states = groups.get(key)
+        if states is None:
+            states = groups[key] = [_initial(function) for _, function in plan]
+        for position, (_, function) in enumerate(plan):
+            states[position] = _combine(function, states[position], partials[position][code])
+
+
+def _row_counts(codes: list[int], size: int) -> list[int]:
+    counts = [0] * size
+    for code in codes:
+        counts[code] += 1
+    return counts
+
+
+def _as_list(values: _Column) -> list[_typing.Any]:
+    return values if isinstance(values, list) else values.tolist()
+
+
+def _merge_groups(groups: _Groups, partial: _Groups, plan: list[tuple[str | None, str]]) -> None:
+    for key, partial_states in partial.items():
+        states = groups.get(key)
+        if states is None:
+            groups[key] = partial_states
+            continue
+        for position, (_, function) in enumerate(plan):
+            states[position] = _combine(function, states[position], partial_states[position])
+
+
+def _aggregate_range(
+    path: str,
+    start: int,
+    stop: int,
+    headers: list[str],
+    schema: _Schema | None,
+    encoding: str,
+    delimiter: str,
+    by: list[str],
+    plan: list[tuple[str | None, str]],
+    chunk_size: int,
+    numpy: bool | None
+) -> _Groups:
+    rows = [row for row in _csv.reader(_io.StringIO(_read_range(path, start, stop, encoding), newline=''),
+                                       delimiter=delimiter) if row]
+    if schema is None:
+        converters = [_convert_str] * len(headers)
+    else:
+        converters = _compile_schema(headers, schema)
+    groups: _Groups = {}
+    for offset in range(0, len(rows), chunk_size):
+        _accumulate(groups, _column_chunk(headers, converters, rows[offset:offset + chunk_size], numpy), by, plan)
+    return groups
+
+
+def _compile_plan(headers: list[str], by: list[str], aggs: Aggs) -> list[tuple[str | None, str]]:
+    for column in by:
+        _column_index(headers, column)
+    plan = []
+    for name, (column, function) in aggs.items():
+        if function not in AGGREGATES:
+            raise ValueError(f'Unsupported aggregate for {name!r}: {function!r}')
+        if column == '*':
+            if function != 'count':
+                raise ValueError(f"Only count can be used with '*', not {function!r}")
+            plan.append((None, function))
+        else:
+            _column_index(headers, column)
+            plan.append((column, function))
+    return plan
+
+
+async def aggregate(
+    path: str,
+    by: str | _typing.Sequence[str] = (),
+    aggs: Aggs | None = None,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    chunk_size=10_000,
+    numpy: bool | None = None,
+    compression: str | None = 'infer',
+    output: str | None = None,
+    parallel=False,
+    max_workers: int | None = None,
+    range_size=RANGE_SIZE,
+    executor: _futures.Executor | None = None
+) -> list[dict[str, _typing.Any]] | int:
+    """Group a CSV by path on columns and aggregate other columns in one streaming pass.
+
+    Chunks of columns are folded into per-group states as they are read,
+    so memory grows with the number of groups (and distinct values for
+    nunique), not with the file. Numeric columns are accumulated with NumPy
+    bincount and ufunc.at when it is available. With parallel=True, each
+    byte range of an uncompressed file is aggregated in a worker process and
+    the partial states are merged here. Missing values ('' or None) are
+    skipped by every function except count of '*'. min and max order
+    numbers before text, like sort_csv, in columns holding both.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    by : str | Sequence[str], optional
+        Column or columns to group on. Empty aggregates the whole file into
+        one group.
+    aggs : dict[str, tuple[str, str]] | None, optional
+        Output column to (input column, function), function being one of
+        count, sum, min, max, mean or nunique. ('*', 'count') counts rows.
+        None counts rows into 'count'.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible with parallel=True.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see read.csv_to_column_chunks. None converts
+        every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    chunk_size : int, optional
+        Number of rows folded in at a time.
+    numpy : bool | None, optional
+        Accumulate numeric columns with NumPy. None uses NumPy when it is
+        installed.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension. Also used for output.
+    output : str | None, optional
+        Write the groups to this CSV file instead of returning them.
+    parallel : bool, optional
+        Aggregate byte ranges in worker processes. Ignored for compressed files.
+    max_workers : int | None, optional
+        Number of worker processes, defaults to the number of CPUs.
+    range_size : int, optional
+        Approximate number of bytes aggregated per worker task.
+    executor : Executor | None, optional
+        Executor to run the workers in, left running when done.
+
+    Returns
+    -------
+    list[dict[str, Any]] | int
+        One record per group, with the by columns then the aggs columns, in
+        order of first appearance. The number of groups written if output
+        is given.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ValueError
+        If a column is not in the CSV headers, a function is unsupported or
+        sum or mean meets a value that is not a number.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.aggregate import aggregate
+    >>>
+    >>> asyncio.run(aggregate('data/cities.csv', 'State',
+    >>>                       {'cities': ('*', 'count'), 'north': ('LatD', 'max')}))[:2]
+    [{'State': 'OH', 'cities': 6, 'north': 41}, {'State': 'SD', 'cities': 3, 'north': 44}]
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    aggs = aggs if aggs is not None else {'count': ('*', 'count')}
+    headers = await _csv_headers(path, encoding=encoding, delimiter=delimiter, compression=compression)
+    plan = _compile_plan(headers, by, aggs)
+    if schema == 'infer':
+        schema = await _csv_schema(path, encoding=encoding, delimiter=delimiter,
+                                   sample_size=sample_size, compression=compression)
+    groups: _Groups = {}
+    if parallel and _detect_compression(path, compression) is None:
+        loop = _asyncio.get_running_loop()
+        _, ranges = await loop.run_in_executor(None, _split_ranges, path, range_size)
+        pool = executor if executor is not None else _futures.ProcessPoolExecutor(max_workers, mp_context=_mp_context())
+        try:
+            partials = await _asyncio.gather(*(
+                loop.run_in_executor(pool, _aggregate_range, path, start, stop, headers, schema,
+                                     encoding, delimiter, by, plan, chunk_size, numpy)
+                for start, stop in ranges))
+        finally:
+            if executor is None:
+                await loop.run_in_executor(None, _functools.partial(pool.shutdown, wait=True, cancel_futures=True))
+        for partial in partials:
+            _merge_groups(groups, partial, plan)
+    else:
+        chunks = _csv_to_column_chunks(path, chunk_size, encoding=encoding, delimiter=delimiter,
+                                       schema=schema, numpy=numpy, compression=compression)
+        async for chunk in chunks:
+            _accumulate(groups, chunk, by, plan)
+    names = list(aggs)
+    records = [
+        {**dict(zip(by, key)), **{name: _finish(function, state)
+                                  for name, (_, function), state in zip(names, plan, states)}}
+        for key, states in groups.items()
+    ]
+    if output is None:
+        return records
+    fields = by + names
+    await _create_csv(output, fields, compression)
+    await _write_csv_chunks(output, [records], fields, compression)
+    return len(records)
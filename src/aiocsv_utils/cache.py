@@ -0,0 +1,171 @@
+import asyncio as _asyncio
+import collections as _collections
+import json as _json
+import os as _os
+import typing as _typing
+
+import aiofiles.os as _aiofiles_os
+
+from .convert import InferredSchema as _InferredSchema
+
+Identity = tuple[int, int, int]
+"""File size, modification time in nanoseconds and inode number."""
+
+_TYPES = {'int': int, 'float': float, 'bool': bool, 'str': str}
+
+
+def _dump_value(name: str, value: _typing.Any) -> _typing.Any:
+    if name.startswith('schema|'):
+        return {column: None if kind is None else kind.__name__ for column, kind in value.items()}
+    return value
+
+
+def _load_value(name: str, value: _typing.Any) -> _typing.Any:
+    if name.startswith('schema|'):
+        return _InferredSchema((column, None if kind is None else _TYPES[kind])
+                               for column, kind in value.items())
+    return value
+
+
+class MetadataCache:
+    """LRU cache of per-file CSV metadata such as headers, delimiter and schema.
+
+    Entries are keyed by path and only valid while the file's size,
+    modification time and inode are unchanged, so rewriting, appending to
+    or replacing a file invalidates them. Each lookup costs one stat call
+    in the thread pool instead of opening and parsing the file.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of files kept, the least recently used are evicted.
+    path : str | None, optional
+        JSON file backing the cache on disk. It is loaded on first use and
+        written by save. None keeps the cache in memory only.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.cache import MetadataCache
+    >>> from aiocsv_utils.read import csv_headers
+    >>>
+    >>> cache = MetadataCache(path='csv_metadata.json')
+    >>>
+    >>> async def route(paths: list[str]) -> list[list[str]]:
+    >>>     headers = [await csv_headers(path, cache=cache) for path in paths]
+    >>>     await cache.save()
+    >>>     return headers
+    """
+    def __init__(self, maxsize=4096, path: str | None = None) -> None:
+        self.maxsize = maxsize
+        self.path = path
+        self._entries: _collections.OrderedDict[str, tuple[Identity, dict[str, _typing.Any]]] = \
+            _collections.OrderedDict()
+        self._loaded = path is None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry held in memory."""
+        self._entries.clear()
+
+    @staticmethod
+    async def identity(path: str) -> Identity:
+        """Stat path in the thread pool and return its cache identity."""
+        stat = await _aiofiles_os.stat(path)
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+    def _fields(self, path: str, identity: Identity) -> dict[str, _typing.Any]:
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != identity:
+            entry = (identity, {})
+            self._entries[path] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(path)
+        return entry[1]
+
+    async def get(
+        self,
+        path: str,
+        name: str,
+        compute: _typing.Callable[[], _typing.Awaitable[_typing.Any]]
+    ) -> _typing.Any:
+        """Return the cached value of name for path, computing it on a miss.
+
+        The file is stat'ed before compute runs, so a file that changes
+        while its metadata is computed is stat'ed again on the next call.
+
+        Parameters
+        ----------
+        path : str
+            File path to CSV file.
+        name : str
+            Name of the value, including any options it depends on.
+        compute : Callable[[], Awaitable[Any]]
+            Coroutine function computing the value from the file.
+
+        Returns
+        -------
+        Any
+            The cached or newly computed value.
+
+        Raises
+        ------
+        FileNotFoundError
+            If file does not exist.
+        """
+        if not self._loaded:
+            await self.load()
+        identity = await self.identity(path)
+        fields = self._fields(path, identity)
+        if name in fields:
+            self.hits += 1
+            return fields[name]
+        self.misses += 1
+        value = await compute()
+        self._fields(path, identity)[name] = value
+        return value
+
+    def _read(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = _json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        for path, (identity, fields) in stored.get('entries', {}).items():
+            if path not in self._entries:
+                loaded = {name: _load_value(name, value) for name, value in fields.items()}
+                self._entries[path] = (tuple(identity), loaded)
+                self._entries.move_to_end(path, last=False)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _write(self, entries: list[tuple[str, tuple[Identity, dict[str, _typing.Any]]]]) -> None:
+        stored = {'entries': {
+            path: [list(identity), {name: _dump_value(name, value) for name, value in fields.items()}]
+            for path, (identity, fields) in entries
+        }}
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            _json.dump(stored, f)
+        _os.replace(temp_path, self.path)
+
+    async def load(self) -> None:
+        """Merge the entries stored on disk into memory, in the thread pool."""
+        self._loaded = True
+        if self.path is not None:
+            await _asyncio.get_running_loop().run_in_executor(None, self._read)
+
+    async def save(self) -> None:
+        """Atomically write the entries held in memory to disk, in the thread pool."""
+        if self.path is None:
+            return
+        if not self._loaded:
+            await self.load()
+        entries = [(path, (identity, dict(fields))) for path, (identity, fields) in self._entries.items()]
+        await _asyncio.get_running_loop().run_in_executor(None, self._write, entries)
@@ -0,0 +1,239 @@
+import asyncio as _asyncio
+import bz2 as _bz2
+import contextlib as _contextlib
+import gzip as _gzip
+import lzma as _lzma
+import typing as _typing
+
+from aiofiles.threadpool import wrap as _wrap
+
+BLOCK_SIZE = 1 << 16
+"""Default number of characters read from the file per thread-pool call."""
+
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'xz',
+    '.zst': 'zstd',
+    '.zstd': 'zstd'
+}
+"""File extension to compression format used when compression='infer'."""
+
+
+def detect_compression(
+    path: str,
+    compression: str | None = 'infer'
+) -> str | None:
+    """Resolve the compression format of a file.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+
+    Returns
+    -------
+    str | None
+        The compression format, or None for plain text.
+
+    Raises
+    ------
+    ValueError
+        If compression is not a supported format.
+
+    Example
+    -------
+    >>> from aiocsv_utils.compression import detect_compression
+    >>>
+    >>> detect_compression('data/cities.csv.gz')
+    'gzip'
+    """
+    if compression == 'infer':
+        lowered = str(path).lower()
+        for extension, name in EXTENSIONS.items():
+            if lowered.endswith(extension):
+                return name
+        return None
+    if compression is not None and compression not in EXTENSIONS.values():
+        raise ValueError(f'Unsupported compression: {compression!r}')
+    return compression
+
+
+def _open_zstd(path: str, mode: str, encoding: str | None, newline: str | None) -> _typing.IO:
+    try:
+        from compression import zstd
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            raise ImportError('zstd compression requires Python 3.14 or the zstandard package.') from None
+    return zstd.open(path, mode, encoding=encoding, newline=newline)
+
+
+def open_sync(
+    path: str,
+    mode: str,
+    encoding: str | None,
+    newline: str | None,
+    compression: str | None
+) -> _typing.IO:
+    """Open a plain or compressed file synchronously, in text or binary mode.
+
+    Parameters
+    ----------
+    path : str
+        File path.
+    mode : str
+        Mode as for open, such as 'r', 'w', 'a' or 'rb'.
+    encoding : str | None
+        The encoding format of text modes, None in binary modes.
+    newline : str | None
+        Newline handling of text modes, None in binary modes.
+    compression : str | None
+        'gzip', 'bz2', 'xz', 'zstd' or None for plain text, as resolved by
+        detect_compression.
+
+    Returns
+    -------
+    IO
+        File object, reading and writing decompressed data.
+
+    Raises
+    ------
+    ImportError
+        If compression is 'zstd' and no zstd module is available.
+
+    Example
+    -------
+    >>> from aiocsv_utils.compression import open_sync
+    >>>
+    >>> with open_sync('data/cities.csv.gz', 'rb', None, None, 'gzip') as f:
+    >>>     f.read(9)
+    b'LatD,LatM'
+    """
+    if compression is None:
+        return open(path, mode, encoding=encoding, newline=newline)
+    text_mode = mode if 'b' in mode else mode.replace('t', '') + 't'
+    if compression == 'gzip':
+        return _gzip.open(path, text_mode, encoding=encoding, newline=newline)
+    if compression == 'bz2':
+        return _bz2.open(path, text_mode, encoding=encoding, newline=newline)
+    if compression == 'xz':
+        return _lzma.open(path, text_mode, encoding=encoding, newline=newline)
+    return _open_zstd(path, text_mode, encoding, newline)
+
+
+class BlockReader:
+    """Async text file adapter that reads the underlying file in large blocks.
+
+    aiocsv asks for a few thousand characters per read, which would cost one
+    thread-pool call each. BlockReader fetches block_size characters per call
+    and serves the small reads from memory. Other attributes are proxied to
+    the wrapped file.
+
+    Parameters
+    ----------
+    async_file : AsyncTextIOWrapper
+        Async file object from aiofiles.open.
+    block_size : int, optional
+        Number of characters read per thread-pool call.
+    """
+    def __init__(self, async_file: _typing.Any, block_size=BLOCK_SIZE) -> None:
+        self._file = async_file
+        self.block_size = block_size
+        self._block = ''
+        self._position = 0
+
+    def __getattr__(self, name: str) -> _typing.Any:
+        return getattr(self._file, name)
+
+    async def read(self, size=-1) -> str:
+        if size is None or size < 0:
+            rest = self._block[self._position:] + await self._file.read()
+            self._block, self._position = '', 0
+            return rest
+        if self._position >= len(self._block):
+            self._block = await self._file.read(max(size, self.block_size))
+            self._position = 0
+        data = self._block[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+    async def seek(self, *args: _typing.Any) -> int:
+        self._block, self._position = '', 0
+        return await self._file.seek(*args)
+
+
+@_contextlib.asynccontextmanager
+async def open_csv(
+    path: str,
+    mode='r',
+    encoding: str | None = 'utf-8',
+    newline: str | None = '',
+    compression: str | None = 'infer',
+    block_size: int | None = BLOCK_SIZE
+) -> _typing.AsyncIterator[_typing.Any]:
+    """Asynchronously open a plain or compressed CSV file.
+
+    Opening, (de)compression and every read or write run in the thread
+    pool, off the event loop.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    mode : str, optional
+        Mode while opening a file, 'r', 'w', 'a' or 'x'.
+    encoding : str | None, optional
+        The encoding format.
+    newline : str | None, optional
+        How newlines mode works.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    block_size : int | None, optional
+        Characters read per thread-pool call in read mode, see BlockReader.
+        None reads exactly what the caller asks for.
+
+    Returns
+    -------
+    AsyncContextManager
+        Yields an async text file object.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist in read mode, or its directory does not.
+    ImportError
+        If zstd is used without Python 3.14 or the zstandard package.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.compression import open_csv
+    >>> from aiocsv_utils.read import csv_file_headers
+    >>>
+    >>> async def get_headers(path: str) -> list[str]:
+    >>>     async with open_csv(path) as f:
+    >>>         return await csv_file_headers(f)
+    >>>
+    >>> asyncio.run(get_headers('data/cities.csv.gz'))
+    ['LatD', 'LatM', 'LatS', 'NS', 'LonD', 'LonM', 'LonS', 'EW', 'City', 'State']
+    """
+    compression = detect_compression(path, compression)
+    loop = _asyncio.get_running_loop()
+    file = await loop.run_in_executor(None, open_sync, path, mode, encoding, newline, compression)
+    async_file = _wrap(file, loop=loop)
+    try:
+        if block_size and 'r' in mode and '+' not in mode:
+            yield BlockReader(async_file, block_size)
+        else:
+            yield async_file
+    finally:
+        await async_file.close()
@@ -1,5 +1,12 @@
+import array as _array
+import re as _re
 import typing as _typing
 
+try:
+    import numpy as _numpy
+except ImportError:  # pragma: no cover - optional dependency
+    _numpy = None
+
 
 def convert_str(value: _typing.Any) -> float | int | bool | str:
     """Tries to coerce a value to float, int, bool and finally str.
@@ -28,4 +35,327 @@ def convert_str(value: _typing.Any) -> float | int | bool | str:
         return True
     if value == 'False':
         return False
-    return value
\ No newline at end of file
+    return value
+
+
+Schema = dict[str, _typing.Any]
+"""Mapping of column name to int, float, bool, str, None or a callable."""
+
+_BOOLS = {'True': True, 'False': False}
+
+
+def _to_int(value: str) -> _typing.Any:
+    if not value:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        return convert_str(value)
+
+
+def _to_float(value: str) -> _typing.Any:
+    if value.count('.') == 1:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return convert_str(value)
+
+
+def _to_bool(value: str) -> _typing.Any:
+    if value in _BOOLS:
+        return _BOOLS[value]
+    return convert_str(value)
+
+
+_DIGIT = _re.compile(r'\d')
+
+
+def _convert_text(value: str) -> _typing.Any:
+    # Without a decimal digit neither int nor float can parse the value.
+    if _DIGIT.search(value) is None:
+        return _BOOLS.get(value, value)
+    return convert_str(value)
+
+
+def _to_str(value: str) -> str:
+    return value
+
+
+_CONVERTERS = {int: _to_int, float: _to_float, bool: _to_bool, str: _to_str, None: convert_str}
+
+# Inferred str columns may still hold other values past the sample.
+_INFERRED_CONVERTERS = {**_CONVERTERS, str: _convert_text}
+
+
+class InferredSchema(dict):
+    """Column type plan inferred from a sample, as returned by infer_schema.
+
+    compile_schema converts its str columns with convert_str semantics too,
+    so values past the sample that are not text convert exactly as without
+    a plan. A str column in a plain dict keeps raw strings.
+    """
+
+
+def infer_type(values: _typing.Iterable[str]) -> type | None:
+    """Infer the type convert_str would give a column of strings.
+    
+    Parameters
+    ----------
+    values : Iterable[str]
+        Sample of raw column values.
+        
+    Returns
+    -------
+    type | None
+        int, float, bool or str if the non-empty values agree on one type
+        (int and float mixed gives float), otherwise None.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import infer_type
+    >>>
+    >>> infer_type(['1', '2.5', ''])
+    <class 'float'>
+    """
+    return common_type({type(convert_str(value)) for value in values if value != ''})
+
+
+def common_type(types: _typing.Collection[type]) -> type | None:
+    """Combine the types of a column's convert_str values into one type, as infer_type does.
+    
+    Parameters
+    ----------
+    types : Collection[type]
+        Types of the non-empty converted values.
+        
+    Returns
+    -------
+    type | None
+        The only type, float for int and float, otherwise None.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import common_type
+    >>>
+    >>> common_type({int, float})
+    <class 'float'>
+    """
+    types = set(types)
+    if types == {int, float}:
+        return float
+    if len(types) == 1:
+        return next(iter(types))
+    return None
+
+
+def infer_schema(
+    headers: _typing.Sequence[str],
+    rows: _typing.Iterable[_typing.Sequence[str]]
+) -> InferredSchema:
+    """Infer a column type plan from the header and a sample of raw rows.
+    
+    Parameters
+    ----------
+    headers : Sequence[str]
+        CSV column header names.
+    rows : Iterable[Sequence[str]]
+        Sample of raw CSV rows as lists of strings.
+        
+    Returns
+    -------
+    InferredSchema
+        Column name to inferred type, see infer_type.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import infer_schema
+    >>>
+    >>> infer_schema(['id', 'name'], [['1', 'John'], ['2', 'Jane']])
+    {'id': <class 'int'>, 'name': <class 'str'>}
+    """
+    columns: list[list[str]] = [[] for _ in headers]
+    for row in rows:
+        for column, value in zip(columns, row):
+            column.append(value)
+    return InferredSchema((header, infer_type(column)) for header, column in zip(headers, columns))
+
+
+def compile_schema(
+    headers: _typing.Sequence[str],
+    schema: Schema
+) -> list[_typing.Callable[[str], _typing.Any]]:
+    """Compile a column type plan into one converter function per column.
+    
+    int, float and bool columns convert without raising on matching values
+    and fall back to convert_str on mismatches, so results equal convert_str.
+    str columns keep raw strings, except in an InferredSchema where they
+    fall back to convert_str too, and None or missing columns use convert_str.
+    Any other callable in the plan is used as the converter as is.
+    
+    Parameters
+    ----------
+    headers : Sequence[str]
+        CSV column header names.
+    schema : dict[str, Any]
+        Column name to int, float, bool, str, None or a callable.
+        
+    Returns
+    -------
+    list[Callable[[str], Any]]
+        Converter functions in header order.
+        
+    Raises
+    ------
+    TypeError
+        If a column type is neither a supported type nor callable.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import compile_schema
+    >>>
+    >>> converters = compile_schema(['id', 'name'], {'id': int, 'name': str})
+    >>> [convert(value) for convert, value in zip(converters, ['1', '2'])]
+    [1, '2']
+    """
+    table = _INFERRED_CONVERTERS if isinstance(schema, InferredSchema) else _CONVERTERS
+    converters = []
+    for header in headers:
+        kind = schema.get(header)
+        if kind in table:
+            converters.append(table[kind])
+        elif callable(kind):
+            converters.append(kind)
+        else:
+            raise TypeError(f'Unsupported column type for {header!r}: {kind!r}')
+    return converters
+
+
+Column = _typing.Union[list, _array.array, _typing.Any]
+"""A column of values: array.array or numpy.ndarray for numbers, else list."""
+
+
+def column_array(
+    values: list[_typing.Any],
+    numpy: bool | None = None
+) -> Column:
+    """Pack converted column values into a typed container.
+    
+    Columns of only ints become int64 arrays, columns of ints and floats
+    become float64 arrays and any other column is returned as the list.
+    
+    Parameters
+    ----------
+    values : list[Any]
+        Converted column values, such as convert_str results.
+    numpy : bool | None, optional
+        Use numpy.ndarray instead of array.array. None uses NumPy when it is
+        installed.
+        
+    Returns
+    -------
+    array.array | numpy.ndarray | list
+        Typed column container.
+        
+    Raises
+    ------
+    ImportError
+        If numpy is True and NumPy is not installed.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import column_array
+    >>>
+    >>> column_array([1, 2, 3], numpy=False)
+    array('q', [1, 2, 3])
+    """
+    if numpy is None:
+        numpy = _numpy is not None
+    elif numpy and _numpy is None:
+        raise ImportError('numpy=True requires NumPy to be installed.')
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        try:
+            return _numpy.array(values, dtype=_numpy.int64) if numpy else _array.array('q', values)
+        except OverflowError:
+            return values
+    if kinds == {float} or kinds == {int, float}:
+        return _numpy.array(values, dtype=_numpy.float64) if numpy else _array.array('d', values)
+    return values
+
+
+# Converters that give the same result as convert_str for every string.
+_CONVERT_STR_LIKE = frozenset((convert_str, _to_int, _to_float, _to_bool, _convert_text))
+
+
+def is_convert_str_like(converter: _typing.Callable[[str], _typing.Any]) -> bool:
+    """Whether a converter from compile_schema gives the same result as convert_str for every string.
+
+    Whole columns for such converters can be converted with convert_column.
+
+    Example
+    -------
+    >>> from aiocsv_utils.convert import compile_schema, is_convert_str_like
+    >>>
+    >>> [is_convert_str_like(convert) for convert in compile_schema(['a', 'b'], {'a': int, 'b': str})]
+    [True, False]
+    """
+    return converter in _CONVERT_STR_LIKE
+
+
+def convert_column(
+    values: _typing.Sequence[str],
+    numpy: bool | None = None
+) -> Column:
+    """Convert a whole column of strings, giving exactly column_array of convert_str of each value.
+
+    Columns of only ints or only floats are parsed with one map(int) or
+    map(float) call, which accept exactly the strings convert_str turns
+    into numbers. Other columns skip the number parsers for values without
+    a digit and convert the rest one by one.
+
+    Parameters
+    ----------
+    values : Sequence[str]
+        Raw column values.
+    numpy : bool | None, optional
+        Use numpy.ndarray instead of array.array. None uses NumPy when it is
+        installed.
+
+    Returns
+    -------
+    array.array | numpy.ndarray | list
+        Typed column container, see column_array.
+
+    Raises
+    ------
+    ImportError
+        If numpy is True and NumPy is not installed.
+
+    Example
+    -------
+    >>> from aiocsv_utils.convert import convert_column
+    >>>
+    >>> convert_column(['1', '2.5', ''], numpy=False)
+    [1, 2.5, '']
+    """
+    if not all(type(value) is str for value in values):
+        return column_array(list(map(convert_str, values)), numpy)
+    try:
+        return column_array(list(map(int, values)), numpy)
+    except ValueError:
+        pass
+    try:
+        floats = list(map(float, values))
+    except ValueError:
+        floats = None
+    if floats is not None:
+        # float accepts at most one '.', so this many dots means one in every value.
+        if ''.join(values).count('.') == len(values):
+            return column_array(floats, numpy)
+        try:
+            return column_array([number if '.' in value else int(value)
+                                 for number, value in zip(floats, values)], numpy)
+        except ValueError:
+            pass
+    return column_array(list(map(_convert_text, values)), numpy)
@@ -0,0 +1,193 @@
+import csv as _csv
+import io as _io
+import re as _re
+import typing as _typing
+
+SAMPLE_SIZE = 1 << 16
+"""Default number of leading characters sniffed."""
+
+DELIMITERS = ',;\t|'
+"""Delimiter candidates, earlier ones win ties."""
+
+MAX_ROWS = 200
+"""Maximum number of sample rows parsed per delimiter candidate."""
+
+Dialect = dict[str, str]
+"""Sniffed delimiter, quotechar and lineterminator of a CSV file."""
+
+
+def _lineterminator(sample: str) -> str:
+    newline = sample.find('\n')
+    if newline > 0 and sample[newline - 1] == '\r':
+        return '\r\n'
+    if newline >= 0:
+        return '\n'
+    return '\r' if '\r' in sample else '\r\n'
+
+
+def _quotechar(sample: str, delimiters: str) -> str:
+    # "'" is only a candidate if it encloses a whole field somewhere, not just leads one.
+    separators = _re.escape(delimiters)
+    pattern = rf"(?:^|[{separators}])'[^'\r\n]*'(?=[{separators}]|\r?$)"
+    if '"' not in sample and delimiters and _re.search(pattern, sample, _re.MULTILINE):
+        return "'"
+    return '"'
+
+
+def _widths(text: str, delimiter: str, quotechar: str) -> list[int]:
+    widths = []
+    reader = _csv.reader(_io.StringIO(text, newline=''), delimiter=delimiter, quotechar=quotechar)
+    try:
+        for row in reader:
+            if row:
+                widths.append(len(row))
+                if len(widths) >= MAX_ROWS:
+                    break
+    except _csv.Error:
+        pass
+    return widths
+
+
+def _delimiter(text: str, delimiters: str, quotechar: str) -> tuple[str, tuple[float, int]]:
+    best, best_score = delimiters[:1] or ',', (0.0, 1)
+    for delimiter in delimiters:
+        if delimiter not in text:
+            continue
+        widths = _widths(text, delimiter, quotechar)
+        if not widths:
+            continue
+        width = max(set(widths), key=widths.count)
+        if width < 2:
+            continue
+        score = (widths.count(width) / len(widths), width)
+        if score > best_score:
+            best, best_score = delimiter, score
+    return best, best_score
+
+
+def sniff_dialect(
+    sample: str,
+    delimiters=DELIMITERS
+) -> Dialect:
+    """Detect the delimiter, quote character and line terminator of CSV text.
+
+    The sample is parsed with each candidate delimiter and the one giving
+    the most consistent number of fields, then the most fields, wins. A
+    truncated last line is ignored. Text with one column sniffs as ','.
+    The quotechar is "'" only if the sample has no '"', some field is
+    enclosed in "'" and parsing with it gives more consistent field counts.
+
+    Parameters
+    ----------
+    sample : str
+        Leading text of a CSV file.
+    delimiters : str, optional
+        Delimiter candidates, earlier ones win ties.
+
+    Returns
+    -------
+    dict[str, str]
+        The delimiter, quotechar and lineterminator.
+
+    Example
+    -------
+    >>> from aiocsv_utils.dialect import sniff_dialect
+    >>>
+    >>> sniff_dialect('a;b;c\\r\\n1;"x;y";3\\r\\n')
+    {'delimiter': ';', 'quotechar': '"', 'lineterminator': '\\r\\n'}
+    """
+    end = max(sample.rfind('\n'), sample.rfind('\r'))
+    text = sample[:end + 1] if end >= 0 else sample
+    quotechar = _quotechar(text, delimiters)
+    best, best_score = _delimiter(text, delimiters, quotechar)
+    if quotechar != '"':
+        # Keep '"' unless "'" gives more consistent field counts.
+        fallback, fallback_score = _delimiter(text, delimiters, '"')
+        if fallback_score >= best_score:
+            best, quotechar = fallback, '"'
+    return {'delimiter': best, 'quotechar': quotechar, 'lineterminator': _lineterminator(text)}
+
+
+class SampleReader:
+    """Async file wrapper that replays an already read sample before reading on.
+
+    Parameters
+    ----------
+    async_file : Any
+        Async file object with an async read method, positioned right after
+        the sample.
+    sample : str
+        Text read from async_file so far.
+    """
+    def __init__(self, async_file: _typing.Any, sample: str) -> None:
+        self._file = async_file
+        self._sample = sample
+        self._position = 0
+
+    def __getattr__(self, name: str) -> _typing.Any:
+        return getattr(self._file, name)
+
+    async def read(self, size=-1) -> str:
+        if self._position >= len(self._sample):
+            return await self._file.read(size)
+        if size is None or size < 0:
+            rest = self._sample[self._position:] + await self._file.read()
+            self._sample, self._position = '', 0
+            return rest
+        data = self._sample[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+    async def seek(self, *args: _typing.Any) -> int:
+        self._sample, self._position = '', 0
+        return await self._file.seek(*args)
+
+
+async def sniff_csv_file(
+    async_file: _typing.Any,
+    sample_size=SAMPLE_SIZE,
+    delimiters=DELIMITERS
+) -> tuple[Dialect, SampleReader]:
+    """Asynchronously sniff the dialect of a CSV file from its leading characters.
+
+    Parameters
+    ----------
+    async_file : Any
+        Async file object with an async read method.
+    sample_size : int, optional
+        Number of leading characters sniffed.
+    delimiters : str, optional
+        Delimiter candidates, earlier ones win ties.
+
+    Returns
+    -------
+    tuple[dict[str, str], SampleReader]
+        The dialect, see sniff_dialect, and a file to parse from that
+        replays the sample, so nothing is read twice.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.compression import open_csv
+    >>> from aiocsv_utils.dialect import sniff_csv_file
+    >>> from aiocsv_utils.read import csv_file_headers
+    >>>
+    >>> async def get_headers(path: str) -> list[str]:
+    >>>     async with open_csv(path) as f:
+    >>>         dialect, f = await sniff_csv_file(f)
+    >>>         return await csv_file_headers(f, dialect['delimiter'])
+    >>>
+    >>> asyncio.run(get_headers('data/cities.csv'))
+    ['LatD', 'LatM', 'LatS', 'NS', 'LonD', 'LonM', 'LonS', 'EW', 'City', 'State']
+    """
+    parts = []
+    remaining = sample_size
+    while remaining > 0:
+        data = await async_file.read(remaining)
+        if not data:
+            break
+        parts.append(data)
+        remaining -= len(data)
+    sample = ''.join(parts)
+    return sniff_dialect(sample, delimiters), SampleReader(async_file, sample)
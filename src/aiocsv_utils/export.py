@@ -0,0 +1,401 @@
+import asyncio as _asyncio
+import json as _json
+import math as _math
+import os as _os
+import typing as _typing
+
+from .compression import open_csv as _open_csv
+from .convert import InferredSchema as _InferredSchema
+from .convert import Schema as _Schema
+from .convert import Column as _Column
+from .convert import compile_schema as _compile_schema
+from .convert import convert_column as _convert_column
+from .convert import is_convert_str_like as _is_convert_str_like
+from .read import csv_headers as _csv_headers
+from .read import csv_schema as _csv_schema
+from .read import csv_to_column_chunks as _csv_to_column_chunks
+
+CHUNK_SIZE = 65_536
+"""Default number of rows converted per chunk or record batch."""
+
+_ARROW_TYPES = {int: 'int64', float: 'float64', bool: 'bool_', str: 'string'}
+
+_encode = _json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _pyarrow() -> _typing.Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('Arrow and Parquet export require the pyarrow package.') from None
+    return pyarrow
+
+
+def _json_float(value: float) -> str:
+    return repr(value) if _math.isfinite(value) else _encode(value)
+
+
+def _json_column(values: list[str], convert: _typing.Callable[[str], _typing.Any]) -> list[str]:
+    """JSON text of every raw value in a column, typed value by value like csv_to_records."""
+    if not _is_convert_str_like(convert):
+        return list(map(_encode, map(convert, values)))
+    column = _convert_column(values, False)
+    if isinstance(column, list):
+        return list(map(_encode, column))
+    if column.typecode == 'q':
+        return list(map(str, column))
+    # convert_str gives floats only for strings with one '.' and ints only for strings without.
+    if ''.join(values).count('.') == len(values):
+        return list(map(_json_float, column))
+    return [_json_float(number) if '.' in value else str(int(value)) for number, value in zip(column, values)]
+
+
+def _json_template(headers: list[str]) -> str:
+    fields = (_encode(header).replace('{', '{{').replace('}', '}}') + ': {}' for header in headers)
+    return '{{' + ', '.join(fields) + '}}\n'
+
+
+async def csv_to_jsonl(
+    path: str,
+    output: str,
+    chunk_size=CHUNK_SIZE,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    compression: str | None = 'infer',
+    output_compression: str | None = 'infer'
+) -> int:
+    """Convert a CSV by path to a JSON Lines file, one object per record.
+
+    Each chunk of columns is encoded column by column and joined into lines
+    through a template built once from the header, so no per-row dict is
+    made. Values get the same types as from csv_to_records, whatever else
+    shares their chunk. Memory is bounded by chunk_size.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    output : str
+        File path of the JSON Lines file, replaced if it exists.
+    chunk_size : int, optional
+        Number of rows converted and written at a time.
+    encoding : str, optional
+        The encoding format of the input. The output is UTF-8.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see read.csv_to_records. None converts every
+        value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    output_compression : str | None, optional
+        Compression of the output, in the same form.
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.export import csv_to_jsonl
+    >>>
+    >>> asyncio.run(csv_to_jsonl('data/cities.csv', 'data/cities.jsonl.gz'))
+    128
+    """
+    headers = await _csv_headers(path, encoding=encoding, delimiter=delimiter, compression=compression)
+    if schema == 'infer':
+        schema = await _csv_schema(path, encoding=encoding, delimiter=delimiter,
+                                   sample_size=sample_size, compression=compression)
+    converters = _compile_schema(headers, schema or {})
+    template = _json_template(headers)
+    count = 0
+    # Raw strings are converted here, as typed arrays would turn a chunk's ints into floats.
+    chunks = _csv_to_column_chunks(path, chunk_size, encoding=encoding, delimiter=delimiter,
+                                   schema=dict.fromkeys(headers, str), compression=compression)
+    async with _open_csv(output, 'w', 'utf-8', '', output_compression) as f:
+        async for chunk in chunks:
+            columns = [_json_column(chunk[header], convert) for header, convert in zip(headers, converters)]
+            lines = list(map(template.format, *columns)) if columns else []
+            count += len(lines)
+            await f.write(''.join(lines))
+    return count
+
+
+def _arrow_type(pa: _typing.Any, kind: _typing.Any) -> _typing.Any:
+    name = _ARROW_TYPES.get(kind)
+    return getattr(pa, name)() if name is not None else None
+
+
+class _ColumnMismatch(ValueError):
+
+    def __init__(self, header: str, error: Exception) -> None:
+        super().__init__(f'Column {header!r} does not match its schema type: {error}')
+        self.header = header
+
+
+def _arrow_array(pa: _typing.Any, header: str, values: _Column, kind: _typing.Any, arrow_type: _typing.Any) -> _typing.Any:
+    if isinstance(values, list):
+        if kind is not str:
+            values = [None if value == '' else value for value in values]
+    elif not hasattr(values, 'dtype'):
+        values = values.tolist()
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+        raise _ColumnMismatch(header, error) from None
+
+
+def _record_batch(
+    pa: _typing.Any,
+    headers: list[str],
+    plan: _Schema,
+    fields: list[_typing.Any],
+    chunk: dict[str, _Column]
+) -> _typing.Any:
+    arrays = []
+    for position, header in enumerate(headers):
+        array = _arrow_array(pa, header, chunk[header], plan.get(header), fields[position])
+        if fields[position] is None:
+            fields[position] = array.type
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(list(zip(headers, fields))))
+
+
+async def _write_arrow(
+    pa: _typing.Any,
+    path: str,
+    output: str,
+    open_writer: _typing.Callable[[str, _typing.Any], _typing.Any],
+    headers: list[str],
+    plan: _Schema,
+    chunk_size: int,
+    encoding: str,
+    delimiter: str,
+    compression: str | None
+) -> int:
+    fields = [_arrow_type(pa, plan[header]) for header in headers]
+    loop = _asyncio.get_running_loop()
+    writer = None
+    count = 0
+
+    def write(chunk: dict[str, _Column]) -> None:
+        nonlocal writer
+        batch = _record_batch(pa, headers, plan, fields, chunk)
+        if writer is None:
+            writer = open_writer(output, batch.schema)
+        writer.write_batch(batch)
+
+    chunks = _csv_to_column_chunks(path, chunk_size, encoding=encoding, delimiter=delimiter, schema=plan,
+                                   compression=compression)
+    try:
+        async for chunk in chunks:
+            count += len(next(iter(chunk.values()), ()))
+            await loop.run_in_executor(None, write, chunk)
+        if writer is None:
+            empty = [field if field is not None else pa.string() for field in fields]
+            writer = await loop.run_in_executor(None, open_writer, output, pa.schema(list(zip(headers, empty))))
+    finally:
+        await chunks.aclose()
+        if writer is not None:
+            await loop.run_in_executor(None, writer.close)
+    return count
+
+
+async def _csv_to_arrow(
+    path: str,
+    output: str,
+    open_writer: _typing.Callable[[str, _typing.Any], _typing.Any],
+    chunk_size: int,
+    encoding: str,
+    delimiter: str,
+    schema: _Schema | _typing.Literal['infer'],
+    sample_size: int,
+    compression: str | None
+) -> int:
+    pa = _pyarrow()
+    headers = await _csv_headers(path, encoding=encoding, delimiter=delimiter, compression=compression)
+    if schema == 'infer':
+        schema = await _csv_schema(path, encoding=encoding, delimiter=delimiter,
+                                   sample_size=sample_size, compression=compression)
+    inferred = isinstance(schema, _InferredSchema)
+    # Columns without one type keep their raw strings, which Arrow can hold.
+    plan = {header: schema.get(header) or str for header in headers}
+    temp_path = output + '.tmp'
+    try:
+        while True:
+            try:
+                count = await _write_arrow(pa, path, temp_path, open_writer, headers, plan, chunk_size,
+                                           encoding, delimiter, compression)
+                break
+            except _ColumnMismatch as error:
+                # A type inferred from the sample can be wrong past it, so such a
+                # column is written again as raw strings. Given types are kept.
+                if not inferred or plan[error.header] is str:
+                    raise
+                plan[error.header] = str
+        _os.replace(temp_path, output)
+    except BaseException:
+        try:
+            _os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return count
+
+
+async def csv_to_arrow(
+    path: str,
+    output: str,
+    chunk_size=CHUNK_SIZE,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] = 'infer',
+    sample_size=100,
+    compression: str | None = 'infer',
+    ipc_compression: str | None = None
+) -> int:
+    """Convert a CSV by path to an Arrow IPC file, one record batch per chunk.
+
+    Record batches are built straight from the chunks of typed columns,
+    zero-copy from NumPy arrays when it is installed, and written in the
+    thread pool. The file is written next to output and renamed over it
+    only once complete. Requires pyarrow.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    output : str
+        File path of the Arrow IPC file, replaced if it exists.
+    chunk_size : int, optional
+        Number of rows per record batch.
+    encoding : str, optional
+        The encoding format.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer', optional
+        Column type plan, see read.csv_to_records. int, float, bool and str
+        columns become int64, float64, bool and string columns with empty
+        values as nulls. Columns without a type keep their raw strings and
+        the Arrow type of other callables' results is inferred from the
+        first chunk. An inferred column with values past the sample that
+        do not match its type is written as raw strings instead.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    ipc_compression : str | None, optional
+        Record batch buffer compression, 'lz4', 'zstd' or None.
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        If a column has values that do not match its schema type.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.export import csv_to_arrow
+    >>>
+    >>> asyncio.run(csv_to_arrow('data/cities.csv', 'data/cities.arrow'))
+    128
+    """
+    def open_writer(target: str, arrow_schema: _typing.Any) -> _typing.Any:
+        pa = _pyarrow()
+        options = pa.ipc.IpcWriteOptions(compression=ipc_compression)
+        return pa.ipc.new_file(target, arrow_schema, options=options)
+    return await _csv_to_arrow(path, output, open_writer, chunk_size, encoding, delimiter, schema, sample_size,
+                               compression)
+
+
+async def csv_to_parquet(
+    path: str,
+    output: str,
+    chunk_size=CHUNK_SIZE,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] = 'infer',
+    sample_size=100,
+    compression: str | None = 'infer',
+    parquet_compression: str | None = 'snappy'
+) -> int:
+    """Convert a CSV by path to a Parquet file, one row group per chunk.
+
+    Works like csv_to_arrow, with each record batch written as a row
+    group. Requires pyarrow.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    output : str
+        File path of the Parquet file, replaced if it exists.
+    chunk_size : int, optional
+        Number of rows per row group.
+    encoding : str, optional
+        The encoding format.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer', optional
+        Column type plan, see csv_to_arrow.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    parquet_compression : str | None, optional
+        Parquet column compression, such as 'snappy', 'zstd' or None.
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        If a column has values that do not match its schema type.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.export import csv_to_parquet
+    >>>
+    >>> asyncio.run(csv_to_parquet('data/cities.csv.gz', 'data/cities.parquet'))
+    128
+    """
+    def open_writer(target: str, arrow_schema: _typing.Any) -> _typing.Any:
+        _pyarrow()
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(target, arrow_schema, compression=parquet_compression or 'none')
+    return await _csv_to_arrow(path, output, open_writer, chunk_size, encoding, delimiter, schema, sample_size,
+                               compression)
@@ -0,0 +1,297 @@
+import asyncio as _asyncio
+import csv as _csv
+import ctypes as _ctypes
+import ctypes.util as _ctypes_util
+import os as _os
+import sys as _sys
+import time as _time
+import typing as _typing
+
+import aiofiles as _aiofiles
+import aiofiles.os as _aiofiles_os
+
+from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import compile_schema as _compile_schema
+from .read import schema_record as _schema_record
+
+BLOCK_SIZE = 1 << 16
+"""Default number of bytes read per call while following."""
+
+Checkpoint = dict[str, _typing.Any]
+"""JSON serializable follow position: offset, inode and headers."""
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVE_SELF = 0x00000800
+_IN_DELETE_SELF = 0x00000400
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVE_SELF | _IN_DELETE_SELF
+
+
+def _libc() -> _typing.Any:
+    if not _sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = _ctypes.CDLL(_ctypes_util.find_library('c') or None, use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, 'inotify_init1') else None
+
+
+class _Inotify:
+    """Wakes waiters when the watched file is written, moved or deleted."""
+    def __init__(self, libc: _typing.Any, path: str) -> None:
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(_ctypes.get_errno(), 'inotify_init1 failed')
+        if libc.inotify_add_watch(fd, _os.fsencode(path), _IN_MASK) < 0:
+            error = _ctypes.get_errno()
+            _os.close(fd)
+            raise OSError(error, f'inotify_add_watch failed for {path!r}')
+        self.fd = fd
+        self.event = _asyncio.Event()
+        self.loop = _asyncio.get_running_loop()
+        self.loop.add_reader(fd, self._on_ready)
+
+    def _on_ready(self) -> None:
+        try:
+            while _os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self.event.set()
+
+    async def wait(self, timeout: float) -> None:
+        try:
+            await _asyncio.wait_for(self.event.wait(), timeout)
+        except _asyncio.TimeoutError:
+            pass
+        self.event.clear()
+
+    def close(self) -> None:
+        self.loop.remove_reader(self.fd)
+        _os.close(self.fd)
+
+
+class CsvFollower:
+    """Tail a growing CSV file and async yield each record as it is appended.
+
+    Reading resumes from the byte offset just after the last yielded record.
+    Only records terminated by a newline outside quotes are yielded, so a
+    record that is still being written is never seen half way. Appends are
+    awaited with inotify on Linux and by polling every poll_interval seconds
+    elsewhere. If the file is replaced (new inode) or truncated, following
+    restarts from its header.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    checkpoint : dict[str, Any] | None, optional
+        A checkpoint from an earlier follower to resume from. None starts
+        at the top of the file.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | None, optional
+        Column type plan, see convert.compile_schema. None converts every
+        value with convert_str.
+    poll_interval : float, optional
+        Seconds between checks for appends. With inotify this only bounds
+        how late a missed event is noticed.
+    idle_timeout : float | None, optional
+        Stop iterating once no record arrived for this many seconds. None
+        follows until the iteration is closed.
+    use_inotify : bool | None, optional
+        Wait with inotify. None uses it when the platform supports it.
+    block_size : int, optional
+        Number of bytes read per call.
+
+    Example
+    -------
+    >>> import asyncio
+    >>> import json
+    >>>
+    >>> from aiocsv_utils.follow import CsvFollower
+    >>>
+    >>> async def consume(path: str, state_path: str) -> None:
+    >>>     try:
+    >>>         with open(state_path) as f:
+    >>>             checkpoint = json.load(f)
+    >>>     except FileNotFoundError:
+    >>>         checkpoint = None
+    >>>     async with CsvFollower(path, checkpoint, idle_timeout=60) as follower:
+    >>>         async for record in follower:
+    >>>             print(record)
+    >>>             with open(state_path, 'w') as f:
+    >>>                 json.dump(follower.checkpoint, f)
+    >>>
+    >>> asyncio.run(consume('data/events.csv', 'data/events.checkpoint.json'))
+    """
+    def __init__(
+        self,
+        path: str,
+        checkpoint: Checkpoint | None = None,
+        encoding='utf-8',
+        delimiter=',',
+        schema: _Schema | None = None,
+        poll_interval=1.0,
+        idle_timeout: float | None = None,
+        use_inotify: bool | None = None,
+        block_size=BLOCK_SIZE
+    ) -> None:
+        self.path = path
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.schema = schema
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.use_inotify = use_inotify
+        self.block_size = block_size
+        checkpoint = checkpoint or {}
+        self._offset: int = checkpoint.get('offset', 0)
+        self._inode: int | None = checkpoint.get('inode')
+        self._headers: list[str] | None = checkpoint.get('headers')
+        self._converters: list[_typing.Callable[[str], _typing.Any]] | None = None
+        self._file: _typing.Any = None
+        self._watcher: _Inotify | None = None
+        self._carry = b''
+        self._scanned = 0
+        self._in_quotes = False
+
+    @property
+    def checkpoint(self) -> Checkpoint:
+        """Position just after the last yielded record, safe to store as JSON."""
+        return {'offset': self._offset, 'inode': self._inode, 'headers': self._headers}
+
+    async def __aenter__(self) -> 'CsvFollower':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __aiter__(self) -> _typing.AsyncIterator[dict[str, _typing.Any]]:
+        return self._follow()
+
+    async def aclose(self) -> None:
+        """Close the followed file and stop watching it."""
+        self._close_watcher()
+        if self._file is not None:
+            file, self._file = self._file, None
+            await file.close()
+
+    def _close_watcher(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def _restart(self, inode: int) -> None:
+        self._offset = 0
+        self._inode = inode
+        self._headers = None
+        self._converters = None
+
+    async def _reopen(self) -> bool:
+        try:
+            stat = await _aiofiles_os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        replaced = self._inode is not None and stat.st_ino != self._inode
+        if self._file is not None and not replaced and stat.st_size >= self._offset:
+            return True
+        await self.aclose()
+        if replaced or stat.st_size < self._offset:
+            self._restart(stat.st_ino)
+        self._inode = stat.st_ino
+        self._file = await _aiofiles.open(self.path, 'rb')
+        await self._file.seek(self._offset)
+        self._carry, self._scanned, self._in_quotes = b'', 0, False
+        libc = _libc() if self.use_inotify is not False else None
+        if libc is not None:
+            try:
+                self._watcher = _Inotify(libc, self.path)
+            except (OSError, NotImplementedError):
+                if self.use_inotify:
+                    raise
+        elif self.use_inotify:
+            raise OSError('inotify is not available on this platform.')
+        return True
+
+    def _complete_end(self) -> int:
+        """Length of the carried bytes that hold complete records."""
+        carry, position, in_quotes = self._carry, self._scanned, self._in_quotes
+        end = 0
+        while True:
+            newline = carry.find(b'\n', position)
+            if newline == -1:
+                break
+            in_quotes ^= bool(carry.count(b'"', position, newline) & 1)
+            position = newline + 1
+            if not in_quotes:
+                end = position
+        self._scanned, self._in_quotes = position, in_quotes
+        return end
+
+    def _converters_for(self, headers: list[str]) -> list[_typing.Callable[[str], _typing.Any]]:
+        if self.schema is None:
+            return [_convert_str] * len(headers)
+        return _compile_schema(headers, self.schema)
+
+    async def _read_available(self) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+        while True:
+            data = await self._file.read(self.block_size)
+            if not data:
+                return
+            self._carry += data
+            end = self._complete_end()
+            if not end:
+                continue
+            region, self._carry = self._carry[:end], self._carry[end:]
+            self._scanned -= end
+            position = self._offset
+            encoding = self.encoding
+
+            def lines() -> _typing.Iterator[str]:
+                nonlocal position
+                for line in region[:-1].split(b'\n'):
+                    position += len(line) + 1
+                    yield line.decode(encoding) + '\n'
+
+            for row in _csv.reader(lines(), delimiter=self.delimiter):
+                if not row:
+                    self._offset = position
+                    continue
+                if self._headers is None:
+                    self._headers = row
+                    self._offset = position
+                    continue
+                if self._converters is None:
+                    self._converters = self._converters_for(self._headers)
+                record = _schema_record(self._headers, self._converters, len(self._headers), row)
+                self._offset = position
+                yield record
+            self._offset = position
+
+    async def _wait(self) -> None:
+        if self._watcher is not None:
+            await self._watcher.wait(self.poll_interval)
+        else:
+            await _asyncio.sleep(self.poll_interval)
+
+    async def _follow(self) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+        last = _time.monotonic()
+        try:
+            while True:
+                if await self._reopen():
+                    async for record in self._read_available():
+                        yield record
+                        last = _time.monotonic()
+                if self.idle_timeout is not None and _time.monotonic() - last >= self.idle_timeout:
+                    return
+                await self._wait()
+        finally:
+            await self.aclose()
@@ -0,0 +1,229 @@
+import asyncio as _asyncio
+import json as _json
+import os as _os
+import typing as _typing
+
+import aiofiles as _aiofiles
+import aiocsv as _aiocsv
+
+from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import compile_schema as _compile_schema
+from .read import csv_file_headers as _csv_file_headers
+from .read import schema_record as _schema_record
+from .scan import next_record_boundary as _next_record_boundary
+from .scan import scan_records as _scan_records
+
+INDEX_SUFFIX = '.idx'
+"""Suffix added to the CSV path to name its sidecar index file."""
+
+CsvIndex = dict[str, _typing.Any]
+"""Sidecar index: size, mtime_ns, every, rows and offsets of every Nth record."""
+
+
+def _index_path(path: str, index_path: str | None) -> str:
+    return index_path if index_path is not None else path + INDEX_SUFFIX
+
+
+def _check_every(every: int) -> None:
+    if every < 1:
+        raise ValueError(f'every must be at least 1, not {every!r}')
+
+
+def _build_index(path: str, every: int, index_path: str) -> CsvIndex:
+    stat = _os.stat(path)
+    with open(path, 'rb') as file:
+        header_end = _next_record_boundary(file, 0)
+        rows, offsets = _scan_records(file, header_end, every)
+    index = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'every': every,
+        'rows': rows,
+        'offsets': offsets
+    }
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        _json.dump(index, f)
+    _os.replace(temp_path, index_path)
+    return index
+
+
+def _load_index(path: str, index_path: str) -> CsvIndex | None:
+    try:
+        stat = _os.stat(path)
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = _json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if index.get('size') != stat.st_size or index.get('mtime_ns') != stat.st_mtime_ns:
+        return None
+    return index
+
+
+async def build_csv_index(
+    path: str,
+    every=1000,
+    index_path: str | None = None
+) -> CsvIndex:
+    """Scan a CSV by path and write a sidecar index of every Nth record's byte offset.
+
+    The scan runs in a thread so the event loop is not blocked.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    every : int, optional
+        Record the byte offset of every Nth record, at least 1.
+    index_path : str | None, optional
+        Path of the index file, defaults to path + '.idx'.
+
+    Returns
+    -------
+    dict[str, Any]
+        The index that was written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ValueError
+        If every is less than 1.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.index import build_csv_index
+    >>>
+    >>> index = asyncio.run(build_csv_index('data/cities.csv', every=50))
+    >>> index['rows'], index['offsets']
+    (128, [48, 1799, 3617])
+    """
+    _check_every(every)
+    loop = _asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _build_index, path, every, _index_path(path, index_path))
+
+
+async def load_csv_index(
+    path: str,
+    index_path: str | None = None
+) -> CsvIndex | None:
+    """Load the sidecar index of a CSV by path if it is still valid.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    index_path : str | None, optional
+        Path of the index file, defaults to path + '.idx'.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The index, or None if it is missing or the CSV file's size or
+        modification time changed since it was built.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.index import load_csv_index
+    >>>
+    >>> asyncio.run(load_csv_index('data/cities.csv'))['rows']
+    128
+    """
+    loop = _asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _load_index, path, _index_path(path, index_path))
+
+
+async def csv_to_records_range(
+    path: str,
+    start_row=0,
+    stop_row: int | None = None,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | None = None,
+    every=1000,
+    index_path: str | None = None
+) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+    """Asynchronously read records start_row up to stop_row of a CSV by path.
+
+    Seeks straight to the nearest indexed record before start_row, building
+    the sidecar index first if it is missing or stale. Rows are counted from
+    0 after the header and blank lines are skipped, as in csv_to_records.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    start_row : int, optional
+        Index of the first record to yield.
+    stop_row : int | None, optional
+        Index of the record to stop before, None reads to the end.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | None, optional
+        Column type plan, see convert.compile_schema. None converts every
+        value with convert_str.
+    every : int, optional
+        Record interval used if the index has to be built, at least 1.
+    index_path : str | None, optional
+        Path of the index file, defaults to path + '.idx'.
+
+    Returns
+    -------
+    AsyncGenerator[dict[str, Any]]
+        An async generator that yields each CSV row in range as a dict.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ValueError
+        If every is less than 1.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.index import csv_to_records_range
+    >>>
+    >>> async def read_page(path: str, page: int, size: int) -> list[dict]:
+    >>>     return [row async for row in csv_to_records_range(path, page * size, (page + 1) * size)]
+    >>>
+    >>> asyncio.run(read_page('data/cities.csv', 1, 2))
+    [{'LatD': 46, 'LatM': 35, 'LatS': 59, 'NS': 'N', 'LonD': 120, 'LonM': 30,
+      'LonS': 36, 'EW': 'W', 'City': 'Yakima', 'State': 'WA'},
+     {'LatD': 42, 'LatM': 16, 'LatS': 12, 'NS': 'N', 'LonD': 71, 'LonM': 48,
+      'LonS': 0, 'EW': 'W', 'City': 'Worcester', 'State': 'MA'}]
+    """
+    _check_every(every)
+    index = await load_csv_index(path, index_path)
+    if index is None:
+        index = await build_csv_index(path, every, index_path)
+    if stop_row is None or stop_row > index['rows']:
+        stop_row = index['rows']
+    if start_row >= stop_row:
+        return
+    slot = start_row // index['every']
+    row = slot * index['every']
+    async with _aiofiles.open(path, mode='r', encoding=encoding, newline='') as afp:
+        headers = await _csv_file_headers(afp, delimiter)
+        if schema is None:
+            converters = [_convert_str] * len(headers)
+        else:
+            converters = _compile_schema(headers, schema)
+        width = len(headers)
+        await afp.seek(index['offsets'][slot])
+        async for values in _aiocsv.AsyncReader(afp, delimiter=delimiter):
+            if not values:
+                continue
+            if row >= start_row:
+                yield _schema_record(headers, converters, width, values)
+            row += 1
+            if row >= stop_row:
+                break
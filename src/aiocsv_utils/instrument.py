@@ -0,0 +1,113 @@
+import asyncio as _asyncio
+import time as _time
+import typing as _typing
+
+
+class ReadStats:
+    """Counters collected while a reader runs.
+
+    Attributes
+    ----------
+    rows : int
+        Number of non-blank rows parsed, including rows rejected by where.
+    convert_seconds : float
+        Time spent converting rows into records.
+    io_wait_seconds : float
+        Time spent awaiting file reads that went to the thread pool.
+    max_slice_seconds : float
+        Longest stretch the reader held the event loop without yielding,
+        including time the consumer spent between records.
+    slices : int
+        Number of times the reader yielded the event loop.
+    elapsed_seconds : float
+        Wall time from the first read until the reader finished.
+    """
+    __slots__ = ('rows', 'convert_seconds', 'io_wait_seconds', 'max_slice_seconds', 'slices', 'elapsed_seconds')
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.convert_seconds = 0.0
+        self.io_wait_seconds = 0.0
+        self.max_slice_seconds = 0.0
+        self.slices = 0
+        self.elapsed_seconds = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'ReadStats({fields})'
+
+
+class SliceMonitor:
+    """Async file wrapper that times reads and bounds event-loop slices.
+
+    A read counts as I/O wait, and ends the current slice, only if it
+    actually suspended to the event loop. Reads served from a BlockReader's
+    memory buffer do not.
+
+    Parameters
+    ----------
+    async_file : Any
+        Async file object with an async read method.
+    time_slice : float | None, optional
+        Milliseconds a slice may last before pause yields to the event loop.
+        None never yields on its own.
+    """
+    def __init__(self, async_file: _typing.Any, time_slice: float | None = None) -> None:
+        self._file = async_file
+        self.budget = None if time_slice is None else time_slice / 1000
+        self.stats = ReadStats()
+        self.started = _time.perf_counter()
+        self.slice_started = self.started
+
+    def __getattr__(self, name: str) -> _typing.Any:
+        return getattr(self._file, name)
+
+    def _end_slice(self, now: float, resumed: float) -> None:
+        self.stats.max_slice_seconds = max(self.stats.max_slice_seconds, now - self.slice_started)
+        self.stats.slices += 1
+        self.slice_started = resumed
+
+    async def read(self, size=-1) -> str:
+        suspended: list[bool] = []
+        handle = _asyncio.get_running_loop().call_soon(suspended.append, True)
+        start = _time.perf_counter()
+        data = await self._file.read(size)
+        if suspended:
+            end = _time.perf_counter()
+            self.stats.io_wait_seconds += end - start
+            self._end_slice(start, end)
+        else:
+            handle.cancel()
+        return data
+
+    def convert(
+        self,
+        build: _typing.Callable[[list[str]], _typing.Any],
+        row: list[str]
+    ) -> _typing.Any:
+        """Call build(row), counting the row and timing the conversion."""
+        start = _time.perf_counter()
+        record = build(row)
+        self.stats.convert_seconds += _time.perf_counter() - start
+        self.stats.rows += 1
+        return record
+
+    def due(self) -> bool:
+        """Whether the current slice has used up its time budget."""
+        return self.budget is not None and _time.perf_counter() - self.slice_started >= self.budget
+
+    async def pause(self) -> None:
+        """Yield to the event loop and start a new slice."""
+        now = _time.perf_counter()
+        await _asyncio.sleep(0)
+        self._end_slice(now, _time.perf_counter())
+
+    def finish(self) -> ReadStats:
+        """Close the last slice and return the collected stats."""
+        now = _time.perf_counter()
+        self.stats.max_slice_seconds = max(self.stats.max_slice_seconds, now - self.slice_started)
+        self.stats.elapsed_seconds = now - self.started
+        return self.stats
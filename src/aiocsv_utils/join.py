@@ -0,0 +1,279 @@
+import asyncio as _asyncio
+import functools as _functools
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import typing as _typing
+
+from .compression import open_csv as _open_csv
+from .convert import Schema as _Schema
+from .read import csv_headers as _csv_headers
+from .read import csv_schema as _csv_schema
+from .read import csv_to_records_chunks as _csv_to_records_chunks
+from .read import column_index as _column_index
+from .write import create_csv as _create_csv
+from .write import serialize_records as _serialize_records
+from .write import write_csv_chunks as _write_csv_chunks
+from .write import write_csv_file_chunks as _write_csv_file_chunks
+
+JOINS = ('inner', 'left')
+"""Supported join types."""
+
+PARTITIONS = 16
+"""Default number of spill partitions per side."""
+
+_Index = dict[tuple, list[tuple]]
+
+
+class _Sides(_typing.NamedTuple):
+    on: list[str]
+    left: list[str]
+    right: list[str]
+    right_fields: list[str]
+    right_names: list[str]
+
+    @property
+    def headers(self) -> list[str]:
+        return self.left + self.right_names
+
+
+def _sides(left: list[str], right: list[str], on: list[str], suffix: str) -> _Sides:
+    for column in on:
+        _column_index(left, column)
+        _column_index(right, column)
+    right_fields = [column for column in right if column not in on]
+    taken = set(left)
+    right_names = []
+    for column in right_fields:
+        name = column
+        while name in taken:
+            name += suffix
+        taken.add(name)
+        right_names.append(name)
+    return _Sides(on, left, right, right_fields, right_names)
+
+
+def _key(record: dict[str, _typing.Any], on: list[str]) -> tuple | None:
+    key = tuple(record.get(column) for column in on)
+    if any(value is None or value == '' for value in key):
+        return None
+    return key
+
+
+def _add(index: _Index, chunk: list[dict[str, _typing.Any]], sides: _Sides) -> int:
+    added = 0
+    for record in chunk:
+        key = _key(record, sides.on)
+        if key is None:
+            continue
+        index.setdefault(key, []).append(tuple(record.get(column) for column in sides.right_fields))
+        added += 1
+    return added
+
+
+def _probe(
+    index: _Index,
+    chunk: list[dict[str, _typing.Any]],
+    sides: _Sides,
+    how: str
+) -> list[dict[str, _typing.Any]]:
+    joined = []
+    missing = [(None,) * len(sides.right_names)] if how == 'left' else []
+    for record in chunk:
+        key = _key(record, sides.on)
+        matches = index.get(key, missing) if key is not None else missing
+        for values in matches:
+            joined.append({**record, **dict(zip(sides.right_names, values))})
+    return joined
+
+
+class _Partitions:
+    """Spills records of one side into UTF-8 files by hash of their join key."""
+    def __init__(self, directory: str, name: str, headers: list[str], on: list[str], count: int) -> None:
+        self.paths = [_os.path.join(directory, f'{name}-{number}.csv') for number in range(count)]
+        self.headers = headers
+        self.on = on
+        self.count = count
+        self.created = False
+
+    async def create(self) -> None:
+        header = _serialize_records([dict(zip(self.headers, self.headers))], self.headers)
+        for path in self.paths:
+            async with _open_csv(path, 'w', 'utf-8', '', None) as f:
+                await f.write(header)
+        self.created = True
+
+    async def add(self, records: _typing.Iterable[dict[str, _typing.Any]]) -> None:
+        if not self.created:
+            await self.create()
+        buckets: list[list[dict[str, _typing.Any]]] = [[] for _ in range(self.count)]
+        for record in records:
+            key = _key(record, self.on)
+            buckets[hash(key) % self.count].append(record)
+        for path, bucket in zip(self.paths, buckets):
+            if bucket:
+                async with _open_csv(path, 'a', 'utf-8', '', None) as f:
+                    await _write_csv_file_chunks(f, [bucket], self.headers)
+
+
+async def join_csv(
+    left: str,
+    right: str,
+    output: str,
+    on: str | _typing.Sequence[str],
+    how: _typing.Literal['inner', 'left'] = 'inner',
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    right_schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    chunk_size=10_000,
+    max_rows: int | None = None,
+    partitions=PARTITIONS,
+    temp_dir: str | None = None,
+    suffix='_right',
+    compression: str | None = 'infer'
+) -> int:
+    """Join two CSV files by path on key columns into a new CSV, streaming the larger one.
+
+    The right file, the smaller side, is loaded into a hash index of value
+    tuples keyed by the join columns. The left file is then streamed through
+    in chunks, and joined chunks are written with write.write_csv_chunks.
+    Keys are compared after type conversion, so both sides should use
+    compatible schemas. Records with a missing ('' or None) key field never
+    match. If the right file has more than max_rows records, both sides are
+    spilled into partitions by hash of their key and joined one partition at
+    a time, which changes the output order.
+
+    Parameters
+    ----------
+    left : str
+        File path to the CSV file streamed through, every record of which is
+        kept with how='left'.
+    right : str
+        File path to the CSV file held in memory.
+    output : str
+        File path of the joined CSV file, replaced if it exists.
+    on : str | Sequence[str]
+        Column or columns to join on, present in both files.
+    how : 'inner' | 'left', optional
+        Keep only left records with a match, or every left record with
+        empty right columns when none matches.
+    encoding : str, optional
+        The encoding format.
+    delimiter : str, optional
+        CSV file delimiter character of both inputs.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan of the left file, see read.csv_to_records. None
+        converts every value with convert_str.
+    right_schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan of the right file.
+    sample_size : int, optional
+        Number of rows used to infer a schema.
+    chunk_size : int, optional
+        Number of records read and written at a time.
+    max_rows : int | None, optional
+        Maximum number of right records held in memory before spilling to
+        partitions. None never spills.
+    partitions : int, optional
+        Number of spill partitions per side.
+    temp_dir : str | None, optional
+        Directory for the spilled partitions, defaults to the system temp dir.
+    suffix : str, optional
+        Appended to right column names that are also left column names.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension, for the inputs and output.
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a file does not exist.
+    ValueError
+        If a column in on is missing from either file or how is unsupported.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.join import join_csv
+    >>>
+    >>> asyncio.run(join_csv('data/orders.csv', 'data/customers.csv', 'data/orders_customers.csv',
+    >>>                      'customer_id', 'left', max_rows=1_000_000))
+    """
+    if how not in JOINS:
+        raise ValueError(f'Unsupported join: {how!r}')
+    on = [on] if isinstance(on, str) else list(on)
+    options = {'encoding': encoding, 'delimiter': delimiter, 'compression': compression}
+    sides = _sides(await _csv_headers(left, **options), await _csv_headers(right, **options), on, suffix)
+    if schema == 'infer':
+        schema = await _csv_schema(left, sample_size=sample_size, **options)
+    if right_schema == 'infer':
+        right_schema = await _csv_schema(right, sample_size=sample_size, **options)
+    await _create_csv(output, sides.headers, compression)
+    index: _Index = {}
+    rows = 0
+    right_chunks = _csv_to_records_chunks(right, chunk_size, schema=right_schema, **options)
+    try:
+        async for chunk in right_chunks:
+            rows += _add(index, chunk, sides)
+            if max_rows is not None and rows > max_rows:
+                break
+        else:
+            return await _join_chunks(output, index, _csv_to_records_chunks(left, chunk_size, schema=schema, **options),
+                                      sides, how, compression)
+        loop = _asyncio.get_running_loop()
+        directory = await loop.run_in_executor(None, _functools.partial(_tempfile.mkdtemp, dir=temp_dir))
+        try:
+            right_parts = _Partitions(directory, 'right', sides.right, on, partitions)
+            await right_parts.add({**dict(zip(on, key)), **dict(zip(sides.right_fields, values))}
+                                  for key, matches in index.items() for values in matches)
+            index.clear()
+            async for chunk in right_chunks:
+                await right_parts.add(chunk)
+            left_parts = _Partitions(directory, 'left', sides.left, on, partitions)
+            await left_parts.create()
+            async for chunk in _csv_to_records_chunks(left, chunk_size, schema=schema, **options):
+                await left_parts.add(chunk)
+            count = 0
+            for right_path, left_path in zip(right_parts.paths, left_parts.paths):
+                async for chunk in _csv_to_records_chunks(right_path, chunk_size, schema=right_schema,
+                                                          encoding='utf-8', compression=None):
+                    _add(index, chunk, sides)
+                count += await _join_chunks(output, index, _csv_to_records_chunks(
+                    left_path, chunk_size, schema=schema, encoding='utf-8', compression=None), sides, how, compression)
+                index.clear()
+            return count
+        finally:
+            await loop.run_in_executor(None, _functools.partial(_shutil.rmtree, directory, ignore_errors=True))
+    finally:
+        await right_chunks.aclose()
+
+
+async def _join_chunks(
+    output: str,
+    index: _Index,
+    chunks: _typing.AsyncGenerator[list[dict[str, _typing.Any]], None],
+    sides: _Sides,
+    how: str,
+    compression: str | None
+) -> int:
+    count = 0
+
+    async def joined() -> _typing.AsyncGenerator[list[dict[str, _typing.Any]], None]:
+        nonlocal count
+        async for chunk in chunks:
+            records = _probe(index, chunk, sides, how)
+            if records:
+                count += len(records)
+                yield records
+    try:
+        await _write_csv_chunks(output, joined(), sides.headers, compression)
+    finally:
+        await chunks.aclose()
+    return count
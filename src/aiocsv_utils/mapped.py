@@ -0,0 +1,353 @@
+import asyncio as _asyncio
+import csv as _csv
+import io as _io
+import mmap as _mmap
+import os as _os
+import typing as _typing
+
+from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import infer_schema as _infer_schema
+from .convert import compile_schema as _compile_schema
+from .read import Where as _Where
+from .read import column_index as _column_index
+from .read import compile_where as _compile_where
+from .read import record_builder as _record_builder
+from .scan import BLOCK_SIZE
+from .scan import next_record_boundary as _next_record_boundary
+from .scan import quote_parity as _quote_parity
+
+
+def _open_map(path: str) -> tuple[_typing.BinaryIO, _mmap.mmap | None]:
+    file = open(path, 'rb')
+    try:
+        if _os.fstat(file.fileno()).st_size == 0:
+            return file, None
+        buffer = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+    except BaseException:
+        file.close()
+        raise
+    if hasattr(buffer, 'madvise') and hasattr(_mmap, 'MADV_SEQUENTIAL'):
+        buffer.madvise(_mmap.MADV_SEQUENTIAL)
+    return file, buffer
+
+
+def _close_map(file: _typing.BinaryIO, buffer: _mmap.mmap | None) -> None:
+    if buffer is not None:
+        buffer.close()
+    file.close()
+
+
+def _block_end(buffer: _mmap.mmap, start: int, block_size: int) -> int:
+    target = start + max(block_size, 1)
+    if target >= len(buffer):
+        return len(buffer)
+    return _next_record_boundary(buffer, target, _quote_parity(buffer, start, target))
+
+
+def _parse_quoted(data: bytes, encoding: str, delimiter: str) -> _typing.Iterator[list[str]]:
+    for row in _csv.reader(_io.StringIO(data.decode(encoding), newline=''), delimiter=delimiter):
+        if row:
+            yield row
+
+
+def _split_records(
+    data: bytes,
+    encoding: str,
+    delimiter: str
+) -> _typing.Iterator[list[bytes] | list[str]]:
+    """Yield the non-blank records of a block aligned to record boundaries.
+
+    Records without a quote character are split on the raw bytes and yielded
+    as undecoded fields. Runs of quoted records are decoded and parsed with
+    the csv module, and yielded as str fields.
+    """
+    separator = delimiter.encode(encoding)
+    quoted = -1
+    in_quotes = False
+    position = 0
+    for line in data.split(b'\n'):
+        start = position
+        position += len(line) + 1
+        if in_quotes or b'"' in line:
+            if quoted < 0:
+                quoted = start
+            if line.count(b'"') & 1:
+                in_quotes = not in_quotes
+            continue
+        if quoted >= 0:
+            yield from _parse_quoted(data[quoted:start], encoding, delimiter)
+            quoted = -1
+        if line[-1:] == b'\r':
+            line = line[:-1]
+        if line:
+            yield line.split(separator)
+    if quoted >= 0:
+        yield from _parse_quoted(data[quoted:], encoding, delimiter)
+
+
+def _decode(row: list[bytes] | list[str], encoding: str) -> list[str]:
+    if isinstance(row[0], bytes):
+        return [field.decode(encoding) for field in row]
+    return row
+
+
+def _prepare(
+    path: str,
+    encoding: str,
+    delimiter: str,
+    sample_size: int,
+    infer: bool,
+    block_size: int
+) -> tuple[_typing.BinaryIO, _mmap.mmap | None, list[str] | None, int, list[list[str]]]:
+    file, buffer = _open_map(path)
+    try:
+        if buffer is None:
+            return file, buffer, None, 0, []
+        header_end = _next_record_boundary(buffer, 0)
+        rows = _csv.reader(_io.StringIO(buffer[:header_end].decode(encoding), newline=''), delimiter=delimiter)
+        headers = next(rows, None)
+        sample: list[list[str]] = []
+        start = header_end
+        while infer and len(sample) < sample_size and start < len(buffer):
+            stop = _block_end(buffer, start, block_size)
+            for row in _split_records(buffer[start:stop], encoding, delimiter):
+                sample.append(_decode(row, encoding))
+                if len(sample) == sample_size:
+                    break
+            start = stop
+    except BaseException:
+        _close_map(file, buffer)
+        raise
+    return file, buffer, headers, header_end, sample
+
+
+def _mapped_builder(
+    headers: list[str],
+    converters: list[_typing.Callable[[str], _typing.Any]],
+    columns: _typing.Sequence[str] | None,
+    where: _Where | None,
+    encoding: str
+) -> _typing.Callable[[list[bytes] | list[str]], dict[str, _typing.Any] | None]:
+    """Compile a function turning a split record into a record, or None if where rejects it.
+
+    Full-width undecoded records only decode the fields tested by where and
+    the fields that end up in the record. Anything else is decoded whole and
+    handed to the read module's builder, so results match csv_to_records.
+    """
+    build = _record_builder(headers, converters, columns, where)
+    width = len(headers)
+    names = headers if columns is None else columns
+    selected = [(column, converters[index], index)
+                for column, index in ((column, _column_index(headers, column)) for column in names)]
+    match = None if where is None else _compile_where(headers, where)
+    tested = [] if where is None else sorted({_column_index(headers, column) for column in where})
+
+    def build_fields(row: list[bytes] | list[str]) -> dict[str, _typing.Any] | None:
+        if len(row) != width or not isinstance(row[0], bytes):
+            return build(_decode(row, encoding))
+        if match is not None:
+            raw: list[_typing.Any] = [None] * width
+            for index in tested:
+                raw[index] = row[index].decode(encoding)
+            if not match(raw):
+                return None
+        return {column: convert(row[index].decode(encoding)) for column, convert, index in selected}
+    return build_fields
+
+
+def _parse_block(
+    buffer: _mmap.mmap,
+    start: int,
+    block_size: int,
+    build: _typing.Callable[[list[bytes] | list[str]], dict[str, _typing.Any] | None],
+    encoding: str,
+    delimiter: str
+) -> tuple[list[dict[str, _typing.Any]], int]:
+    stop = _block_end(buffer, start, block_size)
+    records = []
+    for row in _split_records(buffer[start:stop], encoding, delimiter):
+        record = build(row)
+        if record is not None:
+            records.append(record)
+    return records, stop
+
+
+async def _mapped_blocks(
+    path: str,
+    encoding: str,
+    delimiter: str,
+    schema: _Schema | _typing.Literal['infer'] | None,
+    sample_size: int,
+    columns: _typing.Sequence[str] | None,
+    where: _Where | None,
+    block_size: int
+) -> _typing.AsyncGenerator[list[dict[str, _typing.Any]], None]:
+    loop = _asyncio.get_running_loop()
+    file, buffer, headers, start, sample = await loop.run_in_executor(
+        None, _prepare, path, encoding, delimiter, sample_size, schema == 'infer', block_size)
+    try:
+        if headers is None:
+            return
+        if schema == 'infer':
+            schema = _infer_schema(headers, sample)
+        if schema is None:
+            converters = [_convert_str] * len(headers)
+        else:
+            converters = _compile_schema(headers, schema)
+        build = _mapped_builder(headers, converters, columns, where, encoding)
+        while start < len(buffer):
+            records, start = await loop.run_in_executor(
+                None, _parse_block, buffer, start, block_size, build, encoding, delimiter)
+            if records:
+                yield records
+    finally:
+        _close_map(file, buffer)
+
+
+async def csv_to_records_mapped(
+    path: str,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: _Where | None = None,
+    block_size=BLOCK_SIZE
+) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+    """Asynchronously read a local CSV by path through mmap and async yield each record.
+
+    The file is memory-mapped instead of copied through aiofiles and decoded
+    as a whole. Each block of about block_size bytes is split into records
+    on the raw buffer in the thread pool, and only the fields that are tested
+    by where or returned are decoded. Records match csv_to_records.
+
+    Parameters
+    ----------
+    path : str
+        File path to an uncompressed local CSV file.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see read.csv_file_to_records.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only decode, convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry, see
+        read.csv_file_to_records.
+    block_size : int, optional
+        Approximate number of bytes parsed per thread-pool call.
+
+    Returns
+    -------
+    AsyncGenerator[dict[str, Any]]
+        An async generator that yields each CSV row as a dict.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.mapped import csv_to_records_mapped
+    >>>
+    >>> async def read_first_record() -> dict | None:
+    >>>     async for row in csv_to_records_mapped('data/cities.csv', columns=['City', 'State']):
+    >>>         return row
+    >>>
+    >>> asyncio.run(read_first_record())
+    {'City': 'Youngstown', 'State': 'OH'}
+    """
+    blocks = _mapped_blocks(path, encoding, delimiter, schema, sample_size, columns, where, block_size)
+    try:
+        async for records in blocks:
+            for record in records:
+                yield record
+    finally:
+        await blocks.aclose()
+
+
+async def csv_to_records_chunks_mapped(
+    path: str,
+    chunk_size: int,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: _Where | None = None,
+    block_size=BLOCK_SIZE
+) -> _typing.AsyncGenerator[list[dict[str, _typing.Any]], None]:
+    """Asynchronously read a local CSV by path through mmap and async yield chunks of records.
+
+    See csv_to_records_mapped for how the file is read. Every chunk holds
+    chunk_size records except the last, as in csv_to_records_chunks.
+
+    Parameters
+    ----------
+    path : str
+        File path to an uncompressed local CSV file.
+    chunk_size : int
+        Number of records per chunk.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see read.csv_file_to_records.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only decode, convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry, see
+        read.csv_file_to_records.
+    block_size : int, optional
+        Approximate number of bytes parsed per thread-pool call.
+
+    Returns
+    -------
+    AsyncGenerator[list[dict[str, Any]]]
+        An async generator that yields chunks of CSV rows as lists of dicts.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.mapped import csv_to_records_chunks_mapped
+    >>>
+    >>> async def count_records(path: str) -> int:
+    >>>     count = 0
+    >>>     async for chunk in csv_to_records_chunks_mapped(path, 1000):
+    >>>         count += len(chunk)
+    >>>     return count
+    >>>
+    >>> asyncio.run(count_records('data/cities.csv'))
+    128
+    """
+    blocks = _mapped_blocks(path, encoding, delimiter, schema, sample_size, columns, where, block_size)
+    pending: list[dict[str, _typing.Any]] = []
+    try:
+        async for records in blocks:
+            pending.extend(records)
+            if len(pending) >= chunk_size:
+                full = len(pending) - len(pending) % chunk_size
+                for start in range(0, full, chunk_size):
+                    yield pending[start:start + chunk_size]
+                del pending[:full]
+        if pending:
+            yield pending
+    finally:
+        await blocks.aclose()
@@ -0,0 +1,304 @@
+import asyncio as _asyncio
+import glob as _glob
+import typing as _typing
+
+from .compression import BLOCK_SIZE as _BLOCK_SIZE
+from .convert import Schema as _Schema
+from .read import Where as _Where
+from .read import csv_headers as _csv_headers
+from .read import csv_schema as _csv_schema
+from .read import csv_to_records_chunks as _csv_to_records_chunks
+
+Paths = str | _typing.Iterable[str]
+"""A glob pattern, or an iterable of file paths read in the given order."""
+
+_DONE = object()
+
+
+def expand_paths(paths: Paths) -> list[str]:
+    """Resolve a glob pattern, sorted, or an iterable of paths to a list of paths.
+
+    Example
+    -------
+    >>> from aiocsv_utils.multi import expand_paths
+    >>>
+    >>> expand_paths('data/cities*.csv')
+    ['data/cities.csv', 'data/cities_empty.csv']
+    """
+    if isinstance(paths, str):
+        return sorted(_glob.glob(paths, recursive=True))
+    return list(paths)
+
+
+async def _headers(
+    path: str,
+    encoding: str,
+    delimiter: str,
+    compression: str | None,
+    block_size: int | None
+) -> list[str] | None:
+    try:
+        return await _csv_headers(path, encoding=encoding, delimiter=delimiter,
+                                  compression=compression, block_size=block_size)
+    except StopAsyncIteration:
+        return None
+
+
+class _Shard:
+    __slots__ = ('path', 'queue')
+
+    def __init__(self, path: str, buffer_size: int) -> None:
+        self.path = path
+        self.queue: _asyncio.Queue = _asyncio.Queue(buffer_size)
+
+
+async def csv_to_records_chunks_multi(
+    paths: Paths,
+    chunk_size: int,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: _Where | None = None,
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE,
+    max_open=8,
+    ordered=True,
+    buffer_size=2,
+    check_headers=True
+) -> _typing.AsyncGenerator[tuple[str, list[dict[str, _typing.Any]]], None]:
+    """Asynchronously read many CSV files and async yield their chunks of records.
+
+    At most max_open files are open and read at once, each with
+    csv_to_records_chunks. A file stops reading once buffer_size of its
+    chunks wait to be consumed, so a slow consumer never piles up records
+    and a fast file never starves the others.
+
+    Parameters
+    ----------
+    paths : str | Iterable[str]
+        A glob pattern, whose matches are read in sorted order, or file paths.
+    chunk_size : int
+        Number of records per chunk, chunks never span two files.
+    encoding : str, optional
+        The encoding format.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see read.csv_file_to_records. 'infer' infers one
+        plan from the first file and applies it to every file.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry, see
+        read.csv_file_to_records.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from each file's extension.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+    max_open : int, optional
+        Maximum number of files read at once.
+    ordered : bool, optional
+        Yield all chunks of each file before the next file's, in path order.
+        False yields chunks as soon as any file has one ready.
+    buffer_size : int, optional
+        Maximum number of chunks read ahead per open file.
+    check_headers : bool, optional
+        Compare every file's csv_headers with the first file's before
+        reading it. Files with no header row are skipped.
+
+    Returns
+    -------
+    AsyncGenerator[tuple[str, list[dict[str, Any]]]]
+        An async generator that yields (path, chunk) pairs.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a file does not exist.
+    ValueError
+        If check_headers is True and a file's headers differ from the first file's.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.multi import csv_to_records_chunks_multi
+    >>>
+    >>> async def count_records(pattern: str) -> dict[str, int]:
+    >>>     counts = {}
+    >>>     async for path, chunk in csv_to_records_chunks_multi(pattern, 1000, ordered=False):
+    >>>         counts[path] = counts.get(path, 0) + len(chunk)
+    >>>     return counts
+    >>>
+    >>> asyncio.run(count_records('data/cities*.csv'))
+    {'data/cities.csv': 128}
+    """
+    shards = [_Shard(path, buffer_size) for path in expand_paths(paths)]
+    if not shards:
+        return
+    if schema == 'infer':
+        schema = await _csv_schema(shards[0].path, encoding=encoding, delimiter=delimiter,
+                                   sample_size=sample_size, compression=compression)
+    reference = None
+    if check_headers:
+        reference = await _headers(shards[0].path, encoding, delimiter, compression, block_size)
+    ready: _asyncio.Queue[_Shard] = _asyncio.Queue()
+    slots = _asyncio.Semaphore(max(max_open, 1))
+    tasks: set[_asyncio.Task] = set()
+
+    async def put(shard: _Shard, item: _typing.Any) -> None:
+        await shard.queue.put(item)
+        # Only the unordered merge drains ready, ordered reads each shard's queue in turn.
+        if not ordered:
+            ready.put_nowait(shard)
+
+    async def read(shard: _Shard) -> None:
+        nonlocal reference
+        outcome = _DONE
+        try:
+            headers = None
+            if check_headers:
+                headers = await _headers(shard.path, encoding, delimiter, compression, block_size)
+                if headers and not reference:
+                    reference = headers
+                elif headers and headers != reference:
+                    raise ValueError(f'Headers of {shard.path!r} do not match {shards[0].path!r}: '
+                                     f'{headers!r} != {reference!r}')
+            if headers or not check_headers:
+                chunks = _csv_to_records_chunks(
+                    shard.path, chunk_size, encoding=encoding, delimiter=delimiter, schema=schema,
+                    columns=columns, where=where, compression=compression, block_size=block_size)
+                async for chunk in chunks:
+                    await put(shard, chunk)
+        except Exception as error:
+            outcome = error
+        finally:
+            slots.release()
+        # The file is closed by now, so waiting for queue space no longer holds a slot.
+        await put(shard, outcome)
+
+    async def launch() -> None:
+        for shard in shards:
+            await slots.acquire()
+            task = _asyncio.ensure_future(read(shard))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    launcher = _asyncio.ensure_future(launch())
+    try:
+        if ordered:
+            for shard in shards:
+                while (item := await shard.queue.get()) is not _DONE:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield shard.path, item
+        else:
+            remaining = len(shards)
+            while remaining:
+                shard = await ready.get()
+                item = shard.queue.get_nowait()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield shard.path, item
+    finally:
+        launcher.cancel()
+        pending = [launcher, *tasks]
+        for task in pending:
+            task.cancel()
+        await _asyncio.gather(*pending, return_exceptions=True)
+
+
+async def csv_to_records_multi(
+    paths: Paths,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: _Where | None = None,
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE,
+    max_open=8,
+    ordered=True,
+    chunk_size=1000,
+    buffer_size=2,
+    check_headers=True
+) -> _typing.AsyncGenerator[tuple[str, dict[str, _typing.Any]], None]:
+    """Asynchronously read many CSV files and async yield each record with its source path.
+
+    See csv_to_records_chunks_multi for how files are opened and merged.
+
+    Parameters
+    ----------
+    paths : str | Iterable[str]
+        A glob pattern, whose matches are read in sorted order, or file paths.
+    encoding : str, optional
+        The encoding format.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see csv_to_records_chunks_multi.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer'.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+    max_open : int, optional
+        Maximum number of files read at once.
+    ordered : bool, optional
+        Yield each file's records before the next file's, in path order.
+    chunk_size : int, optional
+        Number of records handed over from a file at a time.
+    buffer_size : int, optional
+        Maximum number of chunks read ahead per open file.
+    check_headers : bool, optional
+        Compare every file's headers with the first file's.
+
+    Returns
+    -------
+    AsyncGenerator[tuple[str, dict[str, Any]]]
+        An async generator that yields (path, record) pairs.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a file does not exist.
+    ValueError
+        If check_headers is True and a file's headers differ from the first file's.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.multi import csv_to_records_multi
+    >>>
+    >>> async def read_first_record() -> tuple[str, dict] | None:
+    >>>     async for path, row in csv_to_records_multi(['data/cities.csv', 'data/cities.csv.gz']):
+    >>>         return path, row
+    >>>
+    >>> asyncio.run(read_first_record())
+    ('data/cities.csv', {'LatD': 41, 'LatM': 5, 'LatS': 59, 'NS': 'N', 'LonD': 80, 'LonM': 39,
+                         'LonS': 0, 'EW': 'W', 'City': 'Youngstown', 'State': 'OH'})
+    """
+    chunks = csv_to_records_chunks_multi(
+        paths, chunk_size, encoding, delimiter, schema, sample_size, columns, where,
+        compression, block_size, max_open, ordered, buffer_size, check_headers)
+    try:
+        async for path, chunk in chunks:
+            for record in chunk:
+                yield path, record
+    finally:
+        await chunks.aclose()
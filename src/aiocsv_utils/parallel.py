@@ -0,0 +1,279 @@
+import asyncio as _asyncio
+import collections as _collections
+import concurrent.futures as _futures
+import csv as _csv
+import functools as _functools
+import io as _io
+import multiprocessing as _multiprocessing
+import os as _os
+import typing as _typing
+
+from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import compile_schema as _compile_schema
+from .read import csv_schema as _csv_schema
+from .read import schema_record as _schema_record
+from .scan import split_ranges as _split_ranges
+
+RANGE_SIZE = 8 << 20
+"""Default number of bytes parsed per worker task."""
+
+
+def mp_context() -> _typing.Any:
+    """Multiprocessing context to start worker processes with.
+
+    Forking a process that runs thread-pool threads (aiofiles,
+    run_in_executor) can deadlock the child, so workers are started with
+    forkserver where available and spawn otherwise, never fork.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        Context for ProcessPoolExecutor's mp_context.
+
+    Example
+    -------
+    >>> import concurrent.futures
+    >>>
+    >>> from aiocsv_utils.parallel import mp_context
+    >>>
+    >>> pool = concurrent.futures.ProcessPoolExecutor(2, mp_context=mp_context())
+    """
+    methods = _multiprocessing.get_all_start_methods()
+    return _multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def read_range(path: str, start: int, stop: int, encoding: str) -> str:
+    """Read and decode the bytes of a file from start up to stop.
+
+    Parameters
+    ----------
+    path : str
+        File path to an uncompressed file.
+    start : int
+        Byte offset of the first byte read.
+    stop : int
+        Byte offset after the last byte read, such as a range end from
+        scan.split_ranges.
+    encoding : str
+        The encoding format.
+
+    Returns
+    -------
+    str
+        Decoded text of the range.
+
+    Example
+    -------
+    >>> from aiocsv_utils.parallel import read_range
+    >>>
+    >>> read_range('data/cities.csv', 0, 9, 'utf-8')
+    'LatD,LatM'
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return file.read(stop - start).decode(encoding)
+
+
+def _parse_range(
+    path: str,
+    start: int,
+    stop: int,
+    headers: list[str],
+    schema: _Schema | None,
+    encoding: str,
+    delimiter: str
+) -> list[dict[str, _typing.Any]]:
+    rows = _csv.reader(_io.StringIO(read_range(path, start, stop, encoding), newline=''), delimiter=delimiter)
+    if schema is None:
+        converters = [_convert_str] * len(headers)
+    else:
+        converters = _compile_schema(headers, schema)
+    width = len(headers)
+    return [_schema_record(headers, converters, width, row) for row in rows if row]
+
+
+async def csv_to_records_chunks_parallel(
+    path: str,
+    chunk_size: int,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    max_workers: int | None = None,
+    range_size=RANGE_SIZE,
+    ordered=True,
+    executor: _futures.Executor | None = None
+) -> _typing.AsyncGenerator[list[dict[str, _typing.Any]], None]:
+    """Asynchronously parse a CSV by path in worker processes and async yield chunks of records.
+
+    The file is split into byte ranges aligned to record boundaries, quoted
+    newlines included, and each range is parsed and converted in a
+    ProcessPoolExecutor so the event loop only receives finished records.
+    Chunks hold at most chunk_size records and never span two ranges.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    chunk_size : int
+        Maximum number of records per chunk.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+        Callables in the plan must be picklable.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    max_workers : int | None, optional
+        Number of worker processes, defaults to the number of CPUs.
+    range_size : int, optional
+        Approximate number of bytes parsed per worker task.
+    ordered : bool, optional
+        Yield chunks in file order. False yields each range as soon as it
+        is parsed.
+    executor : Executor | None, optional
+        Executor to run the workers in, left running when done. A new
+        ProcessPoolExecutor using the forkserver (or spawn) start method
+        is used and shut down if None.
+
+    Returns
+    -------
+    AsyncGenerator[list[dict[str, Any]]]
+        An async generator that yields chunks of CSV rows as lists of dicts.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.parallel import csv_to_records_chunks_parallel
+    >>>
+    >>> async def count_records(path: str) -> int:
+    >>>     count = 0
+    >>>     async for chunk in csv_to_records_chunks_parallel(path, 1000, max_workers=4):
+    >>>         count += len(chunk)
+    >>>     return count
+    >>>
+    >>> asyncio.run(count_records('data/cities.csv'))
+    128
+    """
+    loop = _asyncio.get_running_loop()
+    (header_start, header_stop), ranges = await loop.run_in_executor(None, _split_ranges, path, range_size)
+    if header_stop == header_start:
+        return
+    if schema == 'infer':
+        schema = await _csv_schema(path, encoding=encoding, delimiter=delimiter, sample_size=sample_size)
+    header = await loop.run_in_executor(None, read_range, path, header_start, header_stop, encoding)
+    headers = next(_csv.reader(_io.StringIO(header, newline=''), delimiter=delimiter))
+    pool = executor if executor is not None else _futures.ProcessPoolExecutor(max_workers, mp_context=mp_context())
+    max_pending = 2 * (max_workers or _os.cpu_count() or 1)
+    pending: _collections.deque[_asyncio.Future] = _collections.deque()
+    remaining = iter(ranges)
+
+    def submit() -> bool:
+        span = next(remaining, None)
+        if span is None:
+            return False
+        pending.append(loop.run_in_executor(
+            pool, _parse_range, path, *span, headers, schema, encoding, delimiter))
+        return True
+
+    try:
+        while len(pending) < max_pending and submit():
+            pass
+        while pending:
+            if ordered:
+                future = pending.popleft()
+                records = await future
+            else:
+                done, _ = await _asyncio.wait(pending, return_when=_asyncio.FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+                records = future.result()
+            submit()
+            for start in range(0, len(records), chunk_size):
+                yield records[start:start + chunk_size]
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            # Workers left to exit on their own can hang interpreter shutdown,
+            # so join them in a thread rather than with shutdown(wait=False).
+            await loop.run_in_executor(None, _functools.partial(pool.shutdown, wait=True, cancel_futures=True))
+
+
+async def csv_to_records_parallel(
+    path: str,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    max_workers: int | None = None,
+    range_size=RANGE_SIZE,
+    ordered=True,
+    executor: _futures.Executor | None = None
+) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+    """Asynchronously parse a CSV by path in worker processes and async yield each record.
+
+    See csv_to_records_chunks_parallel for how the work is split.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan, see csv_to_records_chunks_parallel.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    max_workers : int | None, optional
+        Number of worker processes, defaults to the number of CPUs.
+    range_size : int, optional
+        Approximate number of bytes parsed per worker task.
+    ordered : bool, optional
+        Yield records in file order.
+    executor : Executor | None, optional
+        Executor to run the workers in, see csv_to_records_chunks_parallel.
+
+    Returns
+    -------
+    AsyncGenerator[dict[str, Any]]
+        An async generator that yields each CSV row as a dict.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.parallel import csv_to_records_parallel
+    >>>
+    >>> async def read_first_record() -> dict | None:
+    >>>     async for row in csv_to_records_parallel('data/cities.csv'):
+    >>>         return row
+    >>>
+    >>> asyncio.run(read_first_record())
+    {'LatD': 41, 'LatM': 5, 'LatS': 59, 'NS': 'N', 'LonD': 80, 'LonM': 39,
+     'LonS': 0, 'EW': 'W', 'City': 'Youngstown', 'State': 'OH'}
+    """
+    chunks = csv_to_records_chunks_parallel(
+        path, range_size, encoding, delimiter, schema, sample_size,
+        max_workers, range_size, ordered, executor)
+    async for chunk in chunks:
+        for record in chunk:
+            yield record
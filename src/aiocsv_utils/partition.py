@@ -0,0 +1,294 @@
+import asyncio as _asyncio
+import collections as _collections
+import collections.abc as _abc
+import csv as _csv
+import functools as _functools
+import io as _io
+import os as _os
+import re as _re
+import typing as _typing
+import zlib as _zlib
+
+from .write import CsvAppender as _CsvAppender
+from .write import create_csv as _create_csv
+
+PartitionBy = _typing.Union[str, _typing.Sequence[str], _typing.Callable[[_typing.Any], _typing.Any]]
+"""Column, columns or function giving the partition key of a record."""
+
+
+def _key_function(headers: list[str], partition_by: PartitionBy) -> _typing.Callable[[_typing.Any], _typing.Any]:
+    if callable(partition_by):
+        return partition_by
+    columns = [partition_by] if isinstance(partition_by, str) else list(partition_by)
+    for column in columns:
+        if column not in headers:
+            raise ValueError(f'Column {column!r} is not in the CSV headers.')
+    indexes = [headers.index(column) for column in columns]
+
+    def key(record: _typing.Any) -> _typing.Any:
+        if isinstance(record, _abc.Mapping):
+            values = [record.get(column) for column in columns]
+        else:
+            values = [record[index] for index in indexes]
+        return values[0] if len(values) == 1 else tuple(values)
+    return key
+
+
+# '%' is encoded too, so encoded names never collide.
+_UNSAFE = _re.compile(r'[%/\\\x00-\x1f\x7f]')
+
+
+def _partition_name(key: _typing.Any) -> str:
+    parts = key if isinstance(key, tuple) else (key,)
+    name = '-'.join('' if part is None else str(part) for part in parts)
+    name = _UNSAFE.sub(lambda match: f'%{ord(match.group()):02X}', name)
+    # Names that would point at the template's own or parent directory.
+    if name in ('.', '..'):
+        return name.replace('.', '%2E')
+    return name or '%'
+
+
+def _header_size(headers: list[str]) -> int:
+    buffer = _io.StringIO()
+    _csv.writer(buffer).writerow(headers)
+    return len(buffer.getvalue())
+
+
+class _Partition:
+    __slots__ = ('name', 'part', 'rows', 'size', 'path', 'appender')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.part = 0
+        self.rows = 0
+        self.size = 0
+        self.path: str | None = None
+        self.appender: _CsvAppender | None = None
+
+
+class PartitionedWriter:
+    """Write records to many CSV files split by a partition key, keeping a bounded pool of open files.
+
+    Each record is routed by partition_by, or to one of shards files by a
+    stable hash of its key, or round robin if partition_by is None. Each
+    partition writes through a write.CsvAppender, and at most max_open of
+    them are open at a time. The least recently used is flushed and closed
+    to make room, then reopened for append when it is written to again. The
+    first time a file is touched it is created, or replaced, with the header
+    row as in write.create_csv. A partition rolls over to its next part file
+    once it reaches max_rows records or max_bytes characters.
+
+    Use one writer from one task at a time.
+
+    Parameters
+    ----------
+    template : str
+        Path of each file, formatted with partition, the partition name, and
+        part, the part number from 0, such as
+        'exports/state={partition}/part-{part:04d}.csv.gz'. Missing
+        directories are created.
+    headers : Sequence[str]
+        CSV Column header names.
+    partition_by : str | Sequence[str] | Callable[[Any], Any] | None, optional
+        Column, columns or function giving the partition key of a record.
+        The partition name is the key, joined with '-' for several columns,
+        with '%', '/', '\\' and control characters percent-encoded. '.' and
+        '..' become '%2E' and '%2E%2E' and an empty key becomes '%'.
+    shards : int | None, optional
+        Spread the keys over this many partitions, named 0 to shards - 1, by
+        CRC32 of the key. Round robin if partition_by is None.
+    max_open : int, optional
+        Maximum number of files open at once.
+    max_rows : int | None, optional
+        Records per file before rolling over to the next part.
+    max_bytes : int | None, optional
+        Characters per file, before compression, before rolling over.
+    buffer_rows : int, optional
+        Records buffered per open file before it is written, see CsvAppender.
+    buffer_bytes : int, optional
+        Characters buffered per open file before it is written.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+
+    Raises
+    ------
+    ValueError
+        If a partition_by column is not in headers, or neither partition_by
+        nor shards is given.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.partition import PartitionedWriter
+    >>> from aiocsv_utils.read import csv_headers, csv_to_records_chunks
+    >>>
+    >>> async def split_by_state(path: str) -> list[str]:
+    >>>     headers = await csv_headers(path)
+    >>>     async with PartitionedWriter('data/states/{partition}-{part}.csv', headers, 'State',
+    >>>                                  max_rows=100_000) as writer:
+    >>>         async for chunk in csv_to_records_chunks(path, 10_000):
+    >>>             await writer.write_rows(chunk)
+    >>>     return writer.paths
+    >>>
+    >>> asyncio.run(split_by_state('data/cities.csv'))[:2]
+    ['data/states/OH-0.csv', 'data/states/SD-0.csv']
+    """
+    def __init__(
+        self,
+        template: str,
+        headers: _typing.Sequence[str],
+        partition_by: PartitionBy | None = None,
+        shards: int | None = None,
+        max_open=64,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+        buffer_rows=1000,
+        buffer_bytes=1 << 20,
+        compression: str | None = 'infer'
+    ) -> None:
+        if partition_by is None and not shards:
+            raise ValueError('PartitionedWriter needs partition_by, shards or both.')
+        self.template = template
+        self.headers = list(headers)
+        self.shards = shards
+        self.max_open = max(max_open, 1)
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.buffer_rows = buffer_rows
+        self.buffer_bytes = buffer_bytes
+        self.compression = compression
+        self.files: dict[str, int] = {}
+        self._key = _key_function(self.headers, partition_by) if partition_by is not None else None
+        self._partitions: dict[str, _Partition] = {}
+        self._open: _collections.OrderedDict[str, _Partition] = _collections.OrderedDict()
+        self._next_shard = 0
+        self._directories: set[str] = set()
+        self._header_size = _header_size(self.headers)
+
+    async def __aenter__(self) -> 'PartitionedWriter':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def paths(self) -> list[str]:
+        """Every file written so far, in the order they were created."""
+        return list(self.files)
+
+    def partition_of(self, record: _typing.Any) -> str:
+        """Name of the partition a record is routed to."""
+        if self._key is None:
+            shard, self._next_shard = self._next_shard, (self._next_shard + 1) % self.shards
+            return str(shard)
+        key = self._key(record)
+        if self.shards:
+            return str(_zlib.crc32(repr(key).encode('utf-8')) % self.shards)
+        return _partition_name(key)
+
+    async def _appender(self, name: str) -> _Partition:
+        partition = self._partitions.get(name)
+        if partition is None:
+            partition = self._partitions[name] = _Partition(name)
+        if partition.appender is not None:
+            self._open.move_to_end(name)
+            return partition
+        while len(self._open) >= self.max_open:
+            _, evicted = self._open.popitem(last=False)
+            await self._close(evicted)
+        if partition.path is None:
+            partition.path = self.template.format(partition=name, part=partition.part)
+            await self._create(partition.path)
+            partition.size = self._header_size
+        partition.appender = _CsvAppender(partition.path, self.headers, 'a', self.buffer_rows,
+                                          self.buffer_bytes, compression=self.compression)
+        await partition.appender.open()
+        self._open[name] = partition
+        return partition
+
+    async def _create(self, path: str) -> None:
+        directory = _os.path.dirname(path)
+        if directory and directory not in self._directories:
+            await _asyncio.get_running_loop().run_in_executor(
+                None, _functools.partial(_os.makedirs, directory, exist_ok=True))
+            self._directories.add(directory)
+        await _create_csv(path, self.headers, self.compression)
+        self.files[path] = 0
+
+    async def _close(self, partition: _Partition) -> None:
+        appender, partition.appender = partition.appender, None
+        if appender is not None:
+            await appender.aclose()
+
+    async def _roll(self, partition: _Partition) -> None:
+        self._open.pop(partition.name, None)
+        await self._close(partition)
+        partition.part += 1
+        partition.rows = 0
+        partition.size = 0
+        partition.path = None
+
+    def _full(self, partition: _Partition) -> bool:
+        return ((self.max_rows is not None and partition.rows >= self.max_rows)
+                or (self.max_bytes is not None and partition.size >= self.max_bytes))
+
+    async def _write(self, name: str, records: list[_typing.Any]) -> None:
+        position = 0
+        while position < len(records):
+            partition = await self._appender(name)
+            # Appenders restart their size count when reopened after eviction, so count per partition.
+            size = partition.appender.size
+            if self.max_bytes is None:
+                room = len(records) - position
+                if self.max_rows is not None:
+                    room = min(room, self.max_rows - partition.rows)
+                batch = records[position:position + room]
+                await partition.appender.write_rows(batch)
+            else:
+                batch = records[position:position + 1]
+                await partition.appender.write_row(batch[0])
+            position += len(batch)
+            partition.rows += len(batch)
+            partition.size += partition.appender.size - size
+            self.files[partition.path] += len(batch)
+            if self._full(partition):
+                await self._roll(partition)
+
+    async def write_row(self, record: _typing.Any) -> None:
+        """Write a record to its partition.
+
+        Parameters
+        ----------
+        record : Any
+            Record to be written, a dict or a row of any read row_type,
+            see rows.row_values.
+        """
+        await self._write(self.partition_of(record), [record])
+
+    async def write_rows(self, records: _typing.Iterable[_typing.Any]) -> None:
+        """Write records, grouped by partition so each file is touched once per call.
+
+        Parameters
+        ----------
+        records : Iterable[Any]
+            Records to be written, dicts or rows of any read row_type, see
+            rows.row_values.
+        """
+        groups: dict[str, list[_typing.Any]] = {}
+        for record in records:
+            groups.setdefault(self.partition_of(record), []).append(record)
+        for name, group in groups.items():
+            await self._write(name, group)
+
+    async def flush(self) -> None:
+        """Write the buffered records of every open file."""
+        for partition in self._open.values():
+            await partition.appender.flush()
+
+    async def aclose(self) -> None:
+        """Flush and close every open file."""
+        while self._open:
+            _, partition = self._open.popitem(last=False)
+            await self._close(partition)
@@ -0,0 +1,432 @@
+import asyncio as _asyncio
+import csv as _csv
+import hashlib as _hashlib
+import io as _io
+import itertools as _itertools
+import math as _math
+import os as _os
+import random as _random
+import typing as _typing
+
+from .compression import detect_compression as _detect_compression
+from .convert import Column as _Column
+from .convert import common_type as _common_type
+from .convert import convert_column as _convert_column
+from .read import csv_headers as _csv_headers
+from .read import csv_to_column_chunks as _csv_to_column_chunks
+from .scan import next_record_boundary as _next_record_boundary
+from .scan import quote_parity as _quote_parity
+
+QUANTILES = (0.25, 0.5, 0.75)
+"""Default quantiles reported for numeric columns."""
+
+RANGE_SIZE = 1 << 20
+"""Default number of bytes read per sampled byte range."""
+
+Profile = dict[str, _typing.Any]
+"""Row count and per-column statistics, see profile_csv."""
+
+
+class HyperLogLog:
+    """Distinct count estimate in 2 ** precision bytes, mergeable across partial profiles.
+
+    Parameters
+    ----------
+    precision : int, optional
+        Number of index bits, 4 to 16. The standard error is about
+        1.04 / sqrt(2 ** precision), 0.8% for the default.
+    """
+    def __init__(self, precision=14) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError(f'precision must be between 4 and 16, not {precision}')
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: _typing.Any) -> None:
+        digest = _hashlib.blake2b(repr(value).encode('utf-8'), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * _math.log(size / zeros)
+        return round(estimate)
+
+
+def _quantile(
+    means: _typing.Sequence[float],
+    weights: _typing.Sequence[float],
+    minimum: float,
+    maximum: float,
+    q: float
+) -> float:
+    """Interpolate the q quantile between centroid centers, and min and max at the ends."""
+    total = sum(weights)
+    target = q * total
+    cumulative = 0.0
+    previous_center, previous_mean = 0.0, minimum
+    for mean, weight in zip(means, weights):
+        center = cumulative + weight / 2
+        if target < center:
+            span = center - previous_center
+            return previous_mean + (mean - previous_mean) * ((target - previous_center) / span if span else 0)
+        previous_center, previous_mean = center, mean
+        cumulative += weight
+    span = total - previous_center
+    return previous_mean + (maximum - previous_mean) * ((target - previous_center) / span if span else 0)
+
+
+def _exact_quantile(numbers: list[float], q: float) -> float:
+    """Linearly interpolated quantile of sorted numbers, as numpy.quantile's default."""
+    position = q * (len(numbers) - 1)
+    low = int(position)
+    if low + 1 >= len(numbers):
+        return numbers[-1]
+    return numbers[low] + (numbers[low + 1] - numbers[low]) * (position - low)
+
+
+class TDigest:
+    """Merging t-digest quantile estimate with about compression centroids.
+
+    Parameters
+    ----------
+    compression : int, optional
+        Accuracy parameter, higher keeps more centroids. Quantiles near 0
+        and 1 are the most accurate.
+    """
+    def __init__(self, compression=100) -> None:
+        self.compression = compression
+        self.means: list[float] = []
+        self.weights: list[float] = []
+        self.minimum = _math.inf
+        self.maximum = -_math.inf
+        self._buffer: list[float] = []
+
+    def extend(self, values: _typing.Iterable[float]) -> None:
+        self._buffer.extend(values)
+        if len(self._buffer) >= 10 * self.compression:
+            self._compress()
+
+    def merge(self, other: 'TDigest') -> None:
+        other._compress()
+        self._compress(list(zip(other.means, other.weights)))
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def _limit(self, q: float) -> float:
+        # Upper quantile of a centroid starting at q under the k1 scale function.
+        scale = self.compression / (2 * _math.pi)
+        k = scale * _math.asin(max(-1.0, min(1.0, 2 * q - 1)))
+        return (_math.sin(min(k + 1, self.compression / 4) / scale) + 1) / 2
+
+    def _compress(self, centroids: list[tuple[float, float]] | None = None) -> None:
+        items = list(zip(self.means, self.weights))
+        if centroids:
+            items.extend(centroids)
+        if self._buffer:
+            self.minimum = min(self.minimum, min(self._buffer))
+            self.maximum = max(self.maximum, max(self._buffer))
+            items.extend((value, 1.0) for value in self._buffer)
+            self._buffer = []
+        if not items:
+            return
+        items.sort()
+        total = sum(weight for _, weight in items)
+        means, weights = [], []
+        mean, weight = items[0]
+        done = 0.0
+        limit = total * self._limit(0.0)
+        for next_mean, next_weight in items[1:]:
+            if done + weight + next_weight <= limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                done += weight
+                limit = total * self._limit(done / total)
+                mean, weight = next_mean, next_weight
+        means.append(mean)
+        weights.append(weight)
+        self.means, self.weights = means, weights
+
+    def quantile(self, q: float) -> float | None:
+        self._compress()
+        if not self.means:
+            return None
+        return _quantile(self.means, self.weights, self.minimum, self.maximum, q)
+
+
+class _ColumnProfile:
+    def __init__(self, exact: bool, sample_size: int, precision: int, compression: int, seed: int) -> None:
+        self.exact = exact
+        self.count = 0
+        self.nulls = 0
+        self.types: set[type] = set()
+        self.number_min: _typing.Any = None
+        self.number_max: _typing.Any = None
+        self.text_min: str | None = None
+        self.text_max: str | None = None
+        if exact:
+            self.distinct: set[_typing.Any] = set()
+            self.numbers: list[float] = []
+        else:
+            self.sketch = HyperLogLog(precision)
+            self.digest = TDigest(compression)
+            self.sample_size = sample_size
+            self.sample: list[_typing.Any] = []
+            self.random = _random.Random(seed)
+
+    def update(self, values: _Column) -> None:
+        if isinstance(values, list):
+            present = [value for value in values if value != '' and value is not None]
+            self.nulls += len(values) - len(present)
+            numbers = [value for value in present if type(value) in (int, float)]
+            texts = [value for value in present if type(value) is str]
+            self.types.update(map(type, present))
+        else:
+            present = numbers = values.tolist()
+            texts = []
+            self.types.update(map(type, numbers[:1]))
+        if numbers:
+            low, high = min(numbers), max(numbers)
+            self.number_min = low if self.number_min is None else min(self.number_min, low)
+            self.number_max = high if self.number_max is None else max(self.number_max, high)
+        if texts:
+            low, high = min(texts), max(texts)
+            self.text_min = low if self.text_min is None else min(self.text_min, low)
+            self.text_max = high if self.text_max is None else max(self.text_max, high)
+        if self.exact:
+            self.distinct.update(present)
+            self.numbers.extend(numbers)
+        else:
+            for value in present:
+                self.sketch.add(value)
+            self.digest.extend(numbers)
+            self._reservoir(present)
+        self.count += len(present)
+
+    def _reservoir(self, values: list[_typing.Any]) -> None:
+        seen = self.count
+        for value in values:
+            seen += 1
+            if len(self.sample) < self.sample_size:
+                self.sample.append(value)
+            else:
+                slot = self.random.randrange(seen)
+                if slot < self.sample_size:
+                    self.sample[slot] = value
+
+    def result(self, quantiles: _typing.Sequence[float]) -> dict[str, _typing.Any]:
+        kind = _common_type(self.types)
+        if self.number_min is not None:
+            low, high = self.number_min, self.number_max
+        else:
+            low, high = self.text_min, self.text_max
+        total = self.count + self.nulls
+        result = {
+            'type': kind.__name__ if kind is not None else None,
+            'count': self.count,
+            'nulls': self.nulls,
+            'null_rate': self.nulls / total if total else 0.0,
+            'min': low,
+            'max': high,
+        }
+        if self.exact:
+            result['distinct'] = len(self.distinct)
+            numbers = sorted(self.numbers)
+            result['quantiles'] = {q: _exact_quantile(numbers, q) for q in quantiles} if numbers else None
+        else:
+            result['distinct'] = min(self.sketch.count(), self.count)
+            result['quantiles'] = {q: self.digest.quantile(q) for q in quantiles} \
+                if self.number_min is not None else None
+            result['sample'] = list(self.sample)
+        return result
+
+
+def _update(profiles: list[_ColumnProfile], headers: list[str], chunk: dict[str, _Column]) -> int:
+    for profile, header in zip(profiles, headers):
+        profile.update(chunk[header])
+    return len(chunk[headers[0]]) if headers else 0
+
+
+def _convert_rows(headers: list[str], rows: list[list[str]]) -> dict[str, _Column]:
+    """Convert raw rows to columns as csv_to_column_chunks does without a schema."""
+    columns = list(_itertools.zip_longest(*rows, fillvalue=''))
+    empty = ('',) * len(rows)
+    return {header: _convert_column(columns[index] if index < len(columns) else empty, False)
+            for index, header in enumerate(headers)}
+
+
+def _range_rows(
+    path: str,
+    position: int,
+    offset: int,
+    size: int,
+    encoding: str,
+    delimiter: str
+) -> tuple[list[list[str]], int, int]:
+    """Parse the records of about size bytes from the first record boundary at or after offset.
+
+    position is a record boundary before offset. Counting the quote
+    characters between them gives the quote state at offset, so the range
+    never starts inside a quoted field. Returns the rows and the range.
+    """
+    with open(path, 'rb') as file:
+        end = file.seek(0, _os.SEEK_END)
+        if offset <= position:
+            start = position
+        else:
+            start = _next_record_boundary(file, offset, _quote_parity(file, position, offset))
+        target = min(start + size, end)
+        stop = _next_record_boundary(file, target, _quote_parity(file, start, target))
+        file.seek(start)
+        text = file.read(stop - start).decode(encoding)
+    rows = [row for row in _csv.reader(_io.StringIO(text, newline=''), delimiter=delimiter) if row]
+    return rows, start, stop
+
+
+async def profile_csv(
+    path: str,
+    mode: _typing.Literal['exact', 'sketch'] = 'exact',
+    quantiles: _typing.Sequence[float] = QUANTILES,
+    sample_ranges: int | None = None,
+    range_size=RANGE_SIZE,
+    sample_size=20,
+    precision=14,
+    digest_compression=100,
+    chunk_size=10_000,
+    encoding='utf-8',
+    delimiter=',',
+    compression: str | None = 'infer',
+    seed=0
+) -> Profile:
+    """Profile the row count, null rates, min, max, cardinality, quantiles and type of each column.
+
+    Values are converted with convert_str, through convert.convert_column,
+    and each column's type is the one read.csv_schema would infer from the
+    profiled values. The 'exact' mode keeps every distinct value and number
+    in memory. The 'sketch' mode uses bounded memory per column: a
+    HyperLogLog distinct count, t-digest quantiles and a reservoir sample.
+
+    With sample_ranges, an uncompressed file larger than sample_ranges *
+    range_size is not parsed whole. That many byte ranges of range_size,
+    spread evenly over the file and aligned to records, are profiled
+    instead. The bytes between them are only scanned for quote characters,
+    so quoted newlines never misalign a range. The row count is estimated
+    from the sampled bytes, and all other counts describe the sampled rows.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    mode : 'exact' | 'sketch', optional
+        Exact statistics, or bounded memory estimates of distinct counts
+        and quantiles.
+    quantiles : Sequence[float], optional
+        Quantiles reported for numeric values.
+    sample_ranges : int | None, optional
+        Number of byte ranges profiled instead of the whole file. None
+        reads every byte.
+    range_size : int, optional
+        Number of bytes per sampled range.
+    sample_size : int, optional
+        Number of values kept per column in the 'sketch' reservoir sample.
+    precision : int, optional
+        HyperLogLog precision in 'sketch' mode, see HyperLogLog.
+    digest_compression : int, optional
+        t-digest compression in 'sketch' mode, see TDigest.
+    chunk_size : int, optional
+        Number of rows converted and profiled at a time, in the thread pool.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible with sample_ranges.
+    delimiter : str, optional
+        CSV file delimiter character.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension. Compressed files are read whole.
+    seed : int, optional
+        Seed of the reservoir sampling.
+
+    Returns
+    -------
+    dict[str, Any]
+        'rows', the number of records, estimated if 'sampled' is True,
+        'sampled', whether byte ranges were profiled, 'sampled_rows', the
+        number of records profiled, and 'columns', mapping each column to
+        its 'type' name (None if mixed), 'count' of non-empty values,
+        'nulls', 'null_rate', 'min', 'max' (of numbers if any, else of
+        strings), 'distinct', 'quantiles' (None without numbers), and in
+        'sketch' mode a reservoir 'sample'.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ValueError
+        If mode is not supported.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.profiling import profile_csv
+    >>>
+    >>> profile = asyncio.run(profile_csv('data/cities.csv', 'sketch'))
+    >>> profile['rows'], profile['columns']['LatD']['type'], profile['columns']['State']['distinct']
+    (128, 'int', 46)
+    """
+    if mode not in ('exact', 'sketch'):
+        raise ValueError(f'Unsupported profile mode: {mode!r}')
+    headers = await _csv_headers(path, encoding=encoding, delimiter=delimiter, compression=compression)
+    profiles = [_ColumnProfile(mode == 'exact', sample_size, precision, digest_compression, seed + position)
+                for position in range(len(headers))]
+    loop = _asyncio.get_running_loop()
+    rows = sampled_rows = 0
+    sampled = False
+    if sample_ranges and _detect_compression(path, compression) is None:
+        size = await loop.run_in_executor(None, _os.path.getsize, path)
+        header_end = await loop.run_in_executor(None, _header_end, path)
+        body = size - header_end
+        sampled = body > sample_ranges * range_size
+    if sampled:
+        sampled_bytes = 0
+        position = header_end
+        for number in range(sample_ranges):
+            offset = header_end + body * number // sample_ranges
+            range_rows, start, position = await loop.run_in_executor(
+                None, _range_rows, path, position, offset, range_size, encoding, delimiter)
+            sampled_bytes += position - start
+            for first in range(0, len(range_rows), chunk_size):
+                chunk = await loop.run_in_executor(
+                    None, _convert_rows, headers, range_rows[first:first + chunk_size])
+                sampled_rows += await loop.run_in_executor(None, _update, profiles, headers, chunk)
+        rows = round(sampled_rows * body / sampled_bytes) if sampled_bytes else 0
+    else:
+        chunks = _csv_to_column_chunks(path, chunk_size, encoding=encoding, delimiter=delimiter,
+                                       numpy=False, compression=compression)
+        async for chunk in chunks:
+            rows += await loop.run_in_executor(None, _update, profiles, headers, chunk)
+        sampled_rows = rows
+    return {
+        'rows': rows,
+        'sampled': sampled,
+        'sampled_rows': sampled_rows,
+        'columns': {header: profile.result(quantiles) for header, profile in zip(headers, profiles)}
+    }
+
+
+def _header_end(path: str) -> int:
+    with open(path, 'rb') as file:
+        return _next_record_boundary(file, 0)
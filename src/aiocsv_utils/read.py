@@ -1,11 +1,71 @@
+import functools as _functools
+import itertools as _itertools
 import typing as _typing
 
-import aiofiles as _aiofiles
 from aiofiles.threadpool.text import AsyncTextIOWrapper as _AsyncTextIOWrapper
 import aiocsv as _aiocsv
 from aioitertools.more_itertools import chunked as _chunked
 
+from .cache import MetadataCache as _MetadataCache
+from .compression import BLOCK_SIZE as _BLOCK_SIZE
+from .compression import detect_compression as _detect_compression
+from .compression import open_csv as _open_csv
+from .dialect import Dialect as _Dialect
+from .dialect import sniff_csv_file as _sniff_csv_file
 from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import InferredSchema as _InferredSchema
+from .convert import infer_schema as _infer_schema
+from .convert import compile_schema as _compile_schema
+from .convert import Column as _Column
+from .convert import column_array as _column_array
+from .convert import convert_column as _convert_column
+from .convert import is_convert_str_like as _is_convert_str_like
+from .instrument import ReadStats as _ReadStats
+from .instrument import SliceMonitor as _SliceMonitor
+from .rows import Row as _Row
+from .rows import RowType as _RowType
+from .rows import row_factory as _row_factory
+
+
+Where = dict[str, _typing.Union[str, _typing.Collection[str], _typing.Callable[[str | None], bool]]]
+"""Mapping of column name to a raw string, a collection of raw strings or a predicate."""
+
+
+async def _reader_options(
+    async_file: _typing.Any,
+    delimiter: str | _Dialect
+) -> tuple[_typing.Any, dict[str, str]]:
+    if delimiter == 'auto':
+        delimiter, async_file = await _sniff_csv_file(async_file)
+    if isinstance(delimiter, dict):
+        return async_file, {'delimiter': delimiter['delimiter'], 'quotechar': delimiter['quotechar']}
+    return async_file, {'delimiter': delimiter}
+
+
+async def _path_dialect(
+    path: str,
+    async_file: _typing.Any,
+    delimiter: str | _Dialect,
+    encoding: str,
+    compression: str | None,
+    cache: _MetadataCache | None
+) -> tuple[_typing.Any, str | _Dialect]:
+    """Resolve delimiter='auto' once per file, sniffing on a cache miss only."""
+    if delimiter != 'auto':
+        return async_file, delimiter
+    reader = async_file
+
+    async def sniff() -> _Dialect:
+        nonlocal reader
+        dialect, reader = await _sniff_csv_file(async_file)
+        return dialect
+    if cache is None:
+        dialect = await sniff()
+    else:
+        compression = _detect_compression(path, compression)
+        dialect = dict(await cache.get(path, f'dialect|{encoding}|{compression}', sniff))
+    return reader, dialect
 
 
 async def csv_file_headers(
@@ -19,7 +79,8 @@ async def csv_file_headers(
     async_file : AsyncTextIOWrapper
         Async file object from aiofiles.read
     delimiter : str, optional
-        CSV file delimiter character.
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
 
     Returns
     -------
@@ -40,7 +101,8 @@ async def csv_file_headers(
     >>> asyncio.run(get_headers('data/cities.csv'))
     ['LatD', 'LatM', 'LatS', 'NS', 'LonD', 'LonM', 'LonS', 'EW', 'City', 'State']
     """
-    reader = _aiocsv.AsyncReader(async_file, delimiter=delimiter)
+    async_file, options = await _reader_options(async_file, delimiter)
+    reader = _aiocsv.AsyncReader(async_file, **options)
     return await anext(reader)
         
 
@@ -49,7 +111,10 @@ async def csv_headers(
     mode='r',
     encoding='utf-8',
     newline='',
-    delimiter=','
+    delimiter=',',
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE,
+    cache: _MetadataCache | None = None
 ) -> list[str]:
     """Asynchronously read the header names of a csv by path.
     
@@ -64,7 +129,15 @@ async def csv_headers(
     newline : str, optional
         How newlines mode works.
     delimiter : str, optional
-        CSV file delimiter character.
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+    cache : MetadataCache | None, optional
+        Cache to look the headers up in, see cache.MetadataCache.
 
     Returns
     -------
@@ -85,14 +158,144 @@ async def csv_headers(
     >>> asyncio.run(csv_headers('data/cities.csv'))
     ['LatD', 'LatM', 'LatS', 'NS', 'LonD', 'LonM', 'LonS', 'EW', 'City', 'State']
     """
-    async with _aiofiles.open(path, mode=mode, buffering=-1, encoding=encoding, errors=None, newline=newline) as afp:
-        return await csv_file_headers(afp, delimiter)
+    async def read_headers() -> list[str]:
+        async with _open_csv(path, mode, encoding, newline, compression, block_size) as afp:
+            afp, dialect = await _path_dialect(path, afp, delimiter, encoding, compression, cache)
+            return await csv_file_headers(afp, dialect)
+    if cache is None:
+        return await read_headers()
+    key = f'headers|{encoding}|{delimiter}|{_detect_compression(path, compression)}'
+    return list(await cache.get(path, key, read_headers))
+
+
+async def csv_file_schema(
+    async_file: _AsyncTextIOWrapper,
+    delimiter=',',
+    sample_size=100
+) -> _Schema:
+    """Asynchronously infer the column types of a csv file from a sample of rows.
+    
+    Parameters
+    ----------
+    async_file : AsyncTextIOWrapper
+        Async file object from aiofiles.read
+    delimiter : str, optional
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+
+    Returns
+    -------
+    dict[str, type | None]
+        Column name to inferred type, see convert.infer_schema.
+        
+    Example
+    -------
+    >>> import asyncio
+    >>> import aiofiles
+    >>>
+    >>> from aiocsv_utils.read import csv_file_schema
+    >>>
+    >>> async def get_schema(path: str) -> dict:
+    >>>     async with aiofiles.open(path, mode='r', encoding='utf-8', newline='') as f:
+    >>>         return await csv_file_schema(f)
+    >>>
+    >>> asyncio.run(get_schema('data/cities.csv'))
+    {'LatD': <class 'int'>, 'LatM': <class 'int'>, 'LatS': <class 'int'>, 'NS': <class 'str'>,
+     'LonD': <class 'int'>, 'LonM': <class 'int'>, 'LonS': <class 'int'>, 'EW': <class 'str'>,
+     'City': <class 'str'>, 'State': <class 'str'>}
+    """
+    async_file, options = await _reader_options(async_file, delimiter)
+    reader = _aiocsv.AsyncReader(async_file, **options)
+    headers = await anext(reader, [])
+    sample = []
+    async for row in reader:
+        if row:
+            sample.append(row)
+        if len(sample) >= sample_size:
+            break
+    return _infer_schema(headers, sample)
+
+
+async def csv_schema(
+    path: str,
+    mode='r',
+    encoding='utf-8',
+    newline='',
+    delimiter=',',
+    sample_size=100,
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE,
+    cache: _MetadataCache | None = None
+) -> _Schema:
+    """Asynchronously infer the column types of a csv by path from a sample of rows.
+    
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    mode : str, optional
+        Mode while opening a file.
+    encoding : str, optional
+        The encoding format.
+    newline : str, optional
+        How newlines mode works.
+    delimiter : str, optional
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+    cache : MetadataCache | None, optional
+        Cache to look the schema up in, see cache.MetadataCache.
+
+    Returns
+    -------
+    dict[str, type | None]
+        Column name to inferred type, see convert.infer_schema.
+        
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+        
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.read import csv_schema
+    >>>
+    >>> asyncio.run(csv_schema('data/cities.csv'))
+    {'LatD': <class 'int'>, 'LatM': <class 'int'>, 'LatS': <class 'int'>, 'NS': <class 'str'>,
+     'LonD': <class 'int'>, 'LonM': <class 'int'>, 'LonS': <class 'int'>, 'EW': <class 'str'>,
+     'City': <class 'str'>, 'State': <class 'str'>}
+    """
+    async def read_schema() -> _Schema:
+        async with _open_csv(path, mode, encoding, newline, compression, block_size) as afp:
+            afp, dialect = await _path_dialect(path, afp, delimiter, encoding, compression, cache)
+            return await csv_file_schema(afp, dialect, sample_size)
+    if cache is None:
+        return await read_schema()
+    key = f'schema|{encoding}|{delimiter}|{sample_size}|{_detect_compression(path, compression)}'
+    return _InferredSchema(await cache.get(path, key, read_schema))
 
 
 async def csv_file_to_records(
     async_file: _AsyncTextIOWrapper,
-    delimiter=','
-) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: Where | None = None,
+    time_slice: float | None = None,
+    on_stats: _typing.Callable[[_ReadStats], None] | None = None,
+    row_type: _RowType = 'dict'
+) -> _typing.AsyncGenerator[_Row, None]:
     """Asynchronously read a CSV file and async yield each record.
     
     Parameters
@@ -100,12 +303,36 @@ async def csv_file_to_records(
     async_file : AsyncTextIOWrapper
         Async file object from aiofiles.read
     delimiter : str, optional
-        CSV file delimiter character.
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry: a str
+        for equality, a collection of str for membership or a callable
+        taking the raw value. Tested before any conversion.
+    time_slice : float | None, optional
+        Yield to the event loop once parsing has held it for this many
+        milliseconds. None only yields while awaiting file reads.
+    on_stats : Callable[[ReadStats], None] | None, optional
+        Called with the instrument.ReadStats of the call when reading ends.
+    row_type : 'dict' | 'tuple' | 'namedtuple' | 'slots' | 'lazy', optional
+        Yield each record as a dict, a tuple, a namedtuple or __slots__
+        class built once from the header, or a rows.LazyRow converting
+        fields on access. Short rows give None for missing fields and
+        extra fields are dropped, except with 'dict'.
 
     Returns
     -------
-    AsyncGenerator[dict[str, Any]
-        An async generator that yields each CSV row as a dict.
+    AsyncGenerator[Row]
+        An async generator that yields each CSV row as a dict, or as set
+        by row_type.
         
     Example
     -------
@@ -123,8 +350,269 @@ async def csv_file_to_records(
     {'LatD': 41, 'LatM': 5, 'LatS': 59, 'NS': 'N', 'LonD': 80, 'LonM': 39,
      'LonS': 0, 'EW': 'W', 'City': 'Youngstown', 'State': 'OH'}
     """
-    async for row in _aiocsv.AsyncDictReader(async_file, delimiter=delimiter):
-        yield {col: _convert_str(val) for col, val in row.items()}
+    async_file, options = await _reader_options(async_file, delimiter)
+    if (schema is None and columns is None and where is None and time_slice is None and on_stats is None
+            and row_type == 'dict'):
+        async for row in _aiocsv.AsyncDictReader(async_file, **options):
+            yield {col: _convert_str(val) for col, val in row.items()}
+        return
+    monitor = None
+    if time_slice is not None or on_stats is not None:
+        async_file = monitor = _SliceMonitor(async_file, time_slice)
+    try:
+        reader = _aiocsv.AsyncReader(async_file, **options)
+        headers = await anext(reader, None)
+        if headers is None:
+            return
+        sample = []
+        if schema == 'infer':
+            while len(sample) < sample_size:
+                row = await anext(reader, None)
+                if row is None:
+                    break
+                if row:
+                    sample.append(row)
+            schema = _infer_schema(headers, sample)
+        if schema is None:
+            converters = [_convert_str] * len(headers)
+        else:
+            converters = _compile_schema(headers, schema)
+        build = record_builder(headers, converters, columns, where, row_type)
+        if monitor is not None:
+            build = _functools.partial(monitor.convert, build)
+        for row in sample:
+            record = build(row)
+            if record is not None:
+                yield record
+        async for row in reader:
+            if row:
+                record = build(row)
+                if record is not None:
+                    yield record
+                if monitor is not None and monitor.due():
+                    await monitor.pause()
+    finally:
+        if monitor is not None and on_stats is not None:
+            on_stats(monitor.finish())
+
+
+def column_index(headers: list[str], column: str) -> int:
+    """Position of a column in the CSV headers.
+    
+    Parameters
+    ----------
+    headers : list[str]
+        CSV column header names.
+    column : str
+        Column name to look up.
+        
+    Returns
+    -------
+    int
+        Index of the first header equal to column.
+        
+    Raises
+    ------
+    ValueError
+        If column is not in headers.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.read import column_index
+    >>>
+    >>> column_index(['LatD', 'LatM', 'City'], 'City')
+    2
+    """
+    try:
+        return headers.index(column)
+    except ValueError:
+        raise ValueError(f'Column {column!r} is not in the CSV headers.') from None
+
+
+def compile_where(
+    headers: list[str],
+    where: Where
+) -> _typing.Callable[[list[str]], bool]:
+    """Compile where tests into one predicate on raw rows.
+    
+    Parameters
+    ----------
+    headers : list[str]
+        CSV column header names.
+    where : dict[str, Any]
+        Column name to a str for equality, a collection of str for
+        membership or a callable taking the raw value, see csv_to_records.
+        
+    Returns
+    -------
+    Callable[[list[str]], bool]
+        Whether a raw row, at least as long as headers, matches every test.
+        
+    Raises
+    ------
+    ValueError
+        If a column is not in headers.
+    TypeError
+        If a test is not a str, collection or callable.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.read import compile_where
+    >>>
+    >>> match = compile_where(['City', 'State'], {'State': {'OH', 'WA'}})
+    >>> match(['Youngstown', 'OH']), match(['Yankton', 'SD'])
+    (True, False)
+    """
+    tests = []
+    for column, test in where.items():
+        index = column_index(headers, column)
+        if isinstance(test, str):
+            tests.append(lambda row, index=index, value=test: row[index] == value)
+        elif callable(test):
+            tests.append(lambda row, index=index, test=test: test(row[index]))
+        elif isinstance(test, _typing.Collection):
+            values = frozenset(test)
+            tests.append(lambda row, index=index, values=values: row[index] in values)
+        else:
+            raise TypeError(f'Unsupported where test for {column!r}: {test!r}')
+    if len(tests) == 1:
+        return tests[0]
+    return lambda row: all(test(row) for test in tests)
+
+
+def record_builder(
+    headers: list[str],
+    converters: list[_typing.Callable[[str], _typing.Any]],
+    columns: _typing.Sequence[str] | None = None,
+    where: Where | None = None,
+    row_type: _RowType = 'dict'
+) -> _typing.Callable[[list[str]], _Row | None]:
+    """Compile a function turning a raw row into a record, or None if where rejects it.
+    
+    Parameters
+    ----------
+    headers : list[str]
+        CSV column header names.
+    converters : list[Callable[[str], Any]]
+        Converter functions in header order, see convert.compile_schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Raw value tests a row must pass, see compile_where.
+    row_type : 'dict' | 'tuple' | 'namedtuple' | 'slots' | 'lazy', optional
+        Record type, see csv_to_records.
+        
+    Returns
+    -------
+    Callable[[list[str]], Any]
+        Function from a raw row to its record or None.
+        
+    Raises
+    ------
+    ValueError
+        If a column is not in headers.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import compile_schema
+    >>> from aiocsv_utils.read import record_builder
+    >>>
+    >>> headers = ['City', 'LatD']
+    >>> build = record_builder(headers, compile_schema(headers, {}), columns=['LatD'], where={'City': 'Yankton'})
+    >>> build(['Yankton', '42']), build(['Youngstown', '41'])
+    ({'LatD': 42}, None)
+    """
+    width = len(headers)
+    if row_type != 'dict':
+        build = _row_builder(headers, converters, columns, row_type)
+    elif columns is None:
+        def build(row: list[str]) -> dict[str, _typing.Any] | None:
+            return schema_record(headers, converters, width, row)
+    else:
+        selected = [(column, converters[index], index)
+                    for column, index in ((column, column_index(headers, column)) for column in columns)]
+
+        def build(row: list[str]) -> dict[str, _typing.Any] | None:
+            if len(row) == width:
+                return {col: convert(row[index]) for col, convert, index in selected}
+            record = schema_record(headers, converters, width, row)
+            return {col: record[col] for col, _, _ in selected}
+    if where is None:
+        return build
+    match = compile_where(headers, where)
+
+    def build_where(row: list[str]) -> _Row | None:
+        raw = row if len(row) >= width else row + [None] * (width - len(row))
+        return build(row) if match(raw) else None
+    return build_where
+
+
+def _row_builder(
+    headers: list[str],
+    converters: list[_typing.Callable[[str], _typing.Any]],
+    columns: _typing.Sequence[str] | None,
+    row_type: _RowType
+) -> _typing.Callable[[list[str]], _typing.Any]:
+    width = len(headers)
+    fields = list(headers) if columns is None else list(columns)
+    indexes = [column_index(headers, column) for column in fields]
+    if row_type == 'lazy':
+        return _row_factory(fields, row_type, indexes, [converters[index] for index in indexes])
+    make = _row_factory(fields, row_type)
+    selected = [(converters[index], index) for index in indexes]
+
+    def build(row: list[str]) -> _typing.Any:
+        if columns is None and len(row) == width:
+            return make([convert(val) for convert, val in zip(converters, row)])
+        return make([convert(row[index]) if index < len(row) else None for convert, index in selected])
+    return build
+
+
+def schema_record(
+    headers: list[str],
+    converters: list[_typing.Callable[[str], _typing.Any]],
+    width: int,
+    row: list[str]
+) -> dict[str, _typing.Any]:
+    """Build the record of a raw row with one converter per column.
+    
+    Ragged rows keep AsyncDictReader semantics: extra fields go in a list
+    under None, missing fields are None, and every value is converted with
+    convert_str.
+    
+    Parameters
+    ----------
+    headers : list[str]
+        CSV column header names.
+    converters : list[Callable[[str], Any]]
+        Converter functions in header order, see convert.compile_schema.
+    width : int
+        Number of headers.
+    row : list[str]
+        Raw field values.
+        
+    Returns
+    -------
+    dict[str, Any]
+        Record of converted values.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import compile_schema
+    >>> from aiocsv_utils.read import schema_record
+    >>>
+    >>> schema_record(['id', 'name'], compile_schema(['id', 'name'], {'id': int, 'name': str}), 2, ['1', '2'])
+    {'id': 1, 'name': '2'}
+    """
+    if len(row) == width:
+        return {col: convert(val) for col, convert, val in zip(headers, converters, row)}
+    record: dict[_typing.Any, _typing.Any] = dict(zip(headers, row))
+    if len(row) > width:
+        record[None] = row[width:]
+    else:
+        for col in headers[len(row):]:
+            record[col] = None
+    return {col: _convert_str(val) for col, val in record.items()}
             
 
 async def csv_to_records(
@@ -132,8 +620,18 @@ async def csv_to_records(
     mode='r',
     encoding='utf-8',
     newline='',
-    delimiter=','
-) -> _typing.AsyncGenerator[dict[str, _typing.Any], None]:
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: Where | None = None,
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE,
+    time_slice: float | None = None,
+    on_stats: _typing.Callable[[_ReadStats], None] | None = None,
+    cache: _MetadataCache | None = None,
+    row_type: _RowType = 'dict'
+) -> _typing.AsyncGenerator[_Row, None]:
     """Asynchronously read a CSV by path and async yield each record.
     
     Parameters
@@ -147,12 +645,43 @@ async def csv_to_records(
     newline : str, optional
         How newlines mode works.
     delimiter : str, optional
-        CSV file delimiter character.
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry: a str
+        for equality, a collection of str for membership or a callable
+        taking the raw value. Tested before any conversion.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+    time_slice : float | None, optional
+        Yield to the event loop once parsing has held it for this many
+        milliseconds. None only yields while awaiting file reads.
+    on_stats : Callable[[ReadStats], None] | None, optional
+        Called with the instrument.ReadStats of the call when reading ends.
+    cache : MetadataCache | None, optional
+        Cache to look an inferred schema up in, see cache.MetadataCache.
+    row_type : 'dict' | 'tuple' | 'namedtuple' | 'slots' | 'lazy', optional
+        Yield each record as a dict, a tuple, a namedtuple or __slots__
+        class built once from the header, or a rows.LazyRow converting
+        fields on access. Short rows give None for missing fields and
+        extra fields are dropped, except with 'dict'.
 
     Returns
     -------
-    AsyncGenerator[dict[str, Any]
-        An async generator that yields each CSV row as a dict.
+    AsyncGenerator[Row]
+        An async generator that yields each CSV row as a dict, or as set
+        by row_type.
         
     Raises
     ------
@@ -173,16 +702,28 @@ async def csv_to_records(
     {'LatD': 41, 'LatM': 5, 'LatS': 59, 'NS': 'N', 'LonD': 80, 'LonM': 39,
      'LonS': 0, 'EW': 'W', 'City': 'Youngstown', 'State': 'OH'}
     """
-    async with _aiofiles.open(path, mode=mode, encoding=encoding, newline=newline) as afp:
-        async for row in csv_file_to_records(afp, delimiter):
+    if cache is not None and schema == 'infer':
+        schema = await csv_schema(path, mode, encoding, newline, delimiter, sample_size,
+                                  compression, block_size, cache)
+    async with _open_csv(path, mode, encoding, newline, compression, block_size) as afp:
+        afp, delimiter = await _path_dialect(path, afp, delimiter, encoding, compression, cache)
+        async for row in csv_file_to_records(afp, delimiter, schema, sample_size, columns, where, time_slice, on_stats,
+                                           row_type):
             yield row
             
 
 async def csv_file_to_records_chunks(
     async_file: _AsyncTextIOWrapper,
     chunk_size: int,
-    delimiter=','
-) -> _typing.AsyncGenerator[list[dict[str, _typing.Any]], None]:
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: Where | None = None,
+    time_slice: float | None = None,
+    on_stats: _typing.Callable[[_ReadStats], None] | None = None,
+    row_type: _RowType = 'dict'
+) -> _typing.AsyncGenerator[list[_Row], None]:
     """Asynchronously read a CSV file and async yield chunks of records.
     
     Parameters
@@ -190,12 +731,36 @@ async def csv_file_to_records_chunks(
     async_file : AsyncTextIOWrapper
         Async file object from aiofiles.read
     delimiter : str, optional
-        CSV file delimiter character.
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry: a str
+        for equality, a collection of str for membership or a callable
+        taking the raw value. Tested before any conversion.
+    time_slice : float | None, optional
+        Yield to the event loop once parsing has held it for this many
+        milliseconds. None only yields while awaiting file reads.
+    on_stats : Callable[[ReadStats], None] | None, optional
+        Called with the instrument.ReadStats of the call when reading ends.
+    row_type : 'dict' | 'tuple' | 'namedtuple' | 'slots' | 'lazy', optional
+        Yield each record as a dict, a tuple, a namedtuple or __slots__
+        class built once from the header, or a rows.LazyRow converting
+        fields on access. Short rows give None for missing fields and
+        extra fields are dropped, except with 'dict'.
 
     Returns
     -------
-    AsyncGenerator[list[dict[str, Any]]]
-        An async generator that yields chunks of CSV rows as lists of dicts.
+    AsyncGenerator[list[Row]]
+        An async generator that yields chunks of CSV rows as lists of dicts,
+        or of rows as set by row_type.
         
     Example
     -------
@@ -214,9 +779,13 @@ async def csv_file_to_records_chunks(
     {'LatD': 42, 'LatM': 52, 'LatS': 48, 'NS': 'N', 'LonD': 97, 'LonM': 23,
     'LonS': 23, 'EW': 'W', 'City': 'Yankton', 'State': 'SD'}]
     """
-    records = csv_file_to_records(async_file, delimiter)
-    async for chunk in _chunked(records, chunk_size):
-        yield chunk
+    records = csv_file_to_records(async_file, delimiter, schema, sample_size, columns, where, time_slice, on_stats,
+                                  row_type)
+    try:
+        async for chunk in _chunked(records, chunk_size):
+            yield chunk
+    finally:
+        await records.aclose()
         
 async def csv_to_records_chunks(
     path: str,
@@ -224,8 +793,18 @@ async def csv_to_records_chunks(
     mode='r',
     encoding='utf-8',
     newline='',
-    delimiter=','
-) -> _typing.AsyncGenerator[list[dict[str, _typing.Any]], None]:
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    columns: _typing.Sequence[str] | None = None,
+    where: Where | None = None,
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE,
+    time_slice: float | None = None,
+    on_stats: _typing.Callable[[_ReadStats], None] | None = None,
+    cache: _MetadataCache | None = None,
+    row_type: _RowType = 'dict'
+) -> _typing.AsyncGenerator[list[_Row], None]:
     """Asynchronously read a CSV by path and async yield chunks of records.
     
     Parameters
@@ -239,12 +818,43 @@ async def csv_to_records_chunks(
     newline : str, optional
         How newlines mode works.
     delimiter : str, optional
-        CSV file delimiter character.
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    columns : Sequence[str] | None, optional
+        Only convert and return these columns, in this order.
+    where : dict[str, Any] | None, optional
+        Keep only rows whose raw string values match every entry: a str
+        for equality, a collection of str for membership or a callable
+        taking the raw value. Tested before any conversion.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+    time_slice : float | None, optional
+        Yield to the event loop once parsing has held it for this many
+        milliseconds. None only yields while awaiting file reads.
+    on_stats : Callable[[ReadStats], None] | None, optional
+        Called with the instrument.ReadStats of the call when reading ends.
+    cache : MetadataCache | None, optional
+        Cache to look an inferred schema up in, see cache.MetadataCache.
+    row_type : 'dict' | 'tuple' | 'namedtuple' | 'slots' | 'lazy', optional
+        Yield each record as a dict, a tuple, a namedtuple or __slots__
+        class built once from the header, or a rows.LazyRow converting
+        fields on access. Short rows give None for missing fields and
+        extra fields are dropped, except with 'dict'.
 
     Returns
     -------
-    AsyncGenerator[list[dict[str, Any]]]
-        An async generator that yields chunks of CSV rows as lists of dicts.
+    AsyncGenerator[list[Row]]
+        An async generator that yields chunks of CSV rows as lists of dicts,
+        or of rows as set by row_type.
     
     Raises
     ------
@@ -267,6 +877,222 @@ async def csv_to_records_chunks(
     {'LatD': 42, 'LatM': 52, 'LatS': 48, 'NS': 'N', 'LonD': 97, 'LonM': 23,
     'LonS': 23, 'EW': 'W', 'City': 'Yankton', 'State': 'SD'}]
     """
-    async with _aiofiles.open(path, mode=mode, encoding=encoding, newline=newline) as f:
-        async for chunk in csv_file_to_records_chunks(f, chunk_size, delimiter):
+    if cache is not None and schema == 'infer':
+        schema = await csv_schema(path, mode, encoding, newline, delimiter, sample_size,
+                                  compression, block_size, cache)
+    async with _open_csv(path, mode, encoding, newline, compression, block_size) as f:
+        f, delimiter = await _path_dialect(path, f, delimiter, encoding, compression, cache)
+        async for chunk in csv_file_to_records_chunks(f, chunk_size, delimiter, schema, sample_size, columns, where,
+                                                    time_slice, on_stats, row_type):
+            yield chunk
+
+
+async def csv_file_to_column_chunks(
+    async_file: _AsyncTextIOWrapper,
+    chunk_size: int,
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    numpy: bool | None = None
+) -> _typing.AsyncGenerator[dict[str, _Column], None]:
+    """Asynchronously read a CSV file and async yield chunks of columns.
+    
+    Each chunk maps column names to the converted values of up to chunk_size
+    rows. Numeric columns are packed into array.array (or numpy.ndarray) and
+    other columns are lists, see convert.column_array. Short rows are padded
+    with '' and extra fields are dropped.
+    
+    Parameters
+    ----------
+    async_file : AsyncTextIOWrapper
+        Async file object from aiofiles.read
+    chunk_size : int
+        Maximum number of rows per chunk.
+    delimiter : str, optional
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    numpy : bool | None, optional
+        Use numpy.ndarray for numeric columns. None uses NumPy when it is
+        installed.
+
+    Returns
+    -------
+    AsyncGenerator[dict[str, array | list]]
+        An async generator that yields chunks of CSV rows as dicts of columns.
+        
+    Example
+    -------
+    >>> import asyncio
+    >>> import aiofiles
+    >>>
+    >>> from aiocsv_utils.read import csv_file_to_column_chunks
+    >>>
+    >>> async def read_first_two_rows(path: str) -> dict | None:
+    >>>     async with aiofiles.open(path, mode='r', encoding='utf-8', newline='') as f:
+    >>>         async for chunk in csv_file_to_column_chunks(f, 2, numpy=False):
+    >>>             return chunk
+    >>>
+    >>> asyncio.run(read_first_two_rows('data/cities.csv'))
+    {'LatD': array('q', [41, 42]), 'LatM': array('q', [5, 52]), 'LatS': array('q', [59, 48]),
+     'NS': ['N', 'N'], 'LonD': array('q', [80, 97]), 'LonM': array('q', [39, 23]),
+     'LonS': array('q', [0, 23]), 'EW': ['W', 'W'], 'City': ['Youngstown', 'Yankton'],
+     'State': ['OH', 'SD']}
+    """
+    async_file, options = await _reader_options(async_file, delimiter)
+    reader = _aiocsv.AsyncReader(async_file, **options)
+    headers = await anext(reader, None)
+    if headers is None:
+        return
+    converters = None
+    if isinstance(schema, dict):
+        converters = _compile_schema(headers, schema)
+    elif schema is None:
+        converters = [_convert_str] * len(headers)
+    rows: list[list[str]] = []
+    row_limit = chunk_size if converters is not None else max(chunk_size, sample_size)
+    async for row in reader:
+        if not row:
+            continue
+        rows.append(row)
+        if len(rows) >= row_limit:
+            if converters is None:
+                converters = _compile_schema(headers, _infer_schema(headers, rows[:sample_size]))
+            while len(rows) >= chunk_size:
+                yield column_chunk(headers, converters, rows[:chunk_size], numpy)
+                del rows[:chunk_size]
+            row_limit = chunk_size
+    if rows:
+        if converters is None:
+            converters = _compile_schema(headers, _infer_schema(headers, rows[:sample_size]))
+        for start in range(0, len(rows), chunk_size):
+            yield column_chunk(headers, converters, rows[start:start + chunk_size], numpy)
+
+
+def column_chunk(
+    headers: list[str],
+    converters: list[_typing.Callable[[str], _typing.Any]],
+    rows: list[list[str]],
+    numpy: bool | None
+) -> dict[str, _Column]:
+    """Convert a list of raw rows into a chunk of typed columns.
+    
+    Missing fields are read as ''. Columns whose converter gives convert_str
+    results are converted whole with convert.convert_column.
+    
+    Parameters
+    ----------
+    headers : list[str]
+        CSV column header names.
+    converters : list[Callable[[str], Any]]
+        Converter functions in header order, see convert.compile_schema.
+    rows : list[list[str]]
+        Raw rows.
+    numpy : bool | None
+        Use numpy.ndarray instead of array.array. None uses NumPy when it is
+        installed.
+        
+    Returns
+    -------
+    dict[str, array.array | numpy.ndarray | list]
+        Header name to column, see csv_to_column_chunks.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.convert import compile_schema
+    >>> from aiocsv_utils.read import column_chunk
+    >>>
+    >>> column_chunk(['id', 'name'], compile_schema(['id', 'name'], {}), [['1', 'a'], ['2']], numpy=False)
+    {'id': array('q', [1, 2]), 'name': ['a', '']}
+    """
+    columns = list(_itertools.zip_longest(*rows, fillvalue=''))
+    empty = ('',) * len(rows)
+    chunk = {}
+    for index, header in enumerate(headers):
+        column = columns[index] if index < len(columns) else empty
+        if _is_convert_str_like(converters[index]):
+            chunk[header] = _convert_column(column, numpy)
+        else:
+            chunk[header] = _column_array(list(map(converters[index], column)), numpy)
+    return chunk
+
+
+async def csv_to_column_chunks(
+    path: str,
+    chunk_size: int,
+    mode='r',
+    encoding='utf-8',
+    newline='',
+    delimiter=',',
+    schema: _Schema | _typing.Literal['infer'] | None = None,
+    sample_size=100,
+    numpy: bool | None = None,
+    compression: str | None = 'infer',
+    block_size: int | None = _BLOCK_SIZE
+) -> _typing.AsyncGenerator[dict[str, _Column], None]:
+    """Asynchronously read a CSV by path and async yield chunks of columns.
+    
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    chunk_size : int
+        Maximum number of rows per chunk.
+    mode : str, optional
+        Mode while opening a file.
+    encoding : str, optional
+        The encoding format.
+    newline : str, optional
+        How newlines mode works.
+    delimiter : str, optional
+        CSV file delimiter character, or 'auto' to sniff it from the
+        leading characters, see dialect.sniff_csv_file.
+    schema : dict[str, Any] | 'infer' | None, optional
+        Column type plan applied with compiled converters, see
+        convert.compile_schema. 'infer' infers the plan from the first
+        sample_size rows. None converts every value with convert_str.
+    sample_size : int, optional
+        Number of rows used to infer the schema.
+    numpy : bool | None, optional
+        Use numpy.ndarray for numeric columns. None uses NumPy when it is
+        installed.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    block_size : int | None, optional
+        Characters read from the file per thread-pool call.
+
+    Returns
+    -------
+    AsyncGenerator[dict[str, array | list]]
+        An async generator that yields chunks of CSV rows as dicts of columns.
+    
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+        
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.read import csv_to_column_chunks
+    >>>
+    >>> async def sum_lat_degrees(path: str) -> int:
+    >>>     total = 0
+    >>>     async for chunk in csv_to_column_chunks(path, 1000):
+    >>>         total += sum(chunk['LatD'])
+    >>>     return total
+    >>>
+    >>> asyncio.run(sum_lat_degrees('data/cities.csv'))
+    4969
+    """
+    async with _open_csv(path, mode, encoding, newline, compression, block_size) as f:
+        f, delimiter = await _path_dialect(path, f, delimiter, encoding, compression, None)
+        async for chunk in csv_file_to_column_chunks(f, chunk_size, delimiter, schema, sample_size, numpy):
             yield chunk
\ No newline at end of file
@@ -0,0 +1,324 @@
+import collections as _collections
+import collections.abc as _abc
+import csv as _csv
+import keyword as _keyword
+import typing as _typing
+
+from .convert import convert_str as _convert_str
+
+ROW_TYPES = ('dict', 'tuple', 'namedtuple', 'slots', 'lazy')
+"""Supported row_type values of the record readers."""
+
+RowType = _typing.Literal['dict', 'tuple', 'namedtuple', 'slots', 'lazy']
+"""How the record readers represent each row."""
+
+Row = _typing.Any
+"""A record of the record readers: a dict, tuple, namedtuple, slots_class instance or LazyRow, by row_type."""
+
+_MISSING = object()
+
+
+def field_names(headers: _typing.Sequence[str]) -> list[str]:
+    """Attribute names for headers, renaming invalid or repeated ones to _index like namedtuple."""
+    names = []
+    seen = set()
+    for index, header in enumerate(headers):
+        if (not header.isidentifier() or _keyword.iskeyword(header)
+                or header.startswith('_') or header in seen):
+            header = f'_{index}'
+        seen.add(header)
+        names.append(header)
+    return names
+
+
+def slots_class(headers: _typing.Sequence[str], name='Row') -> type:
+    """Generate a class with one __slots__ attribute per header.
+
+    Instances take far less memory than dicts, compare equal by value and
+    iterate over their values in header order, so writers accept them like
+    tuples. Headers that are not valid attribute names are renamed as
+    namedtuple(rename=True) would.
+
+    Parameters
+    ----------
+    headers : Sequence[str]
+        CSV column header names.
+    name : str, optional
+        Name of the generated class.
+
+    Returns
+    -------
+    type
+        The class, built from values in header order with cls._make(values).
+
+    Example
+    -------
+    >>> from aiocsv_utils.rows import slots_class
+    >>>
+    >>> City = slots_class(['City', 'State'])
+    >>> City._make(['Youngstown', 'OH']).State
+    'OH'
+    """
+    fields = tuple(field_names(headers))
+
+    def __init__(self, *values: _typing.Any) -> None:
+        if len(values) != len(fields):
+            raise TypeError(f'{name} takes {len(fields)} values, {len(values)} given')
+        for setter, value in zip(setters, values):
+            setter(self, value)
+
+    def _make(cls, values: _typing.Iterable[_typing.Any]) -> _typing.Any:
+        row = object.__new__(cls)
+        for setter, value in zip(setters, values):
+            setter(row, value)
+        return row
+
+    def __iter__(self) -> _typing.Iterator[_typing.Any]:
+        for getter in getters:
+            yield getter(self)
+
+    def __len__(self) -> int:
+        return len(fields)
+
+    def __getitem__(self, index: int | slice) -> _typing.Any:
+        return tuple(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{field}={value!r}' for field, value in zip(fields, self))
+        return f'{name}({values})'
+
+    def _asdict(self) -> dict[str, _typing.Any]:
+        return dict(zip(fields, self))
+
+    cls = type(name, (), {
+        '__slots__': fields,
+        '_fields': fields,
+        '_headers': tuple(headers),
+        '__init__': __init__,
+        '_make': classmethod(_make),
+        '__iter__': __iter__,
+        '__len__': __len__,
+        '__getitem__': __getitem__,
+        '__eq__': __eq__,
+        '__hash__': None,
+        '__repr__': __repr__,
+        '_asdict': _asdict
+    })
+    setters = [cls.__dict__[field].__set__ for field in fields]
+    getters = [cls.__dict__[field].__get__ for field in fields]
+    return cls
+
+
+class _LazyLayout:
+    """Header layout shared by every LazyRow of one read."""
+    __slots__ = ('fields', 'positions', 'indexes', 'converters')
+
+    def __init__(
+        self,
+        fields: _typing.Sequence[str],
+        indexes: _typing.Sequence[int],
+        converters: _typing.Sequence[_typing.Callable[[str], _typing.Any]]
+    ) -> None:
+        self.fields = tuple(fields)
+        self.positions = {field: position for position, field in enumerate(self.fields)}
+        self.indexes = tuple(indexes)
+        self.converters = tuple(converters)
+
+
+class LazyRow(_abc.Mapping):
+    """Read-only record view over a raw CSV row that converts a field when it is accessed.
+
+    Look fields up by header name or by position. Converted values are
+    cached, and fields that are never accessed are never converted. Writers
+    copy the raw strings of a LazyRow whose fields match their headers.
+    """
+    __slots__ = ('_layout', '_raw', '_values')
+
+    def __init__(self, layout: _LazyLayout, raw: _typing.Sequence[str | None]) -> None:
+        self._layout = layout
+        self._raw = raw
+        self._values: list[_typing.Any] | None = None
+
+    def _value(self, position: int) -> _typing.Any:
+        if self._values is None:
+            self._values = [_MISSING] * len(self._layout.fields)
+        value = self._values[position]
+        if value is _MISSING:
+            index = self._layout.indexes[position]
+            raw = self._raw[index] if index < len(self._raw) else None
+            value = None if raw is None else self._layout.converters[position](raw)
+            self._values[position] = value
+        return value
+
+    def __getitem__(self, key: str | int) -> _typing.Any:
+        if isinstance(key, int):
+            return self._value(range(len(self._layout.fields))[key])
+        return self._value(self._layout.positions[key])
+
+    def __iter__(self) -> _typing.Iterator[str]:
+        return iter(self._layout.fields)
+
+    def __len__(self) -> int:
+        return len(self._layout.fields)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout.positions
+
+    def __repr__(self) -> str:
+        return f'LazyRow({dict(self)!r})'
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Header names of the row's fields."""
+        return self._layout.fields
+
+    @property
+    def raw(self) -> list[str | None]:
+        """Unconverted field strings in field order, None for missing fields."""
+        raw = self._raw
+        return [raw[index] if index < len(raw) else None for index in self._layout.indexes]
+
+
+def row_factory(
+    headers: _typing.Sequence[str],
+    row_type: RowType = 'dict',
+    indexes: _typing.Sequence[int] | None = None,
+    converters: _typing.Sequence[_typing.Callable[[str], _typing.Any]] | None = None
+) -> _typing.Callable[[_typing.Any], _typing.Any]:
+    """Compile a function building a row of row_type, created once per read.
+
+    Parameters
+    ----------
+    headers : Sequence[str]
+        Header names of the row's fields.
+    row_type : 'dict' | 'tuple' | 'namedtuple' | 'slots' | 'lazy', optional
+        'dict', 'tuple', a namedtuple or slots_class built from headers, or
+        LazyRow.
+    indexes : Sequence[int] | None, optional
+        With 'lazy', index in the raw row of each field. None is every
+        field in order.
+    converters : Sequence[Callable[[str], Any]] | None, optional
+        With 'lazy', converter of each field, see convert.compile_schema.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Builds a row from converted values in header order, or from the
+        raw row with 'lazy'.
+
+    Raises
+    ------
+    ValueError
+        If row_type is not supported.
+
+    Example
+    -------
+    >>> from aiocsv_utils.rows import row_factory
+    >>>
+    >>> make = row_factory(['City', 'State'], 'namedtuple')
+    >>> make(['Youngstown', 'OH'])
+    Row(City='Youngstown', State='OH')
+    """
+    if row_type == 'dict':
+        fields = list(headers)
+        return lambda values: dict(zip(fields, values))
+    if row_type == 'tuple':
+        return tuple
+    if row_type == 'namedtuple':
+        return _collections.namedtuple('Row', headers, rename=True)._make
+    if row_type == 'slots':
+        return slots_class(headers)._make
+    if row_type == 'lazy':
+        if indexes is None:
+            indexes = range(len(headers))
+        if converters is None:
+            converters = [_convert_str] * len(headers)
+        layout = _LazyLayout(headers, indexes, converters)
+        return lambda raw: LazyRow(layout, raw)
+    raise ValueError(f'Unsupported row_type: {row_type!r}')
+
+
+def row_values(row: _typing.Any, headers: _typing.Sequence[str]) -> list[_typing.Any]:
+    """Field values of any row the readers yield, in headers order.
+
+    Mappings are looked up by name, missing keys give '' and extra keys
+    raise ValueError, as with csv.DictWriter. A LazyRow whose fields are
+    headers gives its raw strings without converting them. Any other row,
+    such as a tuple, namedtuple or slots_class instance, is taken to hold
+    its values in header order and must have one per header.
+
+    Parameters
+    ----------
+    row : Any
+        dict, LazyRow, tuple, namedtuple or slots_class instance.
+    headers : Sequence[str]
+        CSV column header names.
+
+    Returns
+    -------
+    list[Any]
+        Values to write.
+
+    Raises
+    ------
+    ValueError
+        If a mapping has keys that are not in headers, or a row of values
+        does not have one value per header.
+
+    Example
+    -------
+    >>> from aiocsv_utils.rows import row_values
+    >>>
+    >>> row_values({'State': 'OH'}, ['City', 'State'])
+    ['', 'OH']
+    """
+    if isinstance(row, LazyRow):
+        if row.fields == tuple(headers):
+            return [value if value is not None else '' for value in row.raw]
+    elif not isinstance(row, _abc.Mapping):
+        values = list(row)
+        if len(values) != len(headers):
+            raise ValueError(f'Row has {len(values)} fields but there are {len(headers)} headers.')
+        return values
+    extra = row.keys() - set(headers)
+    if extra:
+        raise ValueError('dict contains fields not in fieldnames: ' + ', '.join(map(repr, extra)))
+    return [row.get(header, '') for header in headers]
+
+
+class RowWriter:
+    """csv.DictWriter counterpart that writes dicts and every reader row type.
+
+    Parameters
+    ----------
+    file : Any
+        Text file object with a write method, such as io.StringIO.
+    headers : Sequence[str]
+        CSV column header names.
+    """
+    def __init__(self, file: _typing.Any, headers: _typing.Sequence[str]) -> None:
+        self.headers = tuple(headers)
+        self._names = frozenset(self.headers)
+        self._writer = _csv.writer(file)
+
+    def _values(self, row: _typing.Any) -> _typing.Any:
+        if type(row) is dict:
+            if not self._names.issuperset(row):
+                return row_values(row, self.headers)
+            return [row.get(header, '') for header in self.headers]
+        if type(row) is tuple:
+            if len(row) != len(self.headers):
+                raise ValueError(f'Row has {len(row)} fields but there are {len(self.headers)} headers.')
+            return row
+        return row_values(row, self.headers)
+
+    def writerow(self, row: _typing.Any) -> _typing.Any:
+        return self._writer.writerow(self._values(row))
+
+    def writerows(self, rows: _typing.Iterable[_typing.Any]) -> None:
+        self._writer.writerows(map(self._values, rows))
@@ -0,0 +1,371 @@
+import asyncio as _asyncio
+import bz2 as _bz2
+import csv as _csv
+import gzip as _gzip
+import io as _io
+import lzma as _lzma
+import os as _os
+import shutil as _shutil
+import stat as _stat
+import tempfile as _tempfile
+import typing as _typing
+
+from .cache import MetadataCache as _MetadataCache
+from .compression import detect_compression as _detect_compression
+from .write import check_csv_headers as _check_csv_headers
+from .write import serialize_records as _serialize_records
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    _fcntl = None
+
+MAX_BYTES = 1 << 20
+"""Default number of queued characters written per write call."""
+
+MAX_QUEUE = 1024
+"""Default number of queued writes before writers wait."""
+
+_CLOSE = None
+
+
+def _compress(data: bytes, compression: str | None) -> bytes:
+    """Compress data as one self-contained member, so members can be appended."""
+    if compression is None:
+        return data
+    if compression == 'gzip':
+        return _gzip.compress(data)
+    if compression == 'bz2':
+        return _bz2.compress(data)
+    if compression == 'xz':
+        return _lzma.compress(data)
+    try:
+        from compression import zstd
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            raise ImportError('zstd compression requires Python 3.14 or the zstandard package.') from None
+    return zstd.compress(data)
+
+
+def _header_row(headers: list[str]) -> str:
+    buffer = _io.StringIO()
+    _csv.writer(buffer).writerow(headers)
+    return buffer.getvalue()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[_os.write(fd, view):]
+
+
+def _fsync_directory(path: str) -> None:
+    try:
+        fd = _os.open(_os.path.dirname(_os.path.abspath(path)), _os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        _os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        _os.close(fd)
+
+
+class SafeCsvWriter:
+    """CSV writer that many tasks, and processes, can append to without tearing records.
+
+    write_row and write_rows serialize records in the calling task and put
+    the text on a bounded queue. One background task drains the queue and
+    writes everything queued so far with a single write call, so records
+    from concurrent tasks never interleave. In append mode each write holds
+    an exclusive fcntl lock on the file, so other processes using
+    SafeCsvWriter on the same path are serialized too, and the header is
+    written by whichever writer finds the file empty.
+
+    With atomic=True, rows go to a temporary file in the same directory
+    (starting from a copy of the file in 'a' mode). commit fsyncs it and
+    renames it over path, so readers and crashes see either the old or the
+    complete new file. Leaving the context with an exception aborts instead.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    headers : Sequence[str]
+        CSV Column header names.
+    mode : str, optional
+        'a' appends and 'w' replaces the file.
+    atomic : bool, optional
+        Write to a temporary file and rename it over path on commit.
+    lock : bool | None, optional
+        Hold an fcntl lock on the file for each write in append mode. None
+        locks when fcntl is available.
+    fsync : bool, optional
+        fsync the file after every write, not only on commit.
+    max_bytes : int, optional
+        Maximum number of queued characters written per write call.
+    max_queue : int, optional
+        Number of queued writes before write_row and write_rows wait.
+    encoding : str, optional
+        The encoding format.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension. Each write appends one
+        compressed member, which the readers decompress as one stream.
+    check_headers : bool, optional
+        In 'a' mode, raise ValueError on open if the file's header row
+        differs from headers, see write.check_csv_headers.
+    cache : MetadataCache | None, optional
+        Cache to look the file's headers up in when checking them.
+
+    Raises
+    ------
+    ValueError
+        If check_headers is True and the file's headers differ.
+    OSError
+        If lock is True and fcntl is not available.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.safe_write import SafeCsvWriter
+    >>>
+    >>> headers = ['id', 'name']
+    >>>
+    >>> async def log_events(path: str) -> None:
+    >>>     async with SafeCsvWriter(path, headers) as writer:
+    >>>         await asyncio.gather(*(writer.write_row({'id': i, 'name': f'task-{i}'}) for i in range(100)))
+    >>>
+    >>> asyncio.run(log_events('data/events.csv'))
+    """
+    def __init__(
+        self,
+        path: str,
+        headers: _typing.Sequence[str],
+        mode='a',
+        atomic=False,
+        lock: bool | None = None,
+        fsync=False,
+        max_bytes=MAX_BYTES,
+        max_queue=MAX_QUEUE,
+        encoding='utf-8',
+        compression: str | None = 'infer',
+        check_headers=False,
+        cache: _MetadataCache | None = None
+    ) -> None:
+        if mode not in ('a', 'w'):
+            raise ValueError(f"mode must be 'a' or 'w', not {mode!r}")
+        if lock and _fcntl is None:
+            raise OSError('File locking requires fcntl, which is not available on this platform.')
+        self.path = path
+        self.headers = list(headers)
+        self.mode = mode
+        self.atomic = atomic
+        self.lock = _fcntl is not None if lock is None else lock
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.encoding = encoding
+        self.compression = _detect_compression(path, compression)
+        self.check_headers = check_headers
+        self.cache = cache
+        self._queue: _asyncio.Queue[str | None] = _asyncio.Queue(max_queue)
+        self._header = _header_row(self.headers)
+        self._fd: int | None = None
+        self._temp_path: str | None = None
+        self._task: _asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    async def __aenter__(self) -> 'SafeCsvWriter':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info) -> None:
+        if exc_type is not None and self.atomic:
+            await self.abort()
+        else:
+            await self.commit()
+
+    @property
+    def closed(self) -> bool:
+        return self._task is None
+
+    def _open_sync(self) -> None:
+        if self.atomic:
+            directory, name = _os.path.split(_os.path.abspath(self.path))
+            fd, self._temp_path = _tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+            try:
+                try:
+                    _os.fchmod(fd, _stat.S_IMODE(_os.stat(self.path).st_mode))
+                except FileNotFoundError:
+                    _os.fchmod(fd, 0o644)
+                if self.mode == 'a' and _os.path.exists(self.path):
+                    with open(self.path, 'rb') as source, open(fd, 'wb', closefd=False) as target:
+                        _shutil.copyfileobj(source, target)
+                    _os.lseek(fd, 0, _os.SEEK_END)
+            except BaseException:
+                _os.close(fd)
+                _os.remove(self._temp_path)
+                raise
+            self._fd = fd
+            return
+        flags = _os.O_WRONLY | _os.O_CREAT | _os.O_APPEND
+        self._fd = _os.open(self.path, flags, 0o666)
+        if self.mode == 'w':
+            self._locked(_os.ftruncate, self._fd, 0)
+
+    def _locked(self, function: _typing.Callable[..., _typing.Any], *args: _typing.Any) -> _typing.Any:
+        if not self.lock or self.atomic:
+            return function(*args)
+        _fcntl.flock(self._fd, _fcntl.LOCK_EX)
+        try:
+            return function(*args)
+        finally:
+            _fcntl.flock(self._fd, _fcntl.LOCK_UN)
+
+    def _append(self, text: str) -> None:
+        # The size is checked under the lock, so only one writer adds the header.
+        if _os.fstat(self._fd).st_size == 0:
+            text = self._header + text
+        _write_all(self._fd, _compress(text.encode(self.encoding), self.compression))
+        if self.fsync:
+            _os.fsync(self._fd)
+
+    async def open(self) -> None:
+        """Open the file and start the background writer, does nothing if already open."""
+        if self._task is not None:
+            return
+        if self.check_headers and self.mode == 'a':
+            await _check_csv_headers(self.path, self.headers, self.compression, self.cache)
+        loop = _asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._open_sync)
+        self._error = None
+        self._task = _asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        loop = _asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            parts = [await self._queue.get()]
+            size = len(parts[0] or '')
+            while size < self.max_bytes and not self._queue.empty():
+                parts.append(self._queue.get_nowait())
+                size += len(parts[-1] or '')
+            closing = _CLOSE in parts
+            text = ''.join(part for part in parts if part)
+            try:
+                if text and self._error is None:
+                    await loop.run_in_executor(None, self._locked, self._append, text)
+            except BaseException as error:
+                self._error = error
+            finally:
+                for _ in parts:
+                    self._queue.task_done()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise self._error
+        if self._task is None:
+            raise ValueError('I/O operation on closed SafeCsvWriter.')
+
+    async def write_row(self, record: _typing.Any) -> None:
+        """Queue a record, waiting while the queue is full.
+
+        Parameters
+        ----------
+        record : Any
+            Record to be written to CSV file, a dict or a row of any
+            read row_type, see rows.row_values.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed or the record has fields not in headers.
+        OSError
+            If an earlier write failed.
+        """
+        self._check()
+        await self._queue.put(_serialize_records([record], self.headers))
+
+    async def write_rows(self, records: _typing.Iterable[_typing.Any]) -> None:
+        """Queue records to be written together, waiting while the queue is full.
+
+        Parameters
+        ----------
+        records : Iterable[Any]
+            Records to be written to CSV file, dicts or rows of any
+            read row_type, see rows.row_values.
+        """
+        self._check()
+        text = _serialize_records(records, self.headers)
+        if text:
+            await self._queue.put(text)
+
+    async def flush(self) -> None:
+        """Wait until every queued record is written to the file."""
+        self._check()
+        await self._queue.join()
+        self._check()
+
+    async def _stop(self) -> None:
+        await self._queue.put(_CLOSE)
+        task, self._task = self._task, None
+        await task
+
+    async def commit(self) -> None:
+        """Write every queued record, fsync and close, renaming over path in atomic mode.
+
+        Raises
+        ------
+        OSError
+            If a write failed, in which case an atomic file is not renamed.
+        """
+        if self._task is None:
+            return
+        await self._stop()
+        loop = _asyncio.get_running_loop()
+        if self._error is not None:
+            await loop.run_in_executor(None, self._discard)
+            raise self._error
+        await loop.run_in_executor(None, self._commit_sync)
+
+    def _commit_sync(self) -> None:
+        try:
+            if _os.fstat(self._fd).st_size == 0:
+                self._locked(self._append, '')
+            if self.atomic or self.fsync:
+                _os.fsync(self._fd)
+        except BaseException:
+            self._discard()
+            raise
+        _os.close(self._fd)
+        self._fd = None
+        if self.atomic:
+            temp_path, self._temp_path = self._temp_path, None
+            _os.replace(temp_path, self.path)
+            _fsync_directory(self.path)
+
+    def _discard(self) -> None:
+        if self._fd is not None:
+            _os.close(self._fd)
+            self._fd = None
+        if self._temp_path is not None:
+            temp_path, self._temp_path = self._temp_path, None
+            _os.remove(temp_path)
+
+    async def abort(self) -> None:
+        """Stop writing and close, discarding the temporary file in atomic mode.
+
+        Records already written in append mode are kept.
+        """
+        if self._task is None:
+            return
+        await self._stop()
+        await _asyncio.get_running_loop().run_in_executor(None, self._discard)
+
+    async def aclose(self) -> None:
+        """Same as commit."""
+        await self.commit()
@@ -0,0 +1,414 @@
+import asyncio as _asyncio
+import os as _os
+import typing as _typing
+
+from .compression import detect_compression as _detect_compression
+from .compression import open_sync as _open_sync
+
+try:
+    import numpy as _numpy
+except ImportError:  # pragma: no cover - optional dependency
+    _numpy = None
+
+BLOCK_SIZE = 1 << 20
+"""Default number of bytes read per block while scanning."""
+
+
+def next_record_boundary(
+    file: _typing.BinaryIO,
+    offset: int,
+    in_quotes=False,
+    quotechar=b'"',
+    block_size=BLOCK_SIZE
+) -> int:
+    """Find the byte offset just after the next record terminator.
+
+    A newline ends a record when it is outside quotes. Quote state is tracked
+    by the parity of quote characters, which also holds for "" escapes.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        CSV file opened in binary mode.
+    offset : int
+        Byte offset to start scanning from.
+    in_quotes : bool, optional
+        Whether offset is inside a quoted field.
+    quotechar : bytes, optional
+        CSV quote character.
+    block_size : int, optional
+        Number of bytes read per block.
+
+    Returns
+    -------
+    int
+        Offset of the start of the next record, or the file size if there is
+        no further record terminator.
+
+    Example
+    -------
+    >>> from aiocsv_utils.scan import next_record_boundary
+    >>>
+    >>> with open('data/cities.csv', 'rb') as f:
+    >>>     next_record_boundary(f, 0)
+    48
+    """
+    file.seek(offset)
+    while True:
+        block = file.read(block_size)
+        if not block:
+            return offset
+        start = 0
+        while True:
+            newline = block.find(b'\n', start)
+            if newline == -1:
+                in_quotes ^= bool(block.count(quotechar, start) & 1)
+                break
+            in_quotes ^= bool(block.count(quotechar, start, newline) & 1)
+            if not in_quotes:
+                return offset + newline + 1
+            start = newline + 1
+        offset += len(block)
+
+
+def quote_parity(
+    file: _typing.BinaryIO,
+    start: int,
+    stop: int,
+    quotechar=b'"',
+    block_size=BLOCK_SIZE
+) -> bool:
+    """Return True if an odd number of quote characters lie in [start, stop)."""
+    file.seek(start)
+    parity = 0
+    remaining = stop - start
+    while remaining > 0:
+        block = file.read(min(block_size, remaining))
+        if not block:
+            break
+        parity ^= block.count(quotechar) & 1
+        remaining -= len(block)
+    return bool(parity)
+
+
+def split_ranges(
+    path: str,
+    range_size: int,
+    quotechar=b'"',
+    block_size=BLOCK_SIZE
+) -> tuple[tuple[int, int], list[tuple[int, int]]]:
+    """Split a CSV file into byte ranges aligned to record boundaries.
+
+    Quoted fields containing newlines never straddle two ranges. Scanning
+    assumes an ASCII compatible encoding and standard "" quote escaping.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    range_size : int
+        Approximate number of bytes per range.
+    quotechar : bytes, optional
+        CSV quote character.
+    block_size : int, optional
+        Number of bytes read per block.
+
+    Returns
+    -------
+    tuple[tuple[int, int], list[tuple[int, int]]]
+        The (start, stop) byte range of the header record and the ranges of
+        the records after it, in file order.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> from aiocsv_utils.scan import split_ranges
+    >>>
+    >>> split_ranges('data/cities.csv', 2048)
+    ((0, 48), [(48, 2113), (2113, 4169), (4169, 4620)])
+    """
+    size = _os.path.getsize(path)
+    with open(path, 'rb') as file:
+        header_end = next_record_boundary(file, 0, False, quotechar, block_size)
+        ranges = []
+        start = header_end
+        while start < size:
+            target = start + max(range_size, 1)
+            if target >= size:
+                stop = size
+            else:
+                in_quotes = quote_parity(file, start, target, quotechar, block_size)
+                stop = next_record_boundary(file, target, in_quotes, quotechar, block_size)
+            ranges.append((start, stop))
+            start = stop
+    return (0, header_end), ranges
+
+
+def scan_records(
+    file: _typing.BinaryIO,
+    offset=0,
+    every=0,
+    quotechar=b'"',
+    block_size=BLOCK_SIZE
+) -> tuple[int, list[int]]:
+    """Count the records from offset and collect the offset of every Nth one.
+
+    Blank lines are not records, matching csv_to_records. Newlines inside
+    quoted fields do not end a record. With NumPy installed each block is
+    scanned with vectorized byte comparisons instead of line by line.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        CSV file opened in binary mode.
+    offset : int, optional
+        Byte offset of a record boundary to start scanning from.
+    every : int, optional
+        Collect the start offset of records 0, every, 2 * every, ... counted
+        from offset. 0 collects none and 1 collects all.
+    quotechar : bytes, optional
+        CSV quote character.
+    block_size : int, optional
+        Number of bytes read per block.
+
+    Returns
+    -------
+    tuple[int, list[int]]
+        The number of records and the collected record start offsets.
+
+    Example
+    -------
+    >>> from aiocsv_utils.scan import scan_records
+    >>>
+    >>> with open('data/cities.csv', 'rb') as f:
+    >>>     scan_records(f, 48, every=50)
+    (128, [48, 1799, 3617])
+    """
+    if _numpy is not None:
+        return _scan_arrays(file, offset, every, quotechar, block_size)
+    return _scan_lines(file, offset, every, quotechar, block_size)
+
+
+def _scan_arrays(
+    file: _typing.BinaryIO,
+    offset: int,
+    every: int,
+    quotechar: bytes,
+    block_size: int
+) -> tuple[int, list[int]]:
+    # Records end at newlines preceded by an even number of quotes since the
+    # last record boundary, found with searchsorted over the quote positions.
+    file.seek(offset)
+    count = 0
+    offsets: list[int] = []
+    position = offset
+    record_start = offset
+    in_quotes = False
+    carry = b''
+    while True:
+        block = file.read(block_size)
+        if not block:
+            break
+        data = carry + block if carry else block
+        end = data.rfind(b'\n') + 1
+        carry = data[end:]
+        if not end:
+            continue
+        array = _numpy.frombuffer(data, _numpy.uint8, end)
+        ends = _numpy.flatnonzero(array == 10)
+        if in_quotes or quotechar in data:
+            quotes = _numpy.flatnonzero(array == quotechar[0])
+            ends = ends[((_numpy.searchsorted(quotes, ends) + in_quotes) & 1) == 0]
+            in_quotes = bool((len(quotes) + in_quotes) & 1)
+        if len(ends):
+            starts = _numpy.empty_like(ends)
+            starts[0] = record_start - position
+            starts[1:] = ends[:-1] + 1
+            lengths = ends - starts
+            blank = (lengths == 0) | ((lengths == 1) & (array[_numpy.maximum(starts, 0)] == 13))
+            if blank.any():
+                starts = starts[~blank]
+            if every:
+                offsets.extend((starts[-count % every::every] + position).tolist())
+            count += len(starts)
+            record_start = position + int(ends[-1]) + 1
+        position += end
+    if in_quotes or carry not in (b'', b'\r'):
+        if every and count % every == 0:
+            offsets.append(record_start)
+        count += 1
+    return count, offsets
+
+
+def _scan_lines(
+    file: _typing.BinaryIO,
+    offset: int,
+    every: int,
+    quotechar: bytes,
+    block_size: int
+) -> tuple[int, list[int]]:
+    file.seek(offset)
+    count = 0
+    offsets: list[int] = []
+    target = 0 if every else -1
+    position = offset
+    record_start = offset
+    in_quotes = False
+    content = False
+    carry = b''
+    while True:
+        block = file.read(block_size)
+        data = carry + block if carry else block
+        if block:
+            lines = data.split(b'\n')
+            carry = lines.pop()
+        else:
+            lines = [data] if data else []
+        if not in_quotes and quotechar not in data:
+            records = len(lines) - lines.count(b'') - lines.count(b'\r')
+            if target < 0 or count + records <= target:
+                count += records
+                position += len(data) - len(carry) if block else len(data)
+                lines = []
+        for line in lines:
+            if not in_quotes:
+                record_start = position
+                content = line != b'' and line != b'\r'
+            if quotechar in line and line.count(quotechar) & 1:
+                in_quotes = not in_quotes
+            position += len(line) + 1
+            if content and not in_quotes:
+                if count == target:
+                    offsets.append(record_start)
+                    target += every
+                count += 1
+        if not block:
+            if in_quotes:
+                if count == target:
+                    offsets.append(record_start)
+                count += 1
+            return count, offsets
+
+
+def _scan_path(
+    path: str,
+    every: int,
+    compression: str | None,
+    quotechar: bytes,
+    block_size: int
+) -> tuple[int, list[int]]:
+    with _open_sync(path, 'rb', None, None, compression) as file:
+        if compression is not None:
+            # Compressed streams are scanned once from the start, counting the header as a record.
+            count, _ = scan_records(file, 0, 0, quotechar, block_size)
+            return max(count - 1, 0), []
+        header_end = next_record_boundary(file, 0, False, quotechar, block_size)
+        return scan_records(file, header_end, every, quotechar, block_size)
+
+
+async def scan_csv(
+    path: str,
+    every=0,
+    compression: str | None = 'infer',
+    quotechar=b'"',
+    block_size=BLOCK_SIZE
+) -> tuple[int, list[int]]:
+    """Count the records after the header of a CSV by path and collect every Nth one's byte offset.
+
+    The raw bytes are scanned in blocks of block_size in a thread, without
+    decoding or parsing fields, see scan_records. The offsets can be used to
+    seek to a record or to split the file into ranges of equal record count.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    every : int, optional
+        Collect the byte offset of records 0, every, 2 * every, ... after
+        the header. 0 collects none and 1 collects all.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension. Compressed files can only be
+        counted.
+    quotechar : bytes, optional
+        CSV quote character.
+    block_size : int, optional
+        Number of bytes read per block.
+
+    Returns
+    -------
+    tuple[int, list[int]]
+        The number of records and the collected record start offsets.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ValueError
+        If every is set for a compressed file.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.scan import scan_csv
+    >>>
+    >>> asyncio.run(scan_csv('data/cities.csv', every=50))
+    (128, [48, 1799, 3617])
+    """
+    compression = _detect_compression(path, compression)
+    if every and compression is not None:
+        raise ValueError('Record offsets can only be collected from uncompressed files.')
+    loop = _asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _scan_path, path, every, compression, quotechar, block_size)
+
+
+async def csv_row_count(
+    path: str,
+    compression: str | None = 'infer',
+    quotechar=b'"',
+    block_size=BLOCK_SIZE
+) -> int:
+    """Count the records after the header of a CSV by path without parsing them.
+
+    Gives the number of rows csv_to_records yields: blank lines are skipped
+    and newlines inside quoted fields do not end a record. The scan runs in
+    a thread, see scan_csv.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    quotechar : bytes, optional
+        CSV quote character.
+    block_size : int, optional
+        Number of bytes read per block.
+
+    Returns
+    -------
+    int
+        Number of records.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.scan import csv_row_count
+    >>>
+    >>> asyncio.run(csv_row_count('data/cities.csv.gz'))
+    128
+    """
+    count, _ = await scan_csv(path, 0, compression, quotechar, block_size)
+    return count
@@ -0,0 +1,321 @@
+import asyncio as _asyncio
+import collections as _collections
+import concurrent.futures as _futures
+import contextlib as _contextlib
+import csv as _csv
+import functools as _functools
+import heapq as _heapq
+import io as _io
+import itertools as _itertools
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import typing as _typing
+
+import aiocsv as _aiocsv
+
+from .compression import detect_compression as _detect_compression
+from .compression import open_csv as _open_csv
+from .convert import convert_str as _convert_str
+from .convert import Schema as _Schema
+from .convert import compile_schema as _compile_schema
+from .parallel import mp_context as _mp_context
+from .parallel import read_range as _read_range
+from .read import csv_headers as _csv_headers
+from .read import column_index as _column_index
+from .scan import split_ranges as _split_ranges
+from .write import create_csv as _create_csv
+from .write import write_csv_chunks as _write_csv_chunks
+
+RUN_SIZE = 64 << 20
+"""Default number of input bytes sorted in memory per run."""
+
+MERGE_WIDTH = 64
+"""Default maximum number of runs merged at once."""
+
+_OUTPUT_CHUNK = 10_000
+
+_KeySpec = tuple[list[int], list[_typing.Callable[[str], _typing.Any]]]
+
+
+def _key_spec(headers: list[str], by: _typing.Sequence[str], schema: _Schema | None) -> _KeySpec:
+    indexes = [_column_index(headers, column) for column in by]
+    if schema is None:
+        return indexes, [_convert_str] * len(indexes)
+    converters = _compile_schema(headers, schema)
+    return indexes, [converters[index] for index in indexes]
+
+
+def value_key(value: _typing.Any) -> tuple:
+    """Sort key of a converted value that orders mixed columns.
+
+    None sorts first, then numbers (and bools), then strings, so a column
+    mixing convert_str results still has a total order.
+
+    Parameters
+    ----------
+    value : Any
+        Converted value, such as a convert_str result, or None if missing.
+
+    Returns
+    -------
+    tuple
+        Type rank and the value.
+
+    Example
+    -------
+    >>> from aiocsv_utils.sort import value_key
+    >>>
+    >>> sorted(['b', 2, None, 1.5], key=value_key)
+    [None, 1.5, 2, 'b']
+    """
+    if value is None:
+        return 0, 0
+    if isinstance(value, str):
+        return 2, value
+    return 1, value
+
+
+def _row_key(spec: _KeySpec) -> _typing.Callable[[list[str]], tuple]:
+    indexes, converters = spec
+
+    def key(row: list[str]) -> tuple:
+        return tuple(value_key(convert(row[index]) if index < len(row) else None)
+                     for index, convert in zip(indexes, converters))
+    return key
+
+
+def _spill(rows: list[list[str]], temp_dir: str) -> str:
+    fd, run_path = _tempfile.mkstemp(suffix='.csv', dir=temp_dir)
+    with open(fd, 'w', encoding='utf-8', newline='') as f:
+        _csv.writer(f).writerows(rows)
+    return run_path
+
+
+def _sort_rows(rows: list[list[str]], spec: _KeySpec, reverse: bool, temp_dir: str) -> str:
+    rows.sort(key=_row_key(spec), reverse=reverse)
+    return _spill(rows, temp_dir)
+
+
+def _sort_range(
+    path: str,
+    start: int,
+    stop: int,
+    encoding: str,
+    delimiter: str,
+    spec: _KeySpec,
+    reverse: bool,
+    temp_dir: str
+) -> str:
+    text = _read_range(path, start, stop, encoding)
+    rows = [row for row in _csv.reader(_io.StringIO(text, newline=''), delimiter=delimiter) if row]
+    return _sort_rows(rows, spec, reverse, temp_dir)
+
+
+def _merged_rows(
+    run_paths: list[str],
+    spec: _KeySpec,
+    reverse: bool,
+    stack: _typing.Any
+) -> _typing.Iterator[list[str]]:
+    readers = [_csv.reader(stack.enter_context(open(run_path, 'r', encoding='utf-8', newline='')))
+               for run_path in run_paths]
+    return _heapq.merge(*readers, key=_row_key(spec), reverse=reverse)
+
+
+def _merge_runs(run_paths: list[str], spec: _KeySpec, reverse: bool, temp_dir: str) -> str:
+    fd, run_path = _tempfile.mkstemp(suffix='.csv', dir=temp_dir)
+    with _contextlib.ExitStack() as stack, open(fd, 'w', encoding='utf-8', newline='') as f:
+        _csv.writer(f).writerows(_merged_rows(run_paths, spec, reverse, stack))
+    for merged in run_paths:
+        _os.remove(merged)
+    return run_path
+
+
+async def _runs_from_ranges(
+    loop: _asyncio.AbstractEventLoop,
+    pool: _futures.Executor,
+    path: str,
+    encoding: str,
+    delimiter: str,
+    spec: _KeySpec,
+    reverse: bool,
+    run_size: int,
+    temp_dir: str
+) -> list[str]:
+    _, ranges = await loop.run_in_executor(None, _split_ranges, path, run_size)
+    return list(await _asyncio.gather(*(
+        loop.run_in_executor(pool, _sort_range, path, start, stop, encoding, delimiter, spec, reverse, temp_dir)
+        for start, stop in ranges)))
+
+
+async def _runs_from_reader(
+    loop: _asyncio.AbstractEventLoop,
+    pool: _futures.Executor,
+    max_pending: int,
+    path: str,
+    encoding: str,
+    delimiter: str,
+    compression: str | None,
+    spec: _KeySpec,
+    reverse: bool,
+    run_size: int,
+    temp_dir: str
+) -> list[str]:
+    runs: list[str] = []
+    pending: _collections.deque[_asyncio.Future] = _collections.deque()
+    rows: list[list[str]] = []
+    size = 0
+
+    async def submit() -> None:
+        nonlocal rows, size
+        pending.append(loop.run_in_executor(pool, _sort_rows, rows, spec, reverse, temp_dir))
+        rows, size = [], 0
+        if len(pending) >= max_pending:
+            runs.append(await pending.popleft())
+
+    async with _open_csv(path, 'r', encoding, '', compression) as f:
+        reader = _aiocsv.AsyncReader(f, delimiter=delimiter)
+        await anext(reader, None)
+        async for row in reader:
+            if not row:
+                continue
+            rows.append(row)
+            size += sum(map(len, row)) + len(row)
+            if size >= run_size:
+                await submit()
+    if rows:
+        await submit()
+    runs.extend(await _asyncio.gather(*pending))
+    return runs
+
+
+async def sort_csv(
+    path: str,
+    output: str,
+    by: str | _typing.Sequence[str],
+    reverse=False,
+    encoding='utf-8',
+    delimiter=',',
+    schema: _Schema | None = None,
+    run_size=RUN_SIZE,
+    merge_width=MERGE_WIDTH,
+    max_workers: int | None = None,
+    temp_dir: str | None = None,
+    compression: str | None = 'infer',
+    executor: _futures.Executor | None = None
+) -> int:
+    """Sort a CSV by path on one or more columns into a new CSV, larger than memory if need be.
+
+    The input is split into runs of about run_size bytes that are parsed,
+    sorted and spilled to temporary files in worker processes. Plain files
+    are split into byte ranges read by the workers themselves, compressed
+    files are read here and their rows sent to the workers. Runs are then
+    k-way merged, at most merge_width at a time, and the result is written
+    with write.write_csv_chunks. Field values are copied unchanged, only
+    the sort keys are converted. Fields beyond the header width are dropped.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    output : str
+        File path of the sorted CSV file, replaced if it exists.
+    by : str | Sequence[str]
+        Column or columns to sort on, in priority order.
+    reverse : bool, optional
+        Sort in descending order.
+    encoding : str, optional
+        The encoding format, must be ASCII compatible.
+    delimiter : str, optional
+        CSV file delimiter character of the input. The output uses ','.
+    schema : dict[str, Any] | None, optional
+        Column type plan for the key columns, see convert.compile_schema.
+        None converts keys with convert_str. Numbers sort before strings.
+        Callables in the plan must be picklable.
+    run_size : int, optional
+        Approximate number of input bytes sorted in memory per run. Peak
+        memory is a few times run_size per worker.
+    merge_width : int, optional
+        Maximum number of runs, and so open files, merged at once.
+    max_workers : int | None, optional
+        Number of worker processes, defaults to the number of CPUs.
+    temp_dir : str | None, optional
+        Directory for the spilled runs, defaults to the system temp dir.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension, for both input and output.
+    executor : Executor | None, optional
+        Executor to run the workers in, left running when done. A new
+        ProcessPoolExecutor is used and shut down if None.
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    ValueError
+        If a column in by is not in the CSV headers.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.sort import sort_csv
+    >>>
+    >>> asyncio.run(sort_csv('data/cities.csv', 'data/cities_sorted.csv', ['State', 'City']))
+    128
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    headers = await _csv_headers(path, encoding=encoding, delimiter=delimiter, compression=compression)
+    spec = _key_spec(headers, by, schema)
+    loop = _asyncio.get_running_loop()
+    temp_dir = await loop.run_in_executor(None, _functools.partial(_tempfile.mkdtemp, dir=temp_dir))
+    pool = executor if executor is not None else _futures.ProcessPoolExecutor(max_workers, mp_context=_mp_context())
+    max_pending = max_workers or _os.cpu_count() or 1
+    merge_width = max(merge_width, 2)
+    try:
+        if _detect_compression(path, compression) is None:
+            runs = await _runs_from_ranges(loop, pool, path, encoding, delimiter, spec, reverse, run_size, temp_dir)
+        else:
+            runs = await _runs_from_reader(loop, pool, max_pending, path, encoding, delimiter,
+                                           compression, spec, reverse, run_size, temp_dir)
+        while len(runs) > merge_width:
+            runs = list(await _asyncio.gather(*(
+                loop.run_in_executor(pool, _merge_runs, runs[start:start + merge_width], spec, reverse, temp_dir)
+                for start in range(0, len(runs), merge_width))))
+        await _create_csv(output, headers, compression)
+        return await _write_merged(loop, output, headers, runs, spec, reverse, compression)
+    finally:
+        if executor is None:
+            await loop.run_in_executor(None, _functools.partial(pool.shutdown, wait=True, cancel_futures=True))
+        await loop.run_in_executor(None, _functools.partial(_shutil.rmtree, temp_dir, ignore_errors=True))
+
+
+async def _write_merged(
+    loop: _asyncio.AbstractEventLoop,
+    output: str,
+    headers: list[str],
+    runs: list[str],
+    spec: _KeySpec,
+    reverse: bool,
+    compression: str | None
+) -> int:
+    count = 0
+    with _contextlib.ExitStack() as stack:
+        rows = await loop.run_in_executor(None, _merged_rows, runs, spec, reverse, stack)
+
+        def next_chunk() -> list[dict[str, str]]:
+            return [dict(zip(headers, row)) for row in _itertools.islice(rows, _OUTPUT_CHUNK)]
+
+        async def chunks() -> _typing.AsyncGenerator[list[dict[str, str]], None]:
+            nonlocal count
+            while chunk := await loop.run_in_executor(None, next_chunk):
+                count += len(chunk)
+                yield chunk
+        await _write_csv_chunks(output, chunks(), headers, compression)
+    return count
@@ -1,13 +1,65 @@
+import asyncio as _asyncio
+import contextlib as _contextlib
+import io as _io
 import typing as _typing
 
-import aiofiles as _aiofiles
 from aiofiles.threadpool.text import AsyncTextIOWrapper as _AsyncTextIOWrapper
 from aiocsv import AsyncDictWriter as _AsyncDictWriter
 
+from .cache import MetadataCache as _MetadataCache
+from .compression import open_csv as _open_csv
+from .read import csv_headers as _csv_headers
+from .rows import RowWriter as _RowWriter
+
+
+async def check_csv_headers(
+    path: str,
+    headers: _typing.Sequence[str],
+    compression: str | None = 'infer',
+    cache: _MetadataCache | None = None
+) -> None:
+    """Check that a CSV file about to be appended to has the given headers.
+
+    Missing and empty files pass, since appending creates them.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    headers : Sequence[str]
+        CSV Column header names the records are written with.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    cache : MetadataCache | None, optional
+        Cache to look the file's headers up in, see cache.MetadataCache.
+
+    Raises
+    ------
+    ValueError
+        If the file's header row differs from headers.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.write import check_csv_headers
+    >>>
+    >>> asyncio.run(check_csv_headers('data/people.csv', ['id', 'name']))
+    ValueError: Headers of 'data/people.csv' are ['id', 'name', 'age', 'ssn'], not ['id', 'name']
+    """
+    try:
+        existing = await _csv_headers(path, compression=compression, cache=cache)
+    except (FileNotFoundError, StopAsyncIteration):
+        return
+    if existing != list(headers):
+        raise ValueError(f'Headers of {path!r} are {existing!r}, not {list(headers)!r}')
+
 
 async def create_csv(
     path: str,
-    headers: _typing.Sequence[str]
+    headers: _typing.Sequence[str],
+    compression: str | None = 'infer'
 ) -> None:
     """Replace or create file at path with empty CSV with column headers.
     
@@ -17,6 +69,9 @@ async def create_csv(
         File path to CSV file.
     headers : Sequence[str]
         Column header names to be written to new CSV file.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
 
     Returns
     -------
@@ -39,7 +94,7 @@ async def create_csv(
     >>>     print(f.read())
     id,name,age,ssn
     """
-    async with _aiofiles.open(path, 'w') as f:
+    async with _open_csv(path, 'w', None, None, compression) as f:
         dictwriter = _AsyncDictWriter(f, fieldnames=headers)
         await dictwriter.writeheader()
 
@@ -56,7 +111,8 @@ async def write_csv_file_row(
     async_file : AsyncTextIOWrapper
         Async file object from aiofiles.read
     record : dict[str, Any]
-        Record to be written to CSV file.
+        Record to be written to CSV file, a dict or a row of any
+        read row_type, see rows.row_values.
     headers : Sequence[str]
         CSV Column header names.
 
@@ -85,14 +141,16 @@ async def write_csv_file_row(
     id,name,age,ssn
     1,John,30,111-22-3333
     """
-    dictwriter = _AsyncDictWriter(async_file, fieldnames=headers)
-    await dictwriter.writerow(record)
+    await async_file.write(serialize_records([record], headers))
         
 
 async def write_csv_row(
     path: str,
     record: dict[str, _typing.Any],
-    headers: _typing.Sequence[str]
+    headers: _typing.Sequence[str],
+    compression: str | None = 'infer',
+    check_headers=False,
+    cache: _MetadataCache | None = None
 ) -> None:
     """Append a record to a CSV file.
     
@@ -101,9 +159,18 @@ async def write_csv_row(
     path : str
         File path to CSV file.
     record : dict[str, Any]
-        Record to be written to CSV file.
+        Record to be written to CSV file, a dict or a row of any
+        read row_type, see rows.row_values.
     headers : Sequence[str]
         CSV Column header names.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    check_headers : bool, optional
+        Raise ValueError before writing if the file's header row differs
+        from headers, see check_csv_headers.
+    cache : MetadataCache | None, optional
+        Cache to look the file's headers up in when checking them.
 
     Returns
     -------
@@ -113,6 +180,8 @@ async def write_csv_row(
     ------
     FileNotFoundError
         If file path does not exist.
+    ValueError
+        If check_headers is True and the file's headers differ.
         
     Example
     -------
@@ -129,7 +198,9 @@ async def write_csv_row(
     id,name,age,ssn
     1,John,30,111-22-3333
     """
-    async with _aiofiles.open(path, 'a') as f:
+    if check_headers:
+        await check_csv_headers(path, headers, compression, cache)
+    async with _open_csv(path, 'a', None, None, compression) as f:
         await write_csv_file_row(f, record, headers)
  
 
@@ -145,7 +216,8 @@ async def write_csv_file_rows(
     async_file : AsyncTextIOWrapper
         Async file object from aiofiles.read
     records : list[dict[str, Any]]
-        List of records to be written to CSV file.
+        List of records to be written to CSV file, dicts or rows of
+        any read row_type, see rows.row_values.
     headers : Sequence[str]
         CSV Column header names.
 
@@ -175,14 +247,16 @@ async def write_csv_file_rows(
     2,Jane,25,222-33-4444
     3,Mike,47,000-11-2222
     """
-    dictwriter = _AsyncDictWriter(async_file, fieldnames=headers)
-    await dictwriter.writerows(records)
+    await async_file.write(serialize_records(records, headers))
         
         
 async def write_csv_rows(
     path: str,
     records: list[dict[str, _typing.Any]],
-    headers: _typing.Sequence[str]
+    headers: _typing.Sequence[str],
+    compression: str | None = 'infer',
+    check_headers=False,
+    cache: _MetadataCache | None = None
 ) -> None:
     """Append a list of records to a CSV file.
     
@@ -191,9 +265,18 @@ async def write_csv_rows(
     path : str
         File path to CSV file.
     records : list[dict[str, Any]]
-        List of records to be written to CSV file.
+        List of records to be written to CSV file, dicts or rows of
+        any read row_type, see rows.row_values.
     headers : Sequence[str]
         CSV Column header names.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    check_headers : bool, optional
+        Raise ValueError before writing if the file's header row differs
+        from headers, see check_csv_headers.
+    cache : MetadataCache | None, optional
+        Cache to look the file's headers up in when checking them.
 
     Returns
     -------
@@ -203,6 +286,8 @@ async def write_csv_rows(
     ------
     FileNotFoundError
         If file path does not exist.
+    ValueError
+        If check_headers is True and the file's headers differ.
         
     Example
     -------
@@ -222,5 +307,355 @@ async def write_csv_rows(
     2,Jane,25,222-33-4444
     3,Mike,47,000-11-2222
     """
-    async with _aiofiles.open(path, 'a') as f:
-        await write_csv_file_rows(f, records, headers)
\ No newline at end of file
+    if check_headers:
+        await check_csv_headers(path, headers, compression, cache)
+    async with _open_csv(path, 'a', None, None, compression) as f:
+        await write_csv_file_rows(f, records, headers)
+
+
+Chunks = _typing.Union[
+    _typing.AsyncIterable[_typing.Iterable[dict[str, _typing.Any]]],
+    _typing.Iterable[_typing.Iterable[dict[str, _typing.Any]]]
+]
+"""Sync or async iterable of chunks of records."""
+
+
+def serialize_records(
+    records: _typing.Iterable[dict[str, _typing.Any]],
+    headers: _typing.Sequence[str]
+) -> str:
+    """Serialize records to CSV text in one in-memory buffer.
+    
+    Parameters
+    ----------
+    records : Iterable[dict[str, Any]]
+        Records to be serialized, dicts or rows of any read row_type,
+        see rows.row_values.
+    headers : Sequence[str]
+        CSV Column header names.
+
+    Returns
+    -------
+    str
+        CSV text of the records, without a header row.
+        
+    Example
+    -------
+    >>> from aiocsv_utils.write import serialize_records
+    >>>
+    >>> serialize_records([{'id': 1, 'name': 'John'}], ['id', 'name'])
+    '1,John\\r\\n'
+    """
+    buffer = _io.StringIO()
+    _RowWriter(buffer, headers).writerows(records)
+    return buffer.getvalue()
+
+
+async def _iterate_chunks(chunks: Chunks) -> _typing.AsyncGenerator[_typing.Iterable[dict[str, _typing.Any]], None]:
+    if isinstance(chunks, _typing.AsyncIterable):
+        async for chunk in chunks:
+            yield chunk
+    else:
+        for chunk in chunks:
+            yield chunk
+
+
+async def write_csv_file_chunks(
+    async_file: _AsyncTextIOWrapper,
+    chunks: Chunks,
+    headers: _typing.Sequence[str]
+) -> int:
+    """Append chunks of records to a CSV file with one write call per chunk.
+    
+    Parameters
+    ----------
+    async_file : AsyncTextIOWrapper
+        Async file object from aiofiles.read
+    chunks : AsyncIterable[Iterable[dict[str, Any]]] | Iterable[Iterable[dict[str, Any]]]
+        Chunks of records, such as the output of read.csv_to_records_chunks
+        with any row_type.
+    headers : Sequence[str]
+        CSV Column header names.
+
+    Returns
+    -------
+    int
+        Number of characters written.
+        
+    Example
+    -------
+    >>> import asyncio
+    >>> import aiofiles
+    >>>
+    >>> from aiocsv_utils.read import csv_to_records_chunks
+    >>> from aiocsv_utils.write import write_csv_file_chunks
+    >>>
+    >>> headers = ['LatD', 'LatM', 'LatS', 'NS', 'LonD', 'LonM', 'LonS', 'EW', 'City', 'State']
+    >>>
+    >>> async def copy_rows(source: str, target: str) -> None:
+    >>>     async with aiofiles.open(target, 'a') as f:
+    >>>         await write_csv_file_chunks(f, csv_to_records_chunks(source, 1000), headers)
+    >>>
+    >>> asyncio.run(copy_rows('data/cities.csv', 'data/cities_copy.csv'))
+    """
+    written = 0
+    async for chunk in _iterate_chunks(chunks):
+        data = serialize_records(chunk, headers)
+        if data:
+            written += await async_file.write(data)
+    return written
+
+
+async def write_csv_chunks(
+    path: str,
+    chunks: Chunks,
+    headers: _typing.Sequence[str],
+    compression: str | None = 'infer',
+    check_headers=False,
+    cache: _MetadataCache | None = None
+) -> int:
+    """Append chunks of records to a CSV file with one write call per chunk.
+    
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    chunks : AsyncIterable[Iterable[dict[str, Any]]] | Iterable[Iterable[dict[str, Any]]]
+        Chunks of records, such as the output of read.csv_to_records_chunks
+        with any row_type.
+    headers : Sequence[str]
+        CSV Column header names.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    check_headers : bool, optional
+        Raise ValueError before writing if the file's header row differs
+        from headers, see check_csv_headers.
+    cache : MetadataCache | None, optional
+        Cache to look the file's headers up in when checking them.
+
+    Returns
+    -------
+    int
+        Number of characters written.
+    
+    Raises
+    ------
+    FileNotFoundError
+        If file path does not exist.
+    ValueError
+        If check_headers is True and the file's headers differ.
+        
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.read import csv_headers, csv_to_records_chunks
+    >>> from aiocsv_utils.write import create_csv, write_csv_chunks
+    >>>
+    >>> async def copy_csv(source: str, target: str) -> None:
+    >>>     headers = await csv_headers(source)
+    >>>     await create_csv(target, headers)
+    >>>     await write_csv_chunks(target, csv_to_records_chunks(source, 1000), headers)
+    >>>
+    >>> asyncio.run(copy_csv('data/cities.csv', 'data/cities_copy.csv'))
+    """
+    if check_headers:
+        await check_csv_headers(path, headers, compression, cache)
+    async with _open_csv(path, 'a', None, None, compression) as f:
+        return await write_csv_file_chunks(f, chunks, headers)
+
+
+class CsvAppender:
+    """Buffered CSV writer session that keeps one file open across many writes.
+
+    Rows are serialized into an in-memory buffer and written to the file in
+    one call whenever ``max_rows``, ``max_bytes`` or ``max_delay`` is reached,
+    or when ``flush`` or ``aclose`` is called.
+
+    Parameters
+    ----------
+    path : str
+        File path to CSV file.
+    headers : Sequence[str]
+        CSV Column header names.
+    mode : str, optional
+        Mode while opening the file, 'a' appends and 'w' replaces it with
+        a file holding the header row.
+    max_rows : int, optional
+        Flush once this many rows are buffered.
+    max_bytes : int, optional
+        Flush once the buffered CSV text reaches this many characters.
+    max_delay : float | None, optional
+        Flush buffered rows at most this many seconds after the first one
+        was written. None disables the time limit.
+    compression : str | None, optional
+        'gzip', 'bz2', 'xz', 'zstd', None for plain text, or 'infer' to
+        detect it from the file extension.
+    check_headers : bool, optional
+        In 'a' mode, raise ValueError on open if the file's header row
+        differs from headers, see check_csv_headers.
+    cache : MetadataCache | None, optional
+        Cache to look the file's headers up in when checking them.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file path directory does not exist.
+    ValueError
+        If check_headers is True and the file's headers differ.
+
+    Example
+    -------
+    >>> import asyncio
+    >>>
+    >>> from aiocsv_utils.write import CsvAppender
+    >>>
+    >>> headers = ['id', 'name', 'age', 'ssn']
+    >>>
+    >>> async def write_events(path: str) -> None:
+    >>>     async with CsvAppender(path, headers, max_rows=500, max_delay=1.0) as appender:
+    >>>         await appender.write_row({'id': 1, 'name': 'John', 'age': 30, 'ssn': '111-22-3333'})
+    >>>         await appender.write_row({'id': 2, 'name': 'Jane', 'age': 25, 'ssn': '222-33-4444'})
+    >>>
+    >>> asyncio.run(write_events('data/people.csv'))
+    """
+    def __init__(
+        self,
+        path: str,
+        headers: _typing.Sequence[str],
+        mode='a',
+        max_rows=1000,
+        max_bytes=1 << 20,
+        max_delay: float | None = None,
+        compression: str | None = 'infer',
+        check_headers=False,
+        cache: _MetadataCache | None = None
+    ) -> None:
+        self.path = path
+        self.headers = headers
+        self.mode = mode
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.compression = compression
+        self.check_headers = check_headers
+        self.cache = cache
+        self._stack = _contextlib.AsyncExitStack()
+        self._file: _AsyncTextIOWrapper | None = None
+        self._buffer = _io.StringIO()
+        self._writer = _RowWriter(self._buffer, headers)
+        self._pending = 0
+        self._written = 0
+        self._lock = _asyncio.Lock()
+        self._timer: _asyncio.TimerHandle | None = None
+        self._timer_task: _asyncio.Task | None = None
+
+    async def __aenter__(self) -> 'CsvAppender':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of rows buffered but not yet written to the file."""
+        return self._pending
+
+    @property
+    def size(self) -> int:
+        """Number of characters written or buffered since the appender was created."""
+        return self._written + self._buffer.tell()
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    async def open(self) -> None:
+        """Open the underlying file, does nothing if already open."""
+        if self._file is None:
+            if self.check_headers and 'a' in self.mode:
+                await check_csv_headers(self.path, self.headers, self.compression, self.cache)
+            self._file = await self._stack.enter_async_context(
+                _open_csv(self.path, self.mode, None, None, self.compression))
+            if 'w' in self.mode:
+                # A replaced file starts with the header row, as from create_csv.
+                header = serialize_records([tuple(self.headers)], self.headers)
+                await self._file.write(header)
+                self._written += len(header)
+
+    async def write_row(self, record: dict[str, _typing.Any]) -> None:
+        """Buffer a record, flushing if a limit is reached.
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            Record to be written to CSV file, a dict or a row of any
+            read row_type, see rows.row_values.
+        """
+        self._writer.writerow(record)
+        self._pending += 1
+        await self._after_write()
+
+    async def write_rows(self, records: _typing.Iterable[dict[str, _typing.Any]]) -> None:
+        """Buffer records, flushing if a limit is reached.
+
+        Parameters
+        ----------
+        records : Iterable[dict[str, Any]]
+            Records to be written to CSV file, dicts or rows of any
+            read row_type, see rows.row_values.
+        """
+        for record in records:
+            self._writer.writerow(record)
+            self._pending += 1
+            if self._pending >= self.max_rows or self._buffer.tell() >= self.max_bytes:
+                await self.flush()
+        await self._after_write()
+
+    async def _after_write(self) -> None:
+        if self._pending >= self.max_rows or self._buffer.tell() >= self.max_bytes:
+            await self.flush()
+        elif self._pending and self.max_delay is not None and self._timer is None:
+            loop = _asyncio.get_running_loop()
+            self._timer = loop.call_later(self.max_delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._timer_task = _asyncio.ensure_future(self.flush())
+
+    async def flush(self) -> None:
+        """Write all buffered rows to the file in one call."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._pending:
+                return
+            if self._file is None:
+                raise ValueError('I/O operation on closed CsvAppender.')
+            data = self._buffer.getvalue()
+            pending = self._pending
+            await self._file.write(data)
+            await self._file.flush()
+            # Drop only what was written, rows buffered meanwhile stay for the next flush.
+            rest = self._buffer.getvalue()[len(data):]
+            self._buffer.seek(0)
+            self._buffer.truncate(0)
+            self._buffer.write(rest)
+            self._pending -= pending
+            self._written += len(data)
+
+    async def aclose(self) -> None:
+        """Flush buffered rows and close the file, even if the flush fails."""
+        if self._file is None:
+            return
+        try:
+            await self.flush()
+            if self._timer_task is not None:
+                timer_task, self._timer_task = self._timer_task, None
+                await timer_task
+        finally:
+            self._file = None
+            await self._stack.aclose()
\ No newline at end of file
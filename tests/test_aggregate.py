@@ -0,0 +1,98 @@
+import csv
+
+import pytest
+
+from aiocsv_utils.aggregate import aggregate
+from aiocsv_utils.read import csv_to_records
+
+AGGS = {
+    'cities': ('*', 'count'),
+    'lat_total': ('LatD', 'sum'),
+    'south': ('LatD', 'min'),
+    'north': ('LatD', 'max'),
+    'lat_mean': ('LatS', 'mean'),
+    'towns': ('City', 'nunique')
+}
+
+
+def _expected():
+    with open('data/cities.csv', 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    groups = {}
+    for row in rows:
+        groups.setdefault(row['State'].strip(), []).append(row)
+    expected = []
+    for state, members in groups.items():
+        lats = [int(row['LatD']) for row in members]
+        seconds = [int(row['LatS']) for row in members]
+        expected.append({
+            'State': state, 'cities': len(members), 'lat_total': sum(lats), 'south': min(lats),
+            'north': max(lats), 'lat_mean': sum(seconds) / len(seconds),
+            'towns': len({row['City'].strip() for row in members})
+        })
+    return expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('numpy', [False, True])
+async def test_aggregate(numpy):
+    records = await aggregate('data/cities.csv', 'State', AGGS, schema='infer', chunk_size=10, numpy=numpy)
+    assert records == _expected()
+
+
+@pytest.mark.asyncio
+async def test_aggregate_parallel():
+    records = await aggregate('data/cities.csv', ['State'], AGGS, schema='infer', range_size=500,
+                              parallel=True, max_workers=2)
+    assert sorted(records, key=lambda record: record['State']) == \
+        sorted(_expected(), key=lambda record: record['State'])
+
+
+@pytest.mark.asyncio
+async def test_aggregate_whole_file_compressed():
+    records = await aggregate('data/cities.csv.gz', aggs={'rows': ('*', 'count'), 'west': ('LonD', 'max')})
+    assert records == [{'rows': 128, 'west': 123}]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_output(tmp_path):
+    output = str(tmp_path / 'states.csv')
+    assert await aggregate('data/cities.csv', 'State', output=output) == len(_expected())
+    assert [record async for record in csv_to_records(output)] == \
+        [{'State': record['State'], 'count': record['cities']} for record in _expected()]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('numpy', [False, True])
+async def test_aggregate_large_int_sum(tmp_path, numpy):
+    path = tmp_path / 'big.csv'
+    path.write_text(f'key,value\na,{2 ** 62}\na,{2 ** 62}\nb,-{2 ** 62}\nb,-{2 ** 62}\n', encoding='utf-8')
+    records = await aggregate(str(path), 'key', {'total': ('value', 'sum'), 'average': ('value', 'mean')},
+                              numpy=numpy)
+    assert records == [{'key': 'a', 'total': 2 ** 63, 'average': 2 ** 62},
+                       {'key': 'b', 'total': -2 ** 63, 'average': -2 ** 62}]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_errors():
+    with pytest.raises(ValueError):
+        await aggregate('data/cities.csv', 'Country')
+    with pytest.raises(ValueError):
+        await aggregate('data/cities.csv', 'State', {'x': ('LatD', 'median')})
+    with pytest.raises(ValueError):
+        await aggregate('data/cities.csv', 'State', {'x': ('*', 'sum')})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('numpy', [False, True])
+async def test_aggregate_mixed_column(tmp_path, numpy):
+    path = tmp_path / 'mixed.csv'
+    path.write_text('g,v\na,1\na,x\nb,3\nb,2\n', encoding='utf-8')
+    records = await aggregate(str(path), 'g', {'low': ('v', 'min'), 'high': ('v', 'max')},
+                              chunk_size=1, numpy=numpy)
+    assert records == [{'g': 'a', 'low': 1, 'high': 'x'}, {'g': 'b', 'low': 2, 'high': 3}]
+    records = await aggregate(str(path), 'g', {'low': ('v', 'min'), 'high': ('v', 'max')}, numpy=numpy)
+    assert records == [{'g': 'a', 'low': 1, 'high': 'x'}, {'g': 'b', 'low': 2, 'high': 3}]
+    for function in ('sum', 'mean'):
+        with pytest.raises(ValueError, match="'v'"):
+            await aggregate(str(path), 'g', {'x': ('v', function)}, numpy=numpy)
@@ -0,0 +1,78 @@
+import os
+import shutil
+
+import pytest
+
+from aiocsv_utils.cache import MetadataCache
+from aiocsv_utils.read import csv_headers, csv_schema, csv_to_records
+from aiocsv_utils.write import CsvAppender, write_csv_rows
+
+
+@pytest.mark.asyncio
+async def test_csv_headers_cache(tmp_path):
+    path = str(tmp_path / 'cities.csv')
+    shutil.copy('data/cities.csv', path)
+    cache = MetadataCache()
+    expected = await csv_headers(path)
+    assert await csv_headers(path, cache=cache) == expected
+    assert await csv_headers(path, cache=cache) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+    with open(path, 'w') as f:
+        f.write('a,b\n1,2\n')
+    os.utime(path, ns=(0, 0))
+    assert await csv_headers(path, cache=cache) == ['a', 'b']
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_keyed_by_compression(tmp_path):
+    path = str(tmp_path / 'cities.csv')
+    shutil.copy('data/cities.csv', path)
+    cache = MetadataCache()
+    assert await csv_headers(path, compression=None, cache=cache) == await csv_headers(path)
+    await csv_schema(path, compression=None, cache=cache)
+    with pytest.raises(OSError):
+        await csv_headers(path, compression='gzip', cache=cache)
+    with pytest.raises(OSError):
+        await csv_schema(path, compression='gzip', cache=cache)
+    assert await csv_headers(path, cache=cache) == await csv_headers(path)
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_csv_schema_cache_on_disk(tmp_path):
+    store = str(tmp_path / 'metadata.json')
+    cache = MetadataCache(path=store)
+    expected = await csv_schema('data/cities.csv')
+    assert await csv_schema('data/cities.csv', cache=cache) == expected
+    await cache.save()
+
+    cold = MetadataCache(path=store)
+    assert await csv_schema('data/cities.csv', cache=cold) == expected
+    assert (cold.hits, cold.misses) == (1, 0)
+    records = [row async for row in csv_to_records('data/cities.csv', schema='infer', cache=cold)]
+    assert len(records) == 128 and cold.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_metadata_cache_lru():
+    cache = MetadataCache(maxsize=1)
+    await csv_headers('data/cities.csv', cache=cache)
+    await csv_headers('data/cities_empty.csv', cache=cache)
+    await csv_headers('data/cities.csv', cache=cache)
+    assert len(cache) == 1 and cache.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_write_check_headers(tmp_path):
+    path = str(tmp_path / 'cities.csv')
+    shutil.copy('data/cities.csv', path)
+    cache = MetadataCache()
+    with pytest.raises(ValueError):
+        await write_csv_rows(path, [{'a': 1}], ['a'], check_headers=True, cache=cache)
+    with pytest.raises(ValueError):
+        async with CsvAppender(path, ['a'], check_headers=True, cache=cache):
+            pass
+    headers = await csv_headers(path)
+    await write_csv_rows(path, [dict.fromkeys(headers, 0)], headers, check_headers=True, cache=cache)
+    await write_csv_rows(str(tmp_path / 'new.csv'), [{'a': 1}], ['a'], check_headers=True)
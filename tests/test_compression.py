@@ -0,0 +1,62 @@
+import pytest
+
+from aiocsv_utils.compression import BlockReader, detect_compression, open_csv
+from aiocsv_utils.read import csv_headers, csv_to_records, csv_to_records_chunks
+from aiocsv_utils.write import create_csv, write_csv_rows, CsvAppender
+
+
+def test_detect_compression():
+    assert detect_compression('data/cities.csv.gz') == 'gzip'
+    assert detect_compression('data/cities.CSV.XZ') == 'xz'
+    assert detect_compression('data/cities.csv') is None
+    assert detect_compression('data/cities.csv', 'bz2') == 'bz2'
+    
+    
+def test_detect_compression_unsupported():
+    with pytest.raises(ValueError):
+        detect_compression('data/cities.csv', 'zip')
+        
+        
+@pytest.mark.asyncio
+async def test_block_reader():
+    async with open_csv('data/cities.csv', block_size=None) as f:
+        expected = await f.read()
+    async with open_csv('data/cities.csv', block_size=100) as f:
+        assert isinstance(f, BlockReader)
+        parts = []
+        while part := await f.read(7):
+            parts.append(part)
+    assert ''.join(parts) == expected
+
+
+@pytest.mark.asyncio
+async def test_gzip_csv_headers():
+    assert await csv_headers('data/cities.csv.gz') == await csv_headers('data/cities.csv')
+
+
+@pytest.mark.asyncio
+async def test_gzip_csv_to_records():
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    assert [row async for row in csv_to_records('data/cities.csv.gz')] == expected
+    
+    
+@pytest.mark.asyncio
+@pytest.mark.parametrize('suffix', ['.gz', '.bz2', '.xz'])
+async def test_compressed_write_round_trip(tmp_path, suffix):
+    path = str(tmp_path / ('people.csv' + suffix))
+    headers = ['id', 'name']
+    await create_csv(path, headers)
+    await write_csv_rows(path, [{'id': 1, 'name': 'John'}], headers)
+    async with CsvAppender(path, headers) as appender:
+        await appender.write_row({'id': 2, 'name': 'Jane'})
+    chunks = [chunk async for chunk in csv_to_records_chunks(path, 10)]
+    assert chunks == [[{'id': 1, 'name': 'John'}, {'id': 2, 'name': 'Jane'}]]
+    
+    
+@pytest.mark.asyncio
+async def test_explicit_compression(tmp_path):
+    path = str(tmp_path / 'people.data')
+    await create_csv(path, ['id'], compression='gzip')
+    with open(path, 'rb') as f:
+        assert f.read(2) == b'\x1f\x8b'
+    assert await csv_headers(path, compression='gzip') == ['id']
@@ -1,4 +1,10 @@
+import random
+
+import pytest
+
 from aiocsv_utils.convert import convert_str
+from aiocsv_utils.convert import common_type, infer_type, infer_schema, compile_schema
+from aiocsv_utils.convert import column_array, convert_column, is_convert_str_like
 
 
 def test_convert_int():
@@ -41,4 +47,95 @@ def test_convert_negative():
     assert convert_str('-1') == -1
     
 def test_covert_power():
-    assert convert_str('\u00B2') == '\u00B2'
\ No newline at end of file
+    assert convert_str('\u00B2') == '\u00B2'
+    
+def test_infer_type_int():
+    assert infer_type(['1', '-2', '']) is int
+    
+def test_infer_type_int_float():
+    assert infer_type(['1', '2.5']) is float
+    
+def test_infer_type_mixed():
+    assert infer_type(['1', 'abc']) is None
+    
+def test_common_type():
+    assert common_type({int, float}) is float
+    assert common_type([str]) is str
+    assert common_type({int, str}) is None and common_type(set()) is None
+    
+def test_infer_schema():
+    assert infer_schema(['id', 'name', 'ok'], [['1', 'John', 'True'], ['2', 'Jane', 'False']]) == \
+        {'id': int, 'name': str, 'ok': bool}
+    
+def test_compile_schema_matches_convert_str():
+    values = ['1', '1.5', '', 'True', 'False', 'NaN', '1.13Q', '-1', '\u00B2', '1.2.3', ' 7 ']
+    for kind in (int, float, bool, None):
+        convert = compile_schema(['a'], {'a': kind})[0]
+        for value in values:
+            result = convert(value)
+            assert result == convert_str(value) and type(result) is type(convert_str(value))
+            
+def test_compile_schema_str():
+    assert compile_schema(['a'], {'a': str})[0]('1') == '1'
+    
+def test_compile_inferred_schema_str():
+    schema = infer_schema(['a'], [['x'], ['y']])
+    convert = compile_schema(['a'], schema)[0]
+    for value in ['z', '123', '1.5', 'True', 'a1', '']:
+        assert convert(value) == convert_str(value) and type(convert(value)) is type(convert_str(value))
+    
+def test_is_convert_str_like():
+    converters = compile_schema(['a', 'b', 'c', 'd'], {'a': int, 'b': str, 'c': len})
+    assert list(map(is_convert_str_like, converters)) == [True, False, False, True]
+    assert is_convert_str_like(compile_schema(['a'], infer_schema(['a'], [['x']]))[0])
+    
+def test_compile_schema_callable():
+    assert compile_schema(['a'], {'a': len})[0]('abc') == 3
+    
+def test_compile_schema_bad_type():
+    with pytest.raises(TypeError):
+        compile_schema(['a'], {'a': 'int'})
+    
+def test_column_array_int():
+    column = column_array([1, 2], numpy=False)
+    assert column.typecode == 'q' and list(column) == [1, 2]
+    
+def test_column_array_float():
+    column = column_array([1, 2.5], numpy=False)
+    assert column.typecode == 'd' and list(column) == [1.0, 2.5]
+    
+def test_column_array_str():
+    assert column_array([1, 'a'], numpy=False) == [1, 'a']
+    
+def test_column_array_overflow():
+    assert column_array([2 ** 70], numpy=False) == [2 ** 70]
+
+
+CONVERT_COLUMN_VALUES = ['', ' ', '1', '-2', '+3', ' 4 ', '1_000', '١٢', '²', '1.5', '.5', '5.',
+                         '-1.5e3', '1e5', 'nan', 'inf', 'NaN.', 'True', 'False', 'true', '1.2.3', '9' * 30,
+                         '9' * 400 + '.0', 'abc', '0x10', '1,5']
+
+
+def _same_column(expected, result):
+    assert type(result) is type(expected)
+    expected = expected.tolist() if hasattr(expected, 'tolist') else expected
+    result = result.tolist() if hasattr(result, 'tolist') else result
+    assert [(type(value), repr(value)) for value in result] == [(type(value), repr(value)) for value in expected]
+
+
+@pytest.mark.parametrize('numpy', [False, True])
+def test_convert_column_matches_convert_str(numpy):
+    rng = random.Random(7)
+    pools = [CONVERT_COLUMN_VALUES, ['1', '-2', '30'], ['1.5', '2', '-3.25'], ['1.5', '', '2'], ['1', 'nan'],
+             ['1.0', '1e5'], ['1', '9' * 25]]
+    for _ in range(2000):
+        pool = rng.choice(pools)
+        values = [rng.choice(pool) for _ in range(rng.randint(0, 6))]
+        _same_column(column_array(list(map(convert_str, values)), numpy), convert_column(values, numpy))
+
+
+def test_convert_column():
+    assert convert_column(['1', '-2'], numpy=False) == column_array([1, -2], numpy=False)
+    assert convert_column(['1', '2.5'], numpy=False).typecode == 'd'
+    assert convert_column(['OH', 'True', ''], numpy=False) == ['OH', True, '']
+    assert convert_column([1, None], numpy=False) == [1, 'None']
@@ -0,0 +1,49 @@
+import pytest
+
+from aiocsv_utils.cache import MetadataCache
+from aiocsv_utils.dialect import sniff_dialect
+from aiocsv_utils.read import csv_headers, csv_to_records, csv_to_records_chunks
+
+
+def test_sniff_dialect():
+    assert sniff_dialect('a;b;c\r\n1;"x;y";3\r\n2;z,w;4\r\n') == \
+        {'delimiter': ';', 'quotechar': '"', 'lineterminator': '\r\n'}
+    assert sniff_dialect('a\tb\n1\t2\n3\t4')['delimiter'] == '\t'
+    assert sniff_dialect("a|b\n'x|y'|2\n") == {'delimiter': '|', 'quotechar': "'", 'lineterminator': '\n'}
+    assert sniff_dialect('name\nAnn, Bob\nCid\n')['delimiter'] == ','
+    assert sniff_dialect('')['delimiter'] == ','
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_auto_delimiter(tmp_path):
+    path = tmp_path / 'cities.csv'
+    with open('data/cities.csv', encoding='utf-8', newline='') as f:
+        path.write_text(f.read().replace(',', ';').replace('Youngstown', '"Youngs;town"'), encoding='utf-8')
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    expected[0]['City'] = 'Youngs;town'
+    assert await csv_headers(str(path), delimiter='auto') == list(expected[0])
+    assert [row async for row in csv_to_records(str(path), delimiter='auto', block_size=64)] == expected
+    chunks = [chunk async for chunk in csv_to_records_chunks(str(path), 100, delimiter='auto', schema='infer')]
+    assert chunks[0][0] == expected[0] and sum(map(len, chunks)) == 128
+
+
+@pytest.mark.asyncio
+async def test_auto_delimiter_cached():
+    cache = MetadataCache()
+    expected = [row async for row in csv_to_records('data/cities.csv.gz')]
+    for _ in range(2):
+        results = [row async for row in csv_to_records('data/cities.csv.gz', delimiter='auto', cache=cache)]
+        assert results == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_auto_delimiter_leading_apostrophe(tmp_path):
+    text = "city,note\n's-Hertogenbosch,NL\nUtrecht,it's ok\nDelft,x\n"
+    assert sniff_dialect(text)['quotechar'] == '"'
+    assert sniff_dialect("a,b\n'x,y',2\n'z',3\n")['quotechar'] == "'"
+    path = tmp_path / 'towns.csv'
+    path.write_text(text, encoding='utf-8')
+    records = [row async for row in csv_to_records(str(path), delimiter='auto')]
+    assert records == [{'city': "'s-Hertogenbosch", 'note': 'NL'}, {'city': 'Utrecht', 'note': "it's ok"},
+                       {'city': 'Delft', 'note': 'x'}]
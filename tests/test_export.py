@@ -0,0 +1,104 @@
+import gzip
+import json
+
+import pytest
+
+from aiocsv_utils.export import csv_to_arrow, csv_to_jsonl, csv_to_parquet
+from aiocsv_utils.read import csv_schema, csv_to_records
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('numpy', [False, True])
+async def test_csv_to_jsonl(tmp_path, monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr('aiocsv_utils.convert._numpy', None)
+    output = str(tmp_path / 'cities.jsonl')
+    assert await csv_to_jsonl('data/cities.csv', output, chunk_size=10) == 128
+    with open(output, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    assert lines == [record async for record in csv_to_records('data/cities.csv')]
+
+
+@pytest.mark.asyncio
+async def test_csv_to_jsonl_compressed(tmp_path):
+    output = str(tmp_path / 'cities.jsonl.gz')
+    assert await csv_to_jsonl('data/cities.csv.gz', output, schema='infer') == 128
+    with gzip.open(output, 'rt', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    assert lines == [record async for record in csv_to_records('data/cities.csv', schema='infer')]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('schema', [None, 'infer', {'n': float}])
+async def test_csv_to_jsonl_mixed_chunk(tmp_path, schema):
+    path = tmp_path / 'numbers.csv'
+    path.write_text('n,m\n1,x\n1.5,2\n3,2.0\n7,\n', encoding='utf-8')
+    output = str(tmp_path / 'numbers.jsonl')
+    assert await csv_to_jsonl(str(path), output, chunk_size=2, schema=schema) == 4
+    with open(output, 'r', encoding='utf-8') as f:
+        text = f.read()
+    assert text == '{"n": 1, "m": "x"}\n{"n": 1.5, "m": 2}\n{"n": 3, "m": 2.0}\n{"n": 7, "m": ""}\n'
+    assert [json.loads(line) for line in text.splitlines()] == \
+        [record async for record in csv_to_records(str(path), schema=schema)]
+
+
+@pytest.mark.asyncio
+async def test_csv_to_jsonl_empty(tmp_path):
+    output = str(tmp_path / 'empty.jsonl')
+    assert await csv_to_jsonl('data/cities_empty.csv', output) == 0
+    with open(output, 'r', encoding='utf-8') as f:
+        assert f.read() == ''
+
+
+@pytest.mark.asyncio
+async def test_csv_to_arrow(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    output = str(tmp_path / 'cities.arrow')
+    assert await csv_to_arrow('data/cities.csv', output, chunk_size=50, ipc_compression='zstd') == 128
+    with pa.ipc.open_file(output) as reader:
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+    schema = await csv_schema('data/cities.csv')
+    assert table.schema.field('LatD').type == pa.int64() and schema['LatD'] is int
+    assert table.schema.field('City').type == pa.string()
+    assert table.to_pylist() == [record async for record in csv_to_records('data/cities.csv', schema='infer')]
+
+
+@pytest.mark.asyncio
+async def test_csv_to_parquet(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    output = str(tmp_path / 'cities.parquet')
+    assert await csv_to_parquet('data/cities.csv.gz', output, chunk_size=100, schema={'LatD': float, 'City': str}) == 128
+    table = pq.read_table(output)
+    assert pq.ParquetFile(output).num_row_groups == 2
+    assert table.column('LatD').to_pylist() == [float(record['LatD']) async for record in csv_to_records('data/cities.csv')]
+    assert table.column('State').to_pylist()[:2] == ['OH', 'SD']
+
+
+@pytest.mark.asyncio
+async def test_csv_to_parquet_empty_and_mismatch(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    output = str(tmp_path / 'empty.parquet')
+    assert await csv_to_parquet('data/cities_empty.csv', output) == 0
+    assert pq.read_table(output).num_rows == 0
+    with pytest.raises(ValueError):
+        await csv_to_parquet('data/cities.csv', str(tmp_path / 'bad.parquet'), schema={'City': int})
+    path = tmp_path / 'late.csv'
+    path.write_text('n\n1\n2\nx\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        await csv_to_parquet(str(path), str(tmp_path / 'late.parquet'), chunk_size=2, schema={'n': int})
+    assert list(tmp_path.glob('*.parquet*')) == [tmp_path / 'empty.parquet']
+
+
+@pytest.mark.asyncio
+async def test_csv_to_arrow_widens_inferred_mismatch(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    path = tmp_path / 'codes.csv'
+    path.write_text('id,code,n\n1,10,a\n2,20,b\n3,30,c\n4,x7,d\n', encoding='utf-8')
+    output = str(tmp_path / 'codes.arrow')
+    assert await csv_to_arrow(str(path), output, chunk_size=2, schema='infer', sample_size=3) == 4
+    with pa.ipc.open_file(output) as reader:
+        table = reader.read_all()
+    assert table.schema.field('id').type == pa.int64()
+    assert table.column('code').to_pylist() == ['10', '20', '30', 'x7']
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['codes.arrow', 'codes.csv']
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import os
+import shutil
+
+import pytest
+
+from aiocsv_utils.follow import CsvFollower
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.write import create_csv, write_csv_row
+
+
+@pytest.mark.asyncio
+async def test_follow_existing_file():
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    async with CsvFollower('data/cities.csv', idle_timeout=0, block_size=100) as follower:
+        results = [row async for row in follower]
+    assert results == expected
+    assert follower.checkpoint['offset'] == os.path.getsize('data/cities.csv')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_inotify', [None, False])
+async def test_follow_appends(tmp_path, use_inotify):
+    path = str(tmp_path / 'events.csv')
+    await create_csv(path, ['id', 'text'])
+    follower = CsvFollower(path, idle_timeout=2, poll_interval=0.05, use_inotify=use_inotify)
+    received = []
+
+    async def consume():
+        async for record in follower:
+            received.append(record)
+            if record['id'] == 3:
+                break
+
+    task = asyncio.ensure_future(consume())
+    await write_csv_row(path, {'id': 1, 'text': 'a'}, ['id', 'text'])
+    with open(path, 'a', newline='') as f:
+        f.write('2,"multi\nline')
+    await asyncio.sleep(0.2)
+    assert received == [{'id': 1, 'text': 'a'}]
+    with open(path, 'a', newline='') as f:
+        f.write('"\r\n')
+    await write_csv_row(path, {'id': 3, 'text': 'c'}, ['id', 'text'])
+    await asyncio.wait_for(task, 5)
+    assert received == [{'id': 1, 'text': 'a'}, {'id': 2, 'text': 'multi\nline'}, {'id': 3, 'text': 'c'}]
+    assert follower.checkpoint['offset'] == os.path.getsize(path)
+
+
+@pytest.mark.asyncio
+async def test_follow_resume_from_checkpoint(tmp_path):
+    path = str(tmp_path / 'cities.csv')
+    shutil.copy('data/cities.csv', path)
+    async with CsvFollower(path, idle_timeout=0) as follower:
+        async for record in follower:
+            if record['City'] == 'Yakima':
+                break
+    checkpoint = json.loads(json.dumps(follower.checkpoint))
+    expected = [row async for row in csv_to_records(path)]
+    async with CsvFollower(path, checkpoint, idle_timeout=0) as follower:
+        results = [row async for row in follower]
+    assert results == expected[3:]
+
+
+@pytest.mark.asyncio
+async def test_follow_restarts_when_replaced(tmp_path):
+    path = str(tmp_path / 'cities.csv')
+    shutil.copy('data/cities.csv', path)
+    async with CsvFollower(path, idle_timeout=0) as follower:
+        results = [row async for row in follower]
+    os.replace(shutil.copy('data/cities.csv', str(tmp_path / 'new.csv')), path)
+    async with CsvFollower(path, follower.checkpoint, idle_timeout=0) as follower:
+        assert [row async for row in follower] == results
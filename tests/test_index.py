@@ -0,0 +1,56 @@
+import os
+import shutil
+
+import pytest
+
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.index import build_csv_index, load_csv_index, csv_to_records_range
+
+
+@pytest.mark.asyncio
+async def test_build_csv_index(tmp_path):
+    index_path = str(tmp_path / 'cities.csv.idx')
+    index = await build_csv_index('data/cities.csv', every=50, index_path=index_path)
+    assert index['rows'] == 128
+    assert index['offsets'] == [48, 1799, 3617]
+    assert await load_csv_index('data/cities.csv', index_path) == index
+    
+    
+@pytest.mark.asyncio
+@pytest.mark.parametrize('every', [0, -1])
+async def test_csv_index_every_validated(tmp_path, every):
+    index_path = str(tmp_path / 'cities.csv.idx')
+    with pytest.raises(ValueError):
+        await build_csv_index('data/cities.csv', every=every, index_path=index_path)
+    await build_csv_index('data/cities.csv', every=10, index_path=index_path)
+    with pytest.raises(ValueError):
+        await anext(csv_to_records_range('data/cities.csv', every=every, index_path=index_path))
+    assert not os.path.exists(index_path + '.tmp')
+
+
+@pytest.mark.asyncio
+async def test_load_stale_csv_index(tmp_path):
+    path = str(tmp_path / 'cities.csv')
+    shutil.copy('data/cities.csv', path)
+    await build_csv_index(path, every=10)
+    assert os.path.exists(path + '.idx')
+    with open(path, 'a') as f:
+        f.write('1,2,3,N,4,5,6,W,Nowhere,ZZ\n')
+    assert await load_csv_index(path) is None
+    
+    
+@pytest.mark.asyncio
+async def test_csv_to_records_range(tmp_path):
+    index_path = str(tmp_path / 'cities.csv.idx')
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    for start, stop in [(0, 2), (2, 4), (9, 31), (120, None), (127, 500), (200, 300)]:
+        results = [row async for row in csv_to_records_range('data/cities.csv', start, stop, every=10,
+                                                             index_path=index_path)]
+        assert results == expected[start:stop]
+        
+        
+@pytest.mark.asyncio
+async def test_empty_csv_to_records_range(tmp_path):
+    index_path = str(tmp_path / 'cities_empty.csv.idx')
+    with pytest.raises(StopAsyncIteration) as e_info:
+        await anext(csv_to_records_range('data/cities_empty.csv', index_path=index_path))
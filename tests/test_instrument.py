@@ -0,0 +1,33 @@
+import pytest
+
+from aiocsv_utils.instrument import ReadStats
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.read import csv_to_records_chunks
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_on_stats():
+    stats = []
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    results = [row async for row in csv_to_records('data/cities.csv', on_stats=stats.append)]
+    assert results == expected
+    assert len(stats) == 1 and isinstance(stats[0], ReadStats)
+    assert stats[0].rows == 128
+    assert stats[0].elapsed_seconds >= stats[0].convert_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_time_slice():
+    stats = []
+    results = [row async for row in csv_to_records('data/cities.csv', time_slice=0, on_stats=stats.append)]
+    assert len(results) == 128
+    assert stats[0].slices >= 128
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_chunks_on_stats_when_closed_early():
+    stats = []
+    chunks = csv_to_records_chunks('data/cities.csv', 2, on_stats=stats.append)
+    await anext(chunks)
+    await chunks.aclose()
+    assert len(stats) == 1 and stats[0].rows < 10
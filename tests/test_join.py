@@ -0,0 +1,86 @@
+import csv
+
+import pytest
+
+from aiocsv_utils.join import join_csv
+from aiocsv_utils.read import csv_to_records
+
+STATES = [['State', 'Region', 'City'], ['OH', 'Midwest', 'Columbus'], ['SD', 'Midwest', 'Pierre'],
+          ['CA', 'West', 'Sacramento'], ['CA', 'Pacific', 'Sacramento'], ['', 'Nowhere', '']]
+
+
+def _write_states(tmp_path):
+    path = str(tmp_path / 'states.csv')
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows(STATES)
+    return path
+
+
+async def _expected(how):
+    regions = {}
+    for state, region, capital in STATES[1:]:
+        if state:
+            regions.setdefault(state, []).append((region, capital))
+    expected = []
+    async for record in csv_to_records('data/cities.csv'):
+        matches = regions.get(record['State'], [(None, None)] if how == 'left' else [])
+        expected.extend({**record, 'Region': region, 'City_right': capital} for region, capital in matches)
+    return expected
+
+
+async def _records(path):
+    return [{key: None if value == '' else value for key, value in record.items()}
+            async for record in csv_to_records(path)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('how', ['inner', 'left'])
+async def test_join_csv(tmp_path, how):
+    output = str(tmp_path / 'joined.csv')
+    expected = await _expected(how)
+    assert await join_csv('data/cities.csv', _write_states(tmp_path), output, 'State', how, chunk_size=10) == len(expected)
+    assert await _records(output) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('how', ['inner', 'left'])
+async def test_join_csv_spills(tmp_path, how):
+    output = str(tmp_path / 'joined.csv.gz')
+    expected = await _expected(how)
+    count = await join_csv('data/cities.csv', _write_states(tmp_path), output, ['State'], how,
+                           chunk_size=7, max_rows=1, partitions=3, temp_dir=str(tmp_path))
+    assert count == len(expected)
+    key = lambda record: tuple(map(str, record.values()))
+    assert sorted(await _records(output), key=key) == sorted(expected, key=key)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['joined.csv.gz', 'states.csv']
+
+
+@pytest.mark.asyncio
+async def test_join_csv_spills_utf8(tmp_path, monkeypatch):
+    import aiocsv_utils.join
+    opened = []
+    open_csv = aiocsv_utils.join._open_csv
+
+    def spy(path, mode, encoding, newline, compression):
+        opened.append(encoding)
+        return open_csv(path, mode, encoding, newline, compression)
+
+    monkeypatch.setattr(aiocsv_utils.join, '_open_csv', spy)
+    left, right, output = (str(tmp_path / name) for name in ('left.csv', 'right.csv', 'out.csv'))
+    with open(left, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows([['id', 'city'], ['1', 'Zürich'], ['2', 'Kraków'], ['3', '東京']])
+    with open(right, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows([['id', 'note'], ['1', 'café'], ['3', 'ß']])
+    assert await join_csv(left, right, output, 'id', max_rows=1, partitions=2, temp_dir=str(tmp_path)) == 2
+    assert opened and set(opened) == {'utf-8'}
+    assert sorted([record async for record in csv_to_records(output)], key=lambda record: record['id']) == \
+        [{'id': 1, 'city': 'Zürich', 'note': 'café'}, {'id': 3, 'city': '東京', 'note': 'ß'}]
+
+
+@pytest.mark.asyncio
+async def test_join_csv_errors(tmp_path):
+    states = _write_states(tmp_path)
+    with pytest.raises(ValueError):
+        await join_csv('data/cities.csv', states, str(tmp_path / 'out.csv'), 'Region')
+    with pytest.raises(ValueError):
+        await join_csv('data/cities.csv', states, str(tmp_path / 'out.csv'), 'State', 'outer')
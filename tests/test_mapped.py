@@ -0,0 +1,42 @@
+import pytest
+
+from aiocsv_utils.mapped import csv_to_records_mapped
+from aiocsv_utils.mapped import csv_to_records_chunks_mapped
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.read import csv_to_records_chunks
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('options', [
+    {},
+    {'schema': 'infer'},
+    {'columns': ['City', 'LatD']},
+    {'where': {'State': {'OH', 'WA'}}, 'columns': ['City']},
+])
+async def test_csv_to_records_mapped_matches_records(options):
+    expected = [row async for row in csv_to_records('data/cities.csv', **options)]
+    results = [row async for row in csv_to_records_mapped('data/cities.csv', block_size=256, **options)]
+    assert results == expected
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_mapped_quoted(tmp_path):
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'id,text,n\r\n1,"a, ""b""\r\nc",2\r\n\r\n2,plain,3\r\n3,short\r\n4,"x",5,extra\r\n')
+    expected = [row async for row in csv_to_records(str(path))]
+    for block_size in (1, 8, 1 << 20):
+        results = [row async for row in csv_to_records_mapped(str(path), block_size=block_size)]
+        assert results == expected
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_chunks_mapped():
+    expected = [chunk async for chunk in csv_to_records_chunks('data/cities.csv', 50)]
+    results = [chunk async for chunk in csv_to_records_chunks_mapped('data/cities.csv', 50, block_size=300)]
+    assert [len(chunk) for chunk in results] == [50, 50, 28]
+    assert results == expected
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_to_records_mapped():
+    assert [row async for row in csv_to_records_mapped('data/cities_empty.csv')] == []
@@ -0,0 +1,45 @@
+import shutil
+
+import pytest
+
+from aiocsv_utils.multi import csv_to_records_chunks_multi
+from aiocsv_utils.multi import csv_to_records_multi
+from aiocsv_utils.read import csv_to_records
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_multi_ordered():
+    paths = ['data/cities.csv', 'data/cities_empty.csv', 'data/cities.csv.gz']
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    results = [item async for item in csv_to_records_multi(paths, max_open=2, chunk_size=10, buffer_size=1,
+                                                                 block_size=64)]
+    assert [path for path, _ in results] == ['data/cities.csv'] * 128 + ['data/cities.csv.gz'] * 128
+    assert [row for _, row in results] == expected * 2
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_chunks_multi_glob_interleaved(tmp_path):
+    for i in range(5):
+        shutil.copy('data/cities.csv', tmp_path / f'shard{i}.csv')
+    counts = {}
+    async for path, chunk in csv_to_records_chunks_multi(str(tmp_path / '*.csv'), 50, max_open=2, ordered=False):
+        assert len(chunk) <= 50
+        counts[path] = counts.get(path, 0) + len(chunk)
+    assert counts == {str(tmp_path / f'shard{i}.csv'): 128 for i in range(5)}
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_multi_header_mismatch(tmp_path):
+    other = tmp_path / 'other.csv'
+    other.write_text('a,b\n1,2\n')
+    with pytest.raises(ValueError):
+        async for _ in csv_to_records_multi(['data/cities.csv', str(other)]):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_multi_close_early():
+    records = csv_to_records_multi(['data/cities.csv'] * 20, chunk_size=1, max_open=4, ordered=False)
+    path, _ = await anext(records)
+    await records.aclose()
+    assert path == 'data/cities.csv'
@@ -0,0 +1,42 @@
+import csv
+
+import pytest
+
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.parallel import csv_to_records_parallel, csv_to_records_chunks_parallel
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_parallel():
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    results = [row async for row in csv_to_records_parallel('data/cities.csv', max_workers=2, range_size=500)]
+    assert results == expected
+    
+
+@pytest.mark.asyncio
+async def test_csv_to_records_parallel_unordered():
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    results = [row async for row in csv_to_records_parallel('data/cities.csv', max_workers=2, range_size=500,
+                                                            ordered=False)]
+    assert sorted(results, key=repr) == sorted(expected, key=repr)
+    
+    
+@pytest.mark.asyncio
+async def test_csv_to_records_chunks_parallel_quoted_newlines(tmp_path):
+    path = str(tmp_path / 'quoted.csv')
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'text'])
+        writer.writerows([i, 'line\n"quoted",\n' * (i % 3)] for i in range(100))
+    expected = [row async for row in csv_to_records(path)]
+    results = []
+    async for chunk in csv_to_records_chunks_parallel(path, 7, max_workers=2, range_size=64):
+        assert len(chunk) <= 7
+        results.extend(chunk)
+    assert results == expected
+    
+    
+@pytest.mark.asyncio
+async def test_empty_csv_to_records_parallel():
+    with pytest.raises(StopAsyncIteration) as e_info:
+        await anext(csv_to_records_parallel('data/cities_empty.csv'))
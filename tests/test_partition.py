@@ -0,0 +1,90 @@
+import csv
+import gzip
+import os
+
+import pytest
+
+from aiocsv_utils.partition import PartitionedWriter
+from aiocsv_utils.read import csv_headers, csv_to_records, csv_to_records_chunks
+
+
+def _rows(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.asyncio
+async def test_partition_by_column(tmp_path):
+    headers = await csv_headers('data/cities.csv')
+    template = str(tmp_path / 'state={partition}' / 'part-{part}.csv')
+    async with PartitionedWriter(template, headers, 'State', max_open=3, buffer_rows=4) as writer:
+        async for chunk in csv_to_records_chunks('data/cities.csv', 10):
+            await writer.write_rows(chunk)
+    header, *rows = _rows('data/cities.csv')
+    states = {}
+    for row in rows:
+        states.setdefault(row[9], []).append(row)
+    assert sorted(writer.paths) == sorted(template.format(partition=state, part=0) for state in states)
+    for state, expected in states.items():
+        path = template.format(partition=state, part=0)
+        assert _rows(path) == [header] + expected
+        assert writer.files[path] == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_rollover_and_shards(tmp_path):
+    headers = await csv_headers('data/cities.csv')
+    template = str(tmp_path / 'shard-{partition}-{part}.csv.gz')
+    async with PartitionedWriter(template, headers, ['State', 'City'], shards=2, max_open=1,
+                                 max_rows=25) as writer:
+        async for record in csv_to_records('data/cities.csv', row_type='tuple'):
+            await writer.write_row(record)
+    assert all(0 < count <= 25 for count in writer.files.values())
+    assert sum(writer.files.values()) == 128
+    assert {os.path.basename(path)[:7] for path in writer.paths} == {'shard-0', 'shard-1'}
+    written = sorted(row for path in writer.paths for row in _rows(path, gzip.open)[1:])
+    assert written == sorted(_rows('data/cities.csv')[1:])
+
+
+@pytest.mark.asyncio
+async def test_round_robin_max_bytes(tmp_path):
+    headers = await csv_headers('data/cities.csv')
+    template = str(tmp_path / '{partition}-{part}.csv')
+    async with PartitionedWriter(template, headers, shards=3, max_bytes=500) as writer:
+        async for chunk in csv_to_records_chunks('data/cities.csv', 16):
+            await writer.write_rows(chunk)
+    assert all(os.path.getsize(path) < 600 for path in writer.paths)
+    assert sum(len(_rows(path)) - 1 for path in writer.paths) == 128
+
+
+@pytest.mark.asyncio
+async def test_max_bytes_with_eviction(tmp_path):
+    template = str(tmp_path / '{partition}-{part}.csv')
+    async with PartitionedWriter(template, ['key', 'value'], 'key', max_open=1, max_bytes=100,
+                                 buffer_rows=1) as writer:
+        for i in range(200):
+            await writer.write_row({'key': 'ab'[i % 2], 'value': f'value-{i:04d}'})
+    assert len(writer.paths) > 2
+    assert all(os.path.getsize(path) < 120 for path in writer.paths)
+    assert sum(len(_rows(path)) - 1 for path in writer.paths) == 200
+
+
+@pytest.mark.asyncio
+async def test_partition_names_stay_in_directory(tmp_path):
+    directory = tmp_path / 'out'
+    template = str(directory / '{partition}' / 'part-{part}.csv')
+    keys = ['..', '.', '', None, 'a/b', 'a\\b', 'nul\x00', '50%', 'a%2Fb']
+    async with PartitionedWriter(template, ['key', 'value'], 'key') as writer:
+        for value, key in enumerate(keys):
+            await writer.write_row({'key': key, 'value': value})
+    names = [os.path.relpath(path, directory) for path in writer.paths]
+    assert names == [os.path.join(name, 'part-0.csv')
+                     for name in ['%2E%2E', '%2E', '%', 'a%2Fb', 'a%5Cb', 'nul%00', '50%25', 'a%252Fb']]
+    assert sorted(os.listdir(tmp_path)) == ['out']
+
+
+def test_partitioned_writer_errors():
+    with pytest.raises(ValueError):
+        PartitionedWriter('{partition}.csv', ['a'])
+    with pytest.raises(ValueError):
+        PartitionedWriter('{partition}.csv', ['a'], 'b')
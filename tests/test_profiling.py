@@ -0,0 +1,99 @@
+import csv
+import random
+
+import pytest
+
+from aiocsv_utils.convert import convert_str, infer_type
+from aiocsv_utils.profiling import HyperLogLog, TDigest, profile_csv
+
+
+def _columns():
+    with open('data/cities.csv', 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    return {header: [row[header] for row in rows] for header in rows[0]}
+
+
+@pytest.mark.asyncio
+async def test_profile_csv_exact():
+    profile = await profile_csv('data/cities.csv')
+    assert profile['rows'] == 128 and profile['sampled'] is False
+    for header, raw in _columns().items():
+        column = profile['columns'][header]
+        values = [convert_str(value) for value in raw if value != '']
+        assert column['type'] == infer_type(raw).__name__
+        assert column['count'] == len(values)
+        assert column['nulls'] == len(raw) - len(values)
+        assert column['distinct'] == len(set(values))
+        assert (column['min'], column['max']) == (min(values), max(values))
+    lat = profile['columns']['LatD']
+    assert lat['quantiles'] == {0.25: 35.0, 0.5: 39.0, 0.75: 42.25}
+    assert profile['columns']['City']['quantiles'] is None
+
+
+@pytest.mark.asyncio
+async def test_profile_csv_sketch():
+    exact = await profile_csv('data/cities.csv', quantiles=(0.1, 0.5, 0.9))
+    sketch = await profile_csv('data/cities.csv', 'sketch', quantiles=(0.1, 0.5, 0.9), sample_size=5)
+    for header, column in sketch['columns'].items():
+        expected = exact['columns'][header]
+        for key in ('type', 'count', 'nulls', 'min', 'max'):
+            assert column[key] == expected[key]
+        assert column['distinct'] == pytest.approx(expected['distinct'], rel=0.05)
+        assert len(column['sample']) == 5
+    for q, value in sketch['columns']['LatD']['quantiles'].items():
+        assert value == pytest.approx(exact['columns']['LatD']['quantiles'][q], abs=1.5)
+
+
+@pytest.mark.asyncio
+async def test_profile_csv_compressed():
+    profile = await profile_csv('data/cities.csv.gz', sample_ranges=2, range_size=64)
+    assert profile['rows'] == 128 and profile['sampled'] is False
+
+
+@pytest.mark.asyncio
+async def test_profile_csv_sample_ranges(tmp_path):
+    path = str(tmp_path / 'sample.csv')
+    rng = random.Random(3)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'score', 'note'])
+        for i in range(20_000):
+            writer.writerow([i, round(rng.random(), 4), 'multi\n"line", note' if i % 5 == 0 else ''])
+    profile = await profile_csv(path, 'sketch', sample_ranges=4, range_size=1 << 14)
+    assert profile['sampled'] is True
+    assert profile['sampled_rows'] < 20_000
+    assert profile['rows'] == pytest.approx(20_000, rel=0.05)
+    score = profile['columns']['score']
+    assert score['type'] == 'float'
+    assert score['quantiles'][0.5] == pytest.approx(0.5, abs=0.05)
+    note = profile['columns']['note']
+    assert note['null_rate'] == pytest.approx(0.8, abs=0.02)
+    assert note['min'] == note['max'] == 'multi\n"line", note'
+    assert profile['columns']['id']['count'] == profile['sampled_rows']
+
+
+@pytest.mark.asyncio
+async def test_profile_csv_mode():
+    with pytest.raises(ValueError):
+        await profile_csv('data/cities.csv', 'approximate')
+
+
+def test_sketches_merge():
+    rng = random.Random(5)
+    values = [rng.gauss(0, 1) for _ in range(20_000)]
+    left, right = HyperLogLog(), HyperLogLog()
+    first, second = TDigest(), TDigest()
+    for value in values[:10_000]:
+        left.add(round(value, 3))
+    for value in values[10_000:]:
+        right.add(round(value, 3))
+    first.extend(values[:10_000])
+    second.extend(values[10_000:])
+    left.merge(right)
+    first.merge(second)
+    assert left.count() == pytest.approx(len({round(value, 3) for value in values}), rel=0.03)
+    ordered = sorted(values)
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        assert first.quantile(q) == pytest.approx(ordered[int(q * len(ordered))], abs=0.03)
+    assert first.quantile(0) == ordered[0] and first.quantile(1) == ordered[-1]
+    assert len(first.means) <= 100
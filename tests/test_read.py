@@ -3,6 +3,8 @@ import pytest
 from aiocsv_utils.read import csv_headers
 from aiocsv_utils.read import csv_to_records
 from aiocsv_utils.read import csv_to_records_chunks
+from aiocsv_utils.read import csv_schema
+from aiocsv_utils.read import csv_to_column_chunks
 
 
 @pytest.mark.asyncio
@@ -48,4 +50,103 @@ async def test_csv_to_records_chunks():
 @pytest.mark.asyncio
 async def test_empty_csv_to_records_chunks():
     with pytest.raises(StopAsyncIteration) as e_info:
-        await anext(csv_to_records_chunks('data/cities_empty.csv', 2))
\ No newline at end of file
+        await anext(csv_to_records_chunks('data/cities_empty.csv', 2))
+
+
+@pytest.mark.asyncio
+async def test_csv_schema():
+    schema = await csv_schema('data/cities.csv')
+    assert schema['LatD'] is int
+    assert schema['City'] is str
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_infer_schema():
+    expected = [row async for row in csv_to_records('data/cities.csv')]
+    results = [row async for row in csv_to_records('data/cities.csv', schema='infer', sample_size=5)]
+    assert results == expected
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_infer_schema_text_mismatch(tmp_path):
+    path = tmp_path / 'codes.csv'
+    path.write_text('code,n\nabc,1\ndef,2\n123,3\nTrue,4\n', encoding='utf-8')
+    expected = [row async for row in csv_to_records(str(path))]
+    assert [row['code'] for row in expected] == ['abc', 'def', 123, True]
+    assert [row async for row in csv_to_records(str(path), schema='infer', sample_size=2)] == expected
+    chunks = [chunk async for chunk in csv_to_column_chunks(str(path), 10, schema='infer', sample_size=2)]
+    assert chunks[0]['code'] == ['abc', 'def', 123, True]
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_schema_plan():
+    async for row in csv_to_records('data/cities.csv', schema={'LatD': str}):
+        assert row['LatD'] == '41'
+        assert row['LatM'] == 5
+        break
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_to_records_infer_schema():
+    with pytest.raises(StopAsyncIteration) as e_info:
+        await anext(csv_to_records('data/cities_empty.csv', schema='infer'))
+
+
+@pytest.mark.asyncio
+async def test_csv_to_column_chunks():
+    async for chunk in csv_to_column_chunks('data/cities.csv', 2, numpy=False):
+        assert list(chunk['LatD']) == [41, 42]
+        assert chunk['LatD'].typecode == 'q'
+        assert chunk['City'] == ['Youngstown', 'Yankton']
+        break
+
+
+@pytest.mark.asyncio
+async def test_csv_to_column_chunks_matches_records():
+    records = [row async for row in csv_to_records('data/cities.csv')]
+    rows = []
+    async for chunk in csv_to_column_chunks('data/cities.csv', 50, schema='infer', sample_size=10):
+        assert len(chunk['City']) <= 50
+        rows.extend(dict(zip(chunk, values)) for values in zip(*chunk.values()))
+    assert rows == records
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_to_column_chunks():
+    with pytest.raises(StopAsyncIteration) as e_info:
+        await anext(csv_to_column_chunks('data/cities_empty.csv', 2))
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_columns():
+    async for row in csv_to_records('data/cities.csv', columns=['City', 'LatD']):
+        assert row == {'City': 'Youngstown', 'LatD': 41}
+        break
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_where():
+    expected = [row async for row in csv_to_records('data/cities.csv') if row['State'] in ('OH', 'WA')]
+    results = [row async for row in csv_to_records('data/cities.csv', where={'State': {'OH', 'WA'}})]
+    assert results and results == expected
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_columns_where():
+    results = [row async for row in csv_to_records('data/cities.csv', columns=['City'],
+                                                   where={'State': 'OH', 'LatD': lambda v: int(v) > 40})]
+    assert results[0] == {'City': 'Youngstown'}
+    assert all(row.keys() == {'City'} for row in results)
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_chunks_where():
+    async for chunk in csv_to_records_chunks('data/cities.csv', 2, where={'State': 'OH'}):
+        assert [row['State'] for row in chunk] == ['OH', 'OH']
+        break
+
+
+@pytest.mark.asyncio
+async def test_csv_to_records_unknown_column():
+    with pytest.raises(ValueError):
+        await anext(csv_to_records('data/cities.csv', columns=['Country']))
\ No newline at end of file
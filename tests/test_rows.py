@@ -0,0 +1,98 @@
+import csv
+import io
+
+import pytest
+
+from aiocsv_utils.read import csv_to_records, csv_to_records_chunks
+from aiocsv_utils.rows import LazyRow, RowWriter, row_values, slots_class
+from aiocsv_utils.write import CsvAppender, create_csv, write_csv_chunks, write_csv_rows
+
+
+def _rows(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('row_type', ['tuple', 'namedtuple', 'slots', 'lazy'])
+async def test_row_types(row_type):
+    records = [record async for record in csv_to_records('data/cities.csv')]
+    rows = [row async for row in csv_to_records('data/cities.csv', schema='infer', row_type=row_type)]
+    if row_type == 'lazy':
+        assert all(isinstance(row, LazyRow) for row in rows)
+        assert [dict(row) for row in rows] == records
+    else:
+        assert [tuple(row) for row in rows] == [tuple(record.values()) for record in records]
+    if row_type in ('namedtuple', 'slots'):
+        assert rows[0].City == 'Youngstown' and rows[1].LatD == 42
+
+
+@pytest.mark.asyncio
+async def test_row_type_columns_where():
+    chunks = [chunk async for chunk in csv_to_records_chunks(
+        'data/cities.csv', 2, columns=['State', 'LatD'], where={'State': 'OH'}, row_type='namedtuple')]
+    assert chunks[0][0]._fields == ('State', 'LatD')
+    assert all(row.State == 'OH' for chunk in chunks for row in chunk)
+
+
+@pytest.mark.asyncio
+async def test_lazy_row_converts_on_access(tmp_path):
+    calls = []
+
+    def latitude(value):
+        calls.append(value)
+        return int(value)
+    path = str(tmp_path / 'short.csv')
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write('LatD,City\n41,Youngstown\n42\n')
+    rows = [row async for row in csv_to_records(path, schema={'LatD': latitude, 'City': str}, row_type='lazy')]
+    assert calls == []
+    assert rows[0]['City'] == 'Youngstown' and calls == []
+    assert rows[0][0] == 41 and rows[0]['LatD'] == 41 and calls == ['41']
+    assert rows[1]['City'] is None and rows[1].raw == ['42', None]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('row_type', ['tuple', 'namedtuple', 'slots', 'lazy'])
+async def test_write_rows(tmp_path, row_type):
+    header, *expected = _rows('data/cities.csv')
+    output = str(tmp_path / 'cities.csv')
+    await create_csv(output, header)
+    await write_csv_chunks(output, csv_to_records_chunks('data/cities.csv', 50, schema={}, row_type=row_type), header)
+    assert _rows(output) == [header] + expected
+    copy = str(tmp_path / 'copy.csv')
+    await create_csv(copy, header)
+    rows = [row async for row in csv_to_records('data/cities.csv', schema={}, row_type=row_type)]
+    await write_csv_rows(copy, rows[:1], header)
+    async with CsvAppender(copy, header, max_rows=10) as appender:
+        await appender.write_rows(rows[1:])
+    assert _rows(copy) == [header] + expected
+
+
+def test_slots_class():
+    Row = slots_class(['id', 'first name', 'class'])
+    row = Row(1, 'Ann', 'A')
+    assert Row._fields == ('id', '_1', '_2')
+    assert not hasattr(row, '__dict__')
+    assert row == Row._make([1, 'Ann', 'A']) and row[1] == 'Ann' and list(row) == [1, 'Ann', 'A']
+    assert row_values(row, ['id', 'first name', 'class']) == [1, 'Ann', 'A']
+
+
+def test_row_values_dicts():
+    assert row_values({'b': 2}, ['a', 'b']) == ['', 2]
+    with pytest.raises(ValueError):
+        row_values({'c': 3}, ['a', 'b'])
+
+
+@pytest.mark.asyncio
+async def test_row_width_mismatch(tmp_path):
+    assert row_values((1, 2), ['a', 'b']) == [1, 2]
+    with pytest.raises(ValueError):
+        row_values([1, 2, 3], ['a', 'b'])
+    with pytest.raises(ValueError):
+        RowWriter(io.StringIO(), ['a', 'b']).writerow((1, 2, 3))
+    path = str(tmp_path / 'subset.csv')
+    await create_csv(path, ['LatD', 'State'])
+    with pytest.raises(ValueError):
+        await write_csv_rows(path, [(41, 5, 'OH')], ['LatD', 'State'])
+    assert _rows(path) == [['LatD', 'State']]
@@ -0,0 +1,101 @@
+import asyncio
+import csv
+import gzip
+import multiprocessing
+import os
+
+import pytest
+
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.safe_write import SafeCsvWriter
+
+HEADERS = ['writer', 'seq', 'text']
+
+
+def _rows(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+async def _write_many(path, writer_id, count):
+    async with SafeCsvWriter(path, HEADERS, max_bytes=64) as writer:
+        await asyncio.gather(*(writer.write_row({'writer': writer_id, 'seq': seq, 'text': 'a,"b"\nc' * (seq % 3)})
+                               for seq in range(count)))
+
+
+def _process(path, writer_id, count):
+    asyncio.run(_write_many(path, writer_id, count))
+
+
+def _check(path, writers, count):
+    header, *rows = _rows(path)
+    assert header == HEADERS
+    assert sorted((int(row[0]), int(row[1])) for row in rows) == \
+        [(writer, seq) for writer in range(writers) for seq in range(count)]
+    assert all(row[2] == 'a,"b"\nc' * (int(row[1]) % 3) for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks(tmp_path):
+    path = str(tmp_path / 'events.csv')
+    async with SafeCsvWriter(path, HEADERS, max_queue=8) as writer:
+        async def task(writer_id):
+            for seq in range(50):
+                await writer.write_rows([{'writer': writer_id, 'seq': seq, 'text': 'a,"b"\nc' * (seq % 3)}])
+        await asyncio.gather(*(task(writer_id) for writer_id in range(8)))
+        await writer.flush()
+        assert len(_rows(path)) == 401
+    _check(path, 8, 50)
+
+
+def test_concurrent_processes(tmp_path):
+    path = str(tmp_path / 'events.csv')
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=_process, args=(path, writer_id, 200)) for writer_id in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+    _check(path, 3, 200)
+
+
+@pytest.mark.asyncio
+async def test_atomic_commit_and_abort(tmp_path):
+    path = str(tmp_path / 'events.csv')
+    async with SafeCsvWriter(path, HEADERS, mode='w', atomic=True) as writer:
+        await writer.write_row({'writer': 0, 'seq': 0, 'text': 'x'})
+        await writer.flush()
+        assert not os.path.exists(path)
+    assert _rows(path) == [HEADERS, ['0', '0', 'x']]
+    with pytest.raises(RuntimeError):
+        async with SafeCsvWriter(path, HEADERS, atomic=True) as writer:
+            await writer.write_row({'writer': 0, 'seq': 1, 'text': 'y'})
+            raise RuntimeError('crash')
+    assert _rows(path) == [HEADERS, ['0', '0', 'x']]
+    async with SafeCsvWriter(path, HEADERS, atomic=True) as writer:
+        await writer.write_row({'writer': 0, 'seq': 1, 'text': 'y'})
+    assert _rows(path) == [HEADERS, ['0', '0', 'x'], ['0', '1', 'y']]
+    assert sorted(os.listdir(tmp_path)) == ['events.csv']
+
+
+@pytest.mark.asyncio
+async def test_compressed_members(tmp_path):
+    path = str(tmp_path / 'events.csv.gz')
+    await _write_many(path, 0, 20)
+    await _write_many(path, 1, 20)
+    records = [record async for record in csv_to_records(path)]
+    assert len(records) == 40 and len(_rows(path, gzip.open)) == 41
+
+
+@pytest.mark.asyncio
+async def test_closed_and_empty(tmp_path):
+    path = str(tmp_path / 'empty.csv')
+    writer = SafeCsvWriter(path, HEADERS)
+    with pytest.raises(ValueError):
+        await writer.write_row({'writer': 0})
+    await writer.open()
+    with pytest.raises(ValueError):
+        await writer.write_row({'other': 0})
+    await writer.aclose()
+    assert _rows(path) == [HEADERS] and writer.closed
@@ -0,0 +1,85 @@
+import gzip
+
+import pytest
+
+from aiocsv_utils import scan
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.scan import next_record_boundary, split_ranges, scan_records, scan_csv, csv_row_count
+
+
+def test_next_record_boundary():
+    with open('data/cities.csv', 'rb') as f:
+        assert next_record_boundary(f, 0) == 48
+    
+    
+def test_next_record_boundary_quoted_newline(tmp_path):
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'a,b\n1,"x\ny"\n2,z\n')
+    with open(path, 'rb') as f:
+        assert next_record_boundary(f, 4) == 12
+        assert next_record_boundary(f, 8, in_quotes=True) == 12
+    
+    
+def test_split_ranges():
+    header, ranges = split_ranges('data/cities.csv', 2048)
+    assert header == (0, 48)
+    assert ranges[0][0] == 48
+    assert ranges[-1][1] == 4620
+    assert all(stop == start for (_, stop), (start, _) in zip(ranges, ranges[1:]))
+    
+    
+def test_split_ranges_quoted_newline(tmp_path):
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'a,b\n1,"x\n\n\ny"\n2,z\n')
+    assert split_ranges(str(path), 1) == ((0, 4), [(4, 14), (14, 18)])
+    
+    
+def test_split_ranges_empty(tmp_path):
+    path = tmp_path / 'empty.csv'
+    path.write_bytes(b'')
+    assert split_ranges(str(path), 10) == ((0, 0), [])
+    
+    
+def test_scan_records():
+    with open('data/cities.csv', 'rb') as f:
+        assert scan_records(f, 48, every=50) == (128, [48, 1799, 3617])
+    
+    
+@pytest.mark.parametrize('vectorized', [True, False])
+def test_scan_records_blank_and_quoted_lines(tmp_path, monkeypatch, vectorized):
+    if not vectorized:
+        monkeypatch.setattr(scan, '_numpy', None)
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'a,b\n1,"x\n\ny"\n\n\r\n2,z')
+    with open(path, 'rb') as f:
+        assert scan_records(f, 4, every=1, block_size=3) == (2, [4, 16])
+        assert scan_records(f, 0, every=2, block_size=5) == (3, [0, 16])
+
+
+@pytest.mark.parametrize('vectorized', [True, False])
+def test_scan_records_unterminated_quote(tmp_path, monkeypatch, vectorized):
+    if not vectorized:
+        monkeypatch.setattr(scan, '_numpy', None)
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'a,b\r\n\r\n1,""\r\n2,"x\n')
+    with open(path, 'rb') as f:
+        assert scan_records(f, 0, every=1, block_size=4) == (3, [0, 7, 13])
+
+
+@pytest.mark.asyncio
+async def test_scan_csv():
+    assert await scan_csv('data/cities.csv', every=50) == (128, [48, 1799, 3617])
+    assert await scan_csv('data/cities.csv.gz') == (128, [])
+    with pytest.raises(ValueError):
+        await scan_csv('data/cities.csv.gz', every=50)
+
+
+@pytest.mark.asyncio
+async def test_csv_row_count(tmp_path):
+    path = tmp_path / 'quoted.csv.gz'
+    with gzip.open(path, 'wb') as f:
+        f.write(b'a,b\n1,"x\n\ny"\n\n2,"z ""q"""\n')
+    records = [record async for record in csv_to_records(str(path))]
+    assert await csv_row_count(str(path)) == len(records) == 2
+    assert await csv_row_count('data/cities.csv') == 128
+    assert await csv_row_count('data/cities_empty.csv') == 0
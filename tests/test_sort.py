@@ -0,0 +1,44 @@
+import csv
+import gzip
+import shutil
+
+import pytest
+
+from aiocsv_utils.read import csv_to_records
+from aiocsv_utils.sort import sort_csv
+
+
+def _rows(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.asyncio
+async def test_sort_csv(tmp_path):
+    output = str(tmp_path / 'sorted.csv')
+    assert await sort_csv('data/cities.csv', output, ['State', 'LatD'], run_size=500, merge_width=2, max_workers=2) == 128
+    header, *rows = _rows('data/cities.csv')
+    assert _rows(output) == [header] + sorted(rows, key=lambda row: (row[9], int(row[0])))
+
+
+@pytest.mark.asyncio
+async def test_sort_csv_reverse_numeric_keys(tmp_path):
+    output = str(tmp_path / 'sorted.csv')
+    await sort_csv('data/cities.csv', output, 'LonD', reverse=True, run_size=1000, max_workers=1)
+    keys = [row['LonD'] async for row in csv_to_records(output)]
+    assert keys == sorted(keys, reverse=True) and len(keys) == 128
+
+
+@pytest.mark.asyncio
+async def test_sort_csv_compressed(tmp_path):
+    output = str(tmp_path / 'sorted.csv.gz')
+    await sort_csv('data/cities.csv.gz', output, 'City', schema={'City': str}, run_size=700, max_workers=2)
+    header, *rows = _rows('data/cities.csv')
+    assert _rows(output, gzip.open) == [header] + sorted(rows, key=lambda row: row[8])
+
+
+@pytest.mark.asyncio
+async def test_sort_csv_empty(tmp_path):
+    output = str(tmp_path / 'sorted.csv')
+    assert await sort_csv('data/cities_empty.csv', output, 'City', max_workers=1) == 0
+    assert _rows(output) == _rows('data/cities_empty.csv')[:1]
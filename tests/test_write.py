@@ -1,8 +1,13 @@
+import asyncio
+
 import pytest
 from aiofiles.tempfile import NamedTemporaryFile
 
 from aiocsv_utils.write import create_csv
 from aiocsv_utils.write import write_csv_row, write_csv_rows
+from aiocsv_utils.write import CsvAppender
+from aiocsv_utils.write import serialize_records, write_csv_chunks
+from aiocsv_utils.read import csv_headers, csv_to_records, csv_to_records_chunks
 
 
 @pytest.mark.asyncio
@@ -58,4 +63,126 @@ async def test_write_csv_rows_to_headers():
         await write_csv_rows(tmp.name, records, headers)
         with open(tmp.name, 'r') as f:
             results = f.read()
-    assert results == "2,Jane,25,222-33-4444\n3,Mike,47,000-11-2222\n"
\ No newline at end of file
+    assert results == "2,Jane,25,222-33-4444\n3,Mike,47,000-11-2222\n"
+
+
+@pytest.mark.asyncio
+async def test_csv_appender_buffers_until_close():
+    headers = ['id', 'name', 'age', 'ssn']
+    async with NamedTemporaryFile('w') as tmp:
+        async with CsvAppender(tmp.name, headers) as appender:
+            await appender.write_row({'id': 2, 'name': 'Jane', 'age': 25, 'ssn': '222-33-4444'})
+            await appender.write_row({'id': 3, 'name': 'Mike', 'age': 47, 'ssn': '000-11-2222'})
+            assert appender.pending_rows == 2
+            with open(tmp.name, 'r') as f:
+                assert f.read() == ''
+        with open(tmp.name, 'r') as f:
+            results = f.read()
+    assert results == "2,Jane,25,222-33-4444\n3,Mike,47,000-11-2222\n"
+
+
+@pytest.mark.asyncio
+async def test_csv_appender_max_rows():
+    headers = ['id', 'name']
+    async with NamedTemporaryFile('w') as tmp:
+        async with CsvAppender(tmp.name, headers, max_rows=2) as appender:
+            await appender.write_rows([{'id': i, 'name': 'x'} for i in range(5)])
+            assert appender.pending_rows == 1
+            with open(tmp.name, 'r') as f:
+                assert f.read() == "0,x\n1,x\n2,x\n3,x\n"
+        with open(tmp.name, 'r') as f:
+            assert f.read().count('\n') == 5
+
+
+@pytest.mark.asyncio
+async def test_csv_appender_failed_write_keeps_rows(tmp_path):
+    path = str(tmp_path / 'rows.csv')
+    appender = CsvAppender(path, ['id', 'name'], mode='w')
+    await appender.open()
+    file = appender._file
+    write = file.write
+    calls = []
+
+    async def failing_write(data):
+        calls.append(data)
+        if len(calls) == 1:
+            raise OSError('disk full')
+        return await write(data)
+
+    file.write = failing_write
+    await appender.write_row({'id': 1, 'name': 'John'})
+    with pytest.raises(OSError):
+        await appender.flush()
+    assert appender.pending_rows == 1
+    await appender.write_row({'id': 2, 'name': 'Jane'})
+    await appender.aclose()
+    with open(path, 'r') as f:
+        assert f.read() == "id,name\n1,John\n2,Jane\n"
+
+
+@pytest.mark.asyncio
+async def test_csv_appender_aclose_closes_after_failed_flush(tmp_path):
+    appender = CsvAppender(str(tmp_path / 'rows.csv'), ['id'], mode='w')
+    await appender.open()
+    file = appender._file
+
+    async def failing_write(data):
+        raise OSError('disk full')
+
+    file.write = failing_write
+    await appender.write_row({'id': 1})
+    with pytest.raises(OSError):
+        await appender.aclose()
+    assert appender.closed and file.closed
+
+
+@pytest.mark.asyncio
+async def test_csv_appender_write_mode_writes_header(tmp_path):
+    path = str(tmp_path / 'rows.csv')
+    with open(path, 'w') as f:
+        f.write('old,file\n1,2\n')
+    async with CsvAppender(path, ['id', 'name'], mode='w') as appender:
+        assert appender.size == len('id,name\r\n')
+    assert await csv_headers(path) == ['id', 'name']
+    async with CsvAppender(path, ['id', 'name'], mode='w') as appender:
+        await appender.write_row({'id': 1, 'name': 'John'})
+    async with CsvAppender(path, ['id', 'name']) as appender:
+        await appender.write_row({'id': 2, 'name': 'Jane'})
+    assert [row async for row in csv_to_records(path)] == [{'id': 1, 'name': 'John'}, {'id': 2, 'name': 'Jane'}]
+
+
+@pytest.mark.asyncio
+async def test_csv_appender_max_delay():
+    headers = ['id', 'name']
+    async with NamedTemporaryFile('w') as tmp:
+        async with CsvAppender(tmp.name, headers, max_delay=0.01) as appender:
+            await appender.write_row({'id': 1, 'name': 'John'})
+            await asyncio.sleep(0.05)
+            assert appender.pending_rows == 0
+            with open(tmp.name, 'r') as f:
+                assert f.read() == "1,John\n"
+
+
+def test_serialize_records():
+    records = [{'id': 2, 'name': 'Jane'}, {'name': 'Mike', 'id': 3}]
+    assert serialize_records(records, ['id', 'name']) == "2,Jane\r\n3,Mike\r\n"
+
+
+@pytest.mark.asyncio
+async def test_write_csv_chunks():
+    chunks = [[{'id': 2, 'name': 'Jane'}], [], [{'id': 3, 'name': 'Mike'}, {'id': 4, 'name': 'Ann'}]]
+    async with NamedTemporaryFile('w') as tmp:
+        await write_csv_chunks(tmp.name, chunks, ['id', 'name'])
+        with open(tmp.name, 'r') as f:
+            results = f.read()
+    assert results == "2,Jane\n3,Mike\n4,Ann\n"
+
+
+@pytest.mark.asyncio
+async def test_write_csv_chunks_copy():
+    headers = await csv_headers('data/cities.csv')
+    async with NamedTemporaryFile('w') as tmp:
+        await create_csv(tmp.name, headers)
+        await write_csv_chunks(tmp.name, csv_to_records_chunks('data/cities.csv', 10), headers)
+        results = [row async for row in csv_to_records(tmp.name)]
+    assert results == [row async for row in csv_to_records('data/cities.csv')]
\ No newline at end of file